@@ -0,0 +1,4 @@
+"""
+benchmarks
+Micro- and macro-benchmarks for simulation hot paths. Run: python -m benchmarks
+"""
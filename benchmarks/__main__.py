@@ -0,0 +1,102 @@
+"""
+benchmarks/__main__.py
+Run the benchmark suite and compare against a JSON baseline.
+
+    python -m benchmarks                     # run + compare, exit 1 on regression
+                                             # or on a case missing from the baseline
+    python -m benchmarks --save-baseline     # record the current numbers
+    python -m benchmarks -k raycast -t 20    # filter cases, 20% threshold
+
+benchmarks/baseline.json is committed. Timings are machine-specific, so
+re-record it with --save-baseline on the machine that runs the gate.
+"""
+import argparse
+import json
+import os
+import sys
+
+# Headless SDL before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from benchmarks import cases  # noqa: E402,F401  (registers cases)
+from benchmarks.harness import (  # noqa: E402
+    all_cases,
+    find_regressions,
+    load_baseline,
+    run_case,
+    save_baseline,
+)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", "--filter", default="",
+                        help="only run cases whose name contains this string")
+    parser.add_argument("--group", choices=("micro", "macro"),
+                        help="only run one group of cases")
+    parser.add_argument("-t", "--threshold", type=float, default=10.0,
+                        help="allowed slowdown vs baseline in percent (default 10)")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timed repeats per case (default 5)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write results into the baseline instead of comparing")
+    parser.add_argument("--output", help="also write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+
+    selected = [
+        c for c in all_cases()
+        if args.filter in c.name and (args.group is None or c.group == args.group)
+    ]
+    if not args.save_baseline and not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; record one with --save-baseline",
+              file=sys.stderr)
+        return 2
+    baseline = load_baseline(args.baseline)
+
+    results = {}
+    print(f"{'case':<34}{'median us':>12}{'min us':>12}{'baseline':>12}{'delta':>9}")
+    for case in selected:
+        res = run_case(case, repeat=args.repeat)
+        results[case.name] = res
+        base = baseline.get(case.name)
+        if base:
+            delta = (res["median_us"] / base["median_us"] - 1.0) * 100.0
+            base_col, delta_col = f"{base['median_us']:.2f}", f"{delta:+.1f}%"
+        else:
+            base_col, delta_col = "-", "-"
+        print(f"{case.name:<34}{res['median_us']:>12.2f}{res['min_us']:>12.2f}"
+              f"{base_col:>12}{delta_col:>9}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        baseline.update(results)
+        save_baseline(args.baseline, baseline)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    status = 0
+    missing = [name for name in results if name not in baseline]
+    if missing:
+        print(f"\nNot in the baseline (re-record with --save-baseline): {', '.join(missing)}",
+              file=sys.stderr)
+        status = 1
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nREGRESSIONS (> {args.threshold:.1f}% slower than baseline):")
+        for name, base_us, cur_us, delta in regressions:
+            print(f"  {name}: {base_us:.2f} -> {cur_us:.2f} us ({delta:+.1f}%)")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+benchmarks/cases.py
+Hot-path benchmarks. Micro cases isolate one system; macro cases run the
+scripted full frame (simulation + render) at fixed enemy counts.
+
+Every setup seeds `random` so runs are comparable across machines/commits.
+"""
+import math
+import random
+
+import pygame
+
+from config.settings import WIDTH, HEIGHT
+from core.event_bus import EventBus
+from core.events import EnemyHit
+from core.game_manager import GameManager
+from core.modes.horde_mode import HordeMode
+from entities.bullet import EnemyBullet
+from entities.enemy import Enemy, EnemyType
+from entities.particle import Particle
+from entities.powerup import Powerup, PowerupType
+from systems.collision import check_collisions
+from systems.weapon_system import WeaponSystem, all_weapons
+from ui.renderer import render_frame
+
+from benchmarks.harness import bench
+
+SEED = 1234
+CENTER = (WIDTH // 2, HEIGHT // 2)
+
+_screen = None
+
+
+def _get_screen():
+    global _screen
+    if _screen is None:
+        pygame.display.init()
+        pygame.font.init()
+        _screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    return _screen
+
+
+def _scatter_enemies(n, types=None, wave=5):
+    """n enemies at random on-screen positions, away from the centre."""
+    types = types or list(EnemyType)
+    enemies = []
+    for i in range(n):
+        angle = random.uniform(0, 2 * math.pi)
+        dist = random.uniform(150, 380)
+        x = CENTER[0] + math.cos(angle) * dist
+        y = CENTER[1] + math.sin(angle) * dist
+        enemies.append(Enemy(x, y, wave, types[i % len(types)]))
+    return enemies
+
+
+def _horde_game(n_enemies):
+    """GameManager held at a constant enemy count by a non-recording HordeMode."""
+    _get_screen()
+    random.seed(SEED)
+    game = GameManager()
+    game.active_mode = HordeMode(
+        schedule=[(0, n_enemies), (10 ** 9, n_enemies)],
+        spawn_rate=n_enemies,
+        log_path=None,
+        record=False,
+    )
+    game.update()  # spawn the full horde
+    return game
+
+
+# ----------------------------------------------------------------------
+# Micro: Enemy.update per archetype
+# ----------------------------------------------------------------------
+
+def _register_enemy_update(enemy_type):
+    @bench(f"enemy_update[{enemy_type.value}]", number=200, ops_per_call=50)
+    def setup():
+        random.seed(SEED)
+        enemies = _scatter_enemies(50, [enemy_type])
+        clock = [0]
+
+        def run():
+            clock[0] += 1
+            frame = clock[0]
+            for enemy in enemies:
+                enemy.update(CENTER, enemies, frame)
+        return run
+
+
+for _type in EnemyType:
+    _register_enemy_update(_type)
+
+
+# ----------------------------------------------------------------------
+# Micro: WeaponSystem._raycast per weapon (one trigger pull)
+# ----------------------------------------------------------------------
+
+def _register_raycast(weapon):
+    @bench(f"raycast[{weapon.key}]", number=500)
+    def setup():
+        random.seed(SEED)
+        enemies = _scatter_enemies(200)
+        cone = 0.05 if weapon.charge_frames > 0 else 0.1
+        if weapon.spread_count > 1:
+            step = weapon.spread_angle / (weapon.spread_count - 1)
+            angles = [-weapon.spread_angle / 2 + step * i for i in range(weapon.spread_count)]
+        else:
+            angles = [0.0]
+        rays = [(math.cos(0.7 + a), math.sin(0.7 + a)) for a in angles]
+
+        def run():
+            for dx, dy in rays:
+                WeaponSystem._raycast(enemies, CENTER, dx, dy, cone=cone)
+        return run
+
+
+for _weapon in all_weapons():
+    _register_raycast(_weapon)
+
+
+# ----------------------------------------------------------------------
+# Micro: collisions, particles, event bus, GameManager.update, snapshots
+# ----------------------------------------------------------------------
+
+@bench("check_collisions[500]", number=200)
+def _collisions():
+    game = _horde_game(0)
+    game.enemies = _scatter_enemies(500)
+    game.enemy_bullets = [
+        EnemyBullet(random.uniform(0, WIDTH), random.uniform(0, 150), 0, 1)
+        for _ in range(100)
+    ]
+    game.powerups = [
+        Powerup(random.uniform(0, WIDTH), HEIGHT - 60, random.choice(list(PowerupType)))
+        for _ in range(10)
+    ]
+
+    def run():
+        check_collisions(game)
+    return run
+
+
+@bench("particles[burst+update]", number=300)
+def _particles():
+    game = _horde_game(0)
+
+    def run():
+        for _ in range(25):
+            game.particles.append(Particle(CENTER[0], CENTER[1], (255, 0, 0), velocity_range=6))
+        game._update_particles()
+    return run
+
+
+@bench("event_bus_emit[no_subscribers]", number=50, ops_per_call=1000)
+def _emit_unsubscribed():
+    bus = EventBus()
+
+    def run():
+        for _ in range(1000):
+            if EnemyHit in bus.active:
+                bus.emit(EnemyHit("rusher", 1.0, 2.0, 10, False))
+    return run
+
+
+@bench("event_bus_emit[3_subscribers]", number=50, ops_per_call=1000)
+def _emit_subscribed():
+    bus = EventBus()
+    for _ in range(2):
+        bus.subscribe(EnemyHit, lambda event: None)
+    bus.subscribe_batch(EnemyHit, lambda events: None)
+
+    def run():
+        for _ in range(1000):
+            if EnemyHit in bus.active:
+                bus.emit(EnemyHit("rusher", 1.0, 2.0, 10, False))
+        bus.flush()
+    return run
+
+
+@bench("game_manager_update[50]", number=200)
+def _game_update():
+    game = _horde_game(50)
+    return game.update
+
+
+@bench("snapshot_take[500]", number=200)
+def _snapshot_take():
+    game = _horde_game(500)
+    return game.snapshot
+
+
+@bench("snapshot_restore[500]", number=200)
+def _snapshot_restore():
+    game = _horde_game(500)
+    snap = game.snapshot()
+
+    def run():
+        game.restore_snapshot(snap)
+    return run
+
+
+# ----------------------------------------------------------------------
+# Macro: scripted full frames (update + render)
+# ----------------------------------------------------------------------
+
+def _register_full_frame(n_enemies, number, render_scale=1.0):
+    suffix = "" if render_scale == 1.0 else f"@{render_scale}"
+    @bench(f"full_frame[{n_enemies}]{suffix}", number=number, group="macro")
+    def setup():
+        game = _horde_game(n_enemies)
+        screen = _get_screen()
+
+        def run():
+            game.update()
+            render_frame(screen, game, CENTER, render_scale)
+        return run
+
+
+for _n, _number in ((50, 30), (500, 8), (5000, 2)):
+    _register_full_frame(_n, _number)
+for _scale in (0.75, 0.5):
+    _register_full_frame(500, 8, _scale)
@@ -0,0 +1,101 @@
+"""
+benchmarks/harness.py
+Tiny benchmark runner: registry, timing loop, JSON baselines and
+regression checks. Cases live in benchmarks/cases.py.
+"""
+import gc
+import json
+import os
+import statistics
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class Case:
+    name: str
+    setup: object        # () -> callable timed once per op
+    number: int          # calls per repeat
+    ops_per_call: int    # work items per call (result is reported per item)
+    group: str           # "micro" or "macro"
+
+
+_REGISTRY: list[Case] = []
+
+
+def bench(name: str, number: int = 100, ops_per_call: int = 1, group: str = "micro"):
+    """
+    Register a benchmark. The decorated function is a setup step that
+    builds fresh state and returns the zero-arg callable to time.
+    """
+    def decorator(setup):
+        _REGISTRY.append(Case(name, setup, number, ops_per_call, group))
+        return setup
+    return decorator
+
+
+def all_cases() -> list[Case]:
+    return list(_REGISTRY)
+
+
+def run_case(case: Case, repeat: int = 5) -> dict:
+    """
+    Time *case* over *repeat* runs with fresh setup each run.
+    Returns per-op microseconds: median, min and max across repeats.
+    """
+    samples = []
+    for _ in range(repeat):
+        fn = case.setup()
+        fn()  # warm-up (first-call caches, lazy imports)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(case.number):
+                fn()
+            elapsed = time.perf_counter() - start
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        samples.append(elapsed * 1e6 / (case.number * case.ops_per_call))
+
+    return {
+        "median_us": statistics.median(samples),
+        "min_us": min(samples),
+        "max_us": max(samples),
+        "group": case.group,
+    }
+
+
+# ----------------------------------------------------------------------
+# Baselines
+# ----------------------------------------------------------------------
+
+def load_baseline(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: str, results: dict):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+
+
+def find_regressions(results: dict, baseline: dict, threshold_pct: float) -> list[tuple]:
+    """
+    Compare median_us against the baseline.
+    Returns (name, baseline_us, current_us, delta_pct) for every case
+    slower than the baseline by more than *threshold_pct* percent.
+    """
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        delta_pct = (current["median_us"] / base["median_us"] - 1.0) * 100.0
+        if delta_pct > threshold_pct:
+            regressions.append((name, base["median_us"], current["median_us"], delta_pct))
+    return regressions
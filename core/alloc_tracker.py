@@ -0,0 +1,122 @@
+"""
+core/alloc_tracker.py
+Per-scope allocation accounting on top of tracemalloc, driven by the same
+named scopes as core/profiler.py.
+
+For each scope and frame it records:
+    retained_blocks  net memory blocks still alive when the scope exits
+                     (sys.getallocatedblocks delta — new particles, bullets...)
+    net_bytes        net traced bytes still alive when the scope exits
+    peak_bytes       transient high-water above the scope's starting footprint
+                     (temporary lists, tuples, Rects, Surface/Font objects)
+
+peak_bytes is the churn signal. Python exposes no count of allocations
+made, only of blocks alive, so a temporary that is created and freed
+inside the scope adds 0 to retained_blocks but shows in peak_bytes.
+
+Only the Python heap is traced: SDL pixel buffers behind a Surface are
+allocated by SDL and do not show up in the byte counts. Tracing is
+expensive; this is a diagnostic mode, never on by default.
+"""
+import sys
+import tracemalloc
+
+
+class _Open:
+    __slots__ = ("name", "start_bytes", "start_blocks", "peak_seen")
+
+    def __init__(self, name, start_bytes, start_blocks):
+        self.name = name
+        self.start_bytes = start_bytes
+        self.start_blocks = start_blocks
+        self.peak_seen = start_bytes
+
+
+class AllocTracker:
+    def __init__(self):
+        self._stack: list[_Open] = []
+        self._frame: dict[str, list] = {}    # scope -> [retained_blocks, net_bytes, peak_bytes]
+        self._totals: dict[str, list] = {}   # scope -> the same + [max_peak]
+        self.frames = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    # ------------------------------------------------------------------
+    # Scope hooks (called by profiler scopes)
+    # ------------------------------------------------------------------
+
+    def begin(self, name: str):
+        current, peak = tracemalloc.get_traced_memory()
+        # reset_peak() below would hide the high-water of enclosing scopes,
+        # so fold the peak so far into every open scope first
+        for open_scope in self._stack:
+            if peak > open_scope.peak_seen:
+                open_scope.peak_seen = peak
+        tracemalloc.reset_peak()
+        self._stack.append(_Open(name, current, sys.getallocatedblocks()))
+
+    def end(self):
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        scope = self._stack.pop()
+        for open_scope in self._stack:
+            if peak > open_scope.peak_seen:
+                open_scope.peak_seen = peak
+        peak = max(peak, scope.peak_seen)
+
+        entry = self._frame.get(scope.name)
+        if entry is None:
+            entry = self._frame[scope.name] = [0, 0, 0]
+        entry[0] += blocks - scope.start_blocks
+        entry[1] += current - scope.start_bytes
+        entry[2] = max(entry[2], peak - scope.start_bytes)
+
+    def end_frame(self):
+        """Fold this frame's per-scope numbers into the run totals."""
+        self.frames += 1
+        for name, (retained, net_bytes, peak_bytes) in self._frame.items():
+            total = self._totals.get(name)
+            if total is None:
+                total = self._totals[name] = [0, 0, 0, 0]
+            total[0] += retained
+            total[1] += net_bytes
+            total[2] += peak_bytes
+            if peak_bytes > total[3]:
+                total[3] = peak_bytes
+        self._frame = {}
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def report(self) -> dict:
+        """Per-scope averages per frame over the run, worst churn first."""
+        if self.frames == 0:
+            return {}
+        n = self.frames
+        rows = {
+            name: {
+                "retained_blocks_per_frame": round(retained / n, 2),
+                "net_bytes_per_frame": round(net / n, 1),
+                "peak_bytes_per_frame": round(peak / n, 1),
+                "max_peak_bytes": peak_max,
+            }
+            for name, (retained, net, peak, peak_max) in self._totals.items()
+        }
+        return dict(sorted(rows.items(), key=lambda kv: -kv[1]["peak_bytes_per_frame"]))
+
+    def avg_peak_kb(self) -> dict[str, float]:
+        """Average transient kB per frame per scope (for the overlay)."""
+        if self.frames == 0:
+            return {}
+        return {name: t[2] / self.frames / 1024.0 for name, t in self._totals.items()}
@@ -0,0 +1,246 @@
+"""
+core/audio.py
+Sound effects driven by the event bus, with a fixed voice pool per category.
+
+    audio = AudioSystem()             # opens the mixer, synthesises every sound once
+    audio.attach(game.event_bus)
+    ...
+    audio.close()
+
+Every sound in SOUNDS is built once at start-up (the game ships no sound
+files, so they are short synthesised tones and noise bursts) and kept as a
+decoded pygame Sound; nothing is decoded or allocated per trigger.
+
+Each category owns a fixed slice of mixer channels (CATEGORIES), so SMG
+fire can never take the channels a kill or a player hit needs. When every
+voice in a category is busy, a new sound steals the lowest-priority voice
+(oldest first) of no higher priority than itself, or is dropped.
+
+Handlers are batch subscribers, so they run once per bus flush (once per
+frame) with every event of that frame: repeated triggers of one sound in a
+frame — five shotgun pellets, a multi-kill — play it once, a little louder
+per extra trigger (COALESCE_GAIN), and count as coalesced.
+
+If the mixer cannot be opened (no audio device) the system stays disabled
+and every handler is a no-op; the SDL dummy driver works, so the counters
+can be checked headless.
+"""
+import math
+import random
+from array import array
+from dataclasses import dataclass
+
+import pygame
+
+from core.events import (
+    EnemyHit, EnemyKilled, PlayerDamaged, PowerupPicked, ShotFired, UpgradeApplied,
+)
+
+FREQUENCY = 22050
+BUFFER = 512
+ATTACK_MS = 2
+COALESCE_GAIN = 0.15             # extra volume per coalesced trigger
+MAX_GAIN = 1.6                   # ... up to this multiple of the sound's volume
+
+# category -> voices (mixer channels)
+CATEGORIES = {
+    "weapons": 4,
+    "impacts": 6,
+    "player": 3,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class SoundSpec:
+    category: str
+    priority: int        # a sound may steal voices of equal or lower priority
+    wave: str            # "square", "sine" or "noise"
+    freq: float          # start pitch, Hz (ignored for noise)
+    end_freq: float      # pitch at the end (a linear glide)
+    ms: int
+    volume: float
+
+
+SOUNDS = {
+    "shot":         SoundSpec("weapons", 1, "square", 420, 180, 70, 0.18),
+    "shot_smg":     SoundSpec("weapons", 0, "square", 560, 300, 45, 0.14),
+    "shot_shotgun": SoundSpec("weapons", 1, "noise", 0, 0, 140, 0.30),
+    "shot_railgun": SoundSpec("weapons", 2, "sine", 1400, 200, 350, 0.35),
+    "hit":          SoundSpec("impacts", 0, "noise", 0, 0, 50, 0.16),
+    "crit":         SoundSpec("impacts", 1, "square", 900, 600, 80, 0.18),
+    "kill":         SoundSpec("impacts", 2, "noise", 0, 0, 160, 0.30),
+    "hurt":         SoundSpec("player", 3, "square", 200, 90, 180, 0.35),
+    "pickup":       SoundSpec("player", 2, "sine", 500, 1100, 150, 0.30),
+    "upgrade":      SoundSpec("player", 2, "sine", 600, 1200, 250, 0.30),
+}
+
+# Weapon key -> firing sound ("shot" for the rest)
+WEAPON_SOUNDS = {
+    "smg": "shot_smg",
+    "shotgun": "shot_shotgun",
+    "railgun": "shot_railgun",
+}
+
+
+def synthesize(spec: SoundSpec, frequency: int, channels: int) -> bytes:
+    """Signed 16-bit samples for *spec*: the waveform under a short attack and a linear decay."""
+    n = max(1, spec.ms * frequency // 1000)
+    attack = max(1, ATTACK_MS * frequency // 1000)
+    # Rendered at MAX_GAIN x volume; channels play it back at gain / MAX_GAIN
+    peak = 32767 * min(1.0, spec.volume * MAX_GAIN)
+    noise = random.Random(n)     # private: the seeded sim RNG is never touched
+    samples = array("h")
+    phase = 0.0
+    for i in range(n):
+        envelope = min(1.0, i / attack) * (1.0 - i / n)
+        if spec.wave == "noise":
+            value = noise.uniform(-1.0, 1.0)
+        else:
+            phase += (spec.freq + (spec.end_freq - spec.freq) * i / n) / frequency
+            if spec.wave == "square":
+                value = 1.0 if phase % 1.0 < 0.5 else -1.0
+            else:
+                value = math.sin(2 * math.pi * phase)
+        sample = int(peak * envelope * value)
+        samples.extend((sample,) * channels)
+    return samples.tobytes()
+
+
+class AudioSystem:
+    def __init__(self):
+        self.enabled = False
+        self.error = None                # why the mixer could not be used
+        self.sounds: dict = {}           # name -> pygame.mixer.Sound
+        self._voices: dict = {}          # category -> [Channel, ...]
+        self._playing: dict = {}         # Channel -> (priority, play order)
+        self._order = 0
+        self._owns_mixer = False
+        # Counters
+        self.played = 0
+        self.stolen = 0                  # voices cut off for a higher-priority sound
+        self.coalesced = 0               # same-frame repeats folded into one play
+        self.dropped = 0                 # triggers with no voice to take
+        self._open()
+
+    def _open(self):
+        try:
+            if pygame.mixer.get_init() is None:
+                pygame.mixer.init(FREQUENCY, -16, 1, BUFFER)
+                self._owns_mixer = True
+            frequency, size, channels = pygame.mixer.get_init()
+        except pygame.error as e:
+            self.error = str(e)
+            return
+        if size != -16:
+            self.error = f"unsupported mixer sample format {size}"
+            return
+
+        pygame.mixer.set_num_channels(sum(CATEGORIES.values()))
+        first = 0
+        for category, voices in CATEGORIES.items():
+            self._voices[category] = [pygame.mixer.Channel(i) for i in range(first, first + voices)]
+            first += voices
+        for name, spec in SOUNDS.items():
+            self.sounds[name] = pygame.mixer.Sound(buffer=synthesize(spec, frequency, channels))
+        self.enabled = True
+
+    # ------------------------------------------------------------------
+    # Subscription
+    # ------------------------------------------------------------------
+
+    def attach(self, bus):
+        """Subscribe to the gameplay events that make a sound (nothing if disabled)."""
+        if not self.enabled:
+            return
+        bus.subscribe_batch(ShotFired, self.on_shots)
+        bus.subscribe_batch(EnemyHit, self.on_hits)
+        bus.subscribe_batch(EnemyKilled, self.on_kills)
+        bus.subscribe_batch(PlayerDamaged, self.on_player_damaged)
+        bus.subscribe_batch(PowerupPicked, self.on_pickups)
+        bus.subscribe_batch(UpgradeApplied, self.on_upgrades)
+
+    def on_shots(self, events):
+        self._trigger([WEAPON_SOUNDS.get(e.weapon, "shot") for e in events])
+
+    def on_hits(self, events):
+        self._trigger(["crit" if e.critical else "hit" for e in events])
+
+    def on_kills(self, events):
+        self._trigger(["kill"] * len(events))
+
+    def on_player_damaged(self, events):
+        self._trigger(["hurt"] * len(events))
+
+    def on_pickups(self, events):
+        self._trigger(["pickup"] * len(events))
+
+    def on_upgrades(self, events):
+        self._trigger(["upgrade"] * len(events))
+
+    # ------------------------------------------------------------------
+    # Playback
+    # ------------------------------------------------------------------
+
+    def play(self, name: str, gain: float = 1.0) -> bool:
+        """Start *name* on a free (or stolen) voice of its category; False if dropped."""
+        if not self.enabled:
+            return False
+        spec = SOUNDS[name]
+        channel = self._voice(spec)
+        if channel is None:
+            self.dropped += 1
+            return False
+        channel.play(self.sounds[name])
+        channel.set_volume(min(gain, MAX_GAIN) / MAX_GAIN)
+        self._order += 1
+        self._playing[channel] = (spec.priority, self._order)
+        self.played += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "played": self.played,
+            "stolen": self.stolen,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "busy": sum(ch.get_busy() for voices in self._voices.values() for ch in voices),
+        }
+
+    def close(self):
+        """Stop every voice; shut the mixer down if this system opened it."""
+        if self.enabled:
+            pygame.mixer.stop()
+        if self._owns_mixer:
+            pygame.mixer.quit()
+            self._owns_mixer = False
+        self.enabled = False
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _trigger(self, names):
+        """Play each distinct sound in *names* once, louder for every repeat."""
+        counts = {}
+        for name in names:
+            counts[name] = counts.get(name, 0) + 1
+        for name, count in counts.items():
+            self.coalesced += count - 1
+            self.play(name, 1.0 + COALESCE_GAIN * (count - 1))
+
+    def _voice(self, spec: SoundSpec):
+        """A free voice in *spec*'s category, else the one it may steal, else None."""
+        victim = None
+        for channel in self._voices[spec.category]:
+            if not channel.get_busy():
+                return channel
+            held = self._playing.get(channel, (0, 0))
+            if held[0] <= spec.priority and (victim is None or held < victim[0]):
+                victim = (held, channel)
+        if victim is None:
+            return None
+        channel = victim[1]
+        channel.stop()
+        self.stolen += 1
+        return channel
@@ -0,0 +1,85 @@
+"""
+core/autopilot.py
+Scripted input policies for headless runs (batch simulation, benchmarks).
+A policy is a callable (game, player=None) -> FrameInput (player defaults
+to player 0) and must not touch the global RNG, so a seeded run stays
+deterministic.
+"""
+import math
+
+from config.settings import STATE_UPGRADE
+from core.frame_input import FrameInput
+
+
+def _nearest_enemy(game, cx, cy):
+    best = None
+    best_d = float("inf")
+    for enemy in game.enemies:
+        ex, ey = enemy.get_center()
+        d = (ex - cx) ** 2 + (ey - cy) ** 2
+        if d < best_d:
+            best, best_d = enemy, d
+    return best, math.sqrt(best_d)
+
+
+def _fire_flags(player):
+    """(held, released) for the current weapon: railguns release at full charge."""
+    ws = player.weapon_system
+    if ws.current_weapon.charge_frames > 0 and ws.charge_held >= ws.current_weapon.charge_frames:
+        return False, True
+    return True, False
+
+
+def idle(game, player=None) -> FrameInput:
+    """Do nothing — measures how long the arena takes to kill a passive player."""
+    return FrameInput()
+
+
+def turret(game, player=None) -> FrameInput:
+    """Stand still, shoot the nearest enemy, reload on empty, take the first upgrade."""
+    player = player or game.players[0]
+    cx, cy = player.get_center()
+    target, _ = _nearest_enemy(game, cx, cy)
+    held, released = _fire_flags(player) if target else (False, False)
+    return FrameInput(
+        fire_held=held,
+        fire_released=released,
+        reload=player.current_ammo == 0,
+        upgrade_choice=0 if game.state == STATE_UPGRADE else -1,
+        mouse_pos=target.get_center() if target else (cx, cy),
+    )
+
+
+def kite(game, player=None) -> FrameInput:
+    """Keep 200-350 px from the nearest enemy while shooting it."""
+    player = player or game.players[0]
+    cx, cy = player.get_center()
+    target, dist = _nearest_enemy(game, cx, cy)
+    if target is None:
+        return turret(game, player)
+
+    ex, ey = target.get_center()
+    dx, dy = ex - cx, ey - cy
+    if dist < 200:          # too close: back off
+        dx, dy = -dx, -dy
+    elif dist <= 350:       # in band: circle
+        dx, dy = -dy, dx
+    held, released = _fire_flags(player)
+    return FrameInput(
+        up=dy < -1,
+        down=dy > 1,
+        left=dx < -1,
+        right=dx > 1,
+        fire_held=held,
+        fire_released=released,
+        reload=player.current_ammo == 0,
+        upgrade_choice=0 if game.state == STATE_UPGRADE else -1,
+        mouse_pos=(ex, ey),
+    )
+
+
+POLICIES = {
+    "idle": idle,
+    "turret": turret,
+    "kite": kite,
+}
@@ -0,0 +1,93 @@
+"""
+core/culling.py
+View-frustum culling against the arena viewport (0, 0, WIDTH, HEIGHT).
+
+The renderer filters each entity list once per frame through
+CullStats.visible() and draws only what overlaps the screen; enemies keep
+simulating off-screen (they spawn at -50 / WIDTH + 50). Cosmetic entities
+— particles and damage numbers — are retired by GameManager the frame
+they leave the screen, since nothing off-screen can ever be seen again
+before they expire (Particle.update() does the particle test inline, as
+it runs for every particle every frame).
+
+Each bounds test covers everything the entity draws around itself: the
+enemy health bar and role label, the support aura ring, powerup halos. A
+sniper aiming its laser is always drawn, since the beam crosses the screen
+from wherever it stands.
+"""
+from config.settings import WIDTH, HEIGHT
+from entities.enemy import EnemyType
+
+# Extents drawn beyond an entity's own body, in px
+ENEMY_LABEL_MARGIN = 22          # health bar + "SUP"/"AIM" label above
+AURA_MARGIN = 140                # support aura ring (radius 120 + pulse)
+HALO_SCALE = 1.5 * 1.15          # powerup halo at the peak of its pulse
+DAMAGE_GLYPH_W = 14              # widest glyph in the critical atlas (13 px)
+DAMAGE_NUMBER_H = 30
+
+CATEGORIES = ("enemies", "bullets", "powerups", "particles", "damage_numbers")
+
+
+def in_view(left, top, right, bottom) -> bool:
+    return right > 0 and left < WIDTH and bottom > 0 and top < HEIGHT
+
+
+def enemy_visible(enemy, auras: bool = True) -> bool:
+    if enemy.laser_target:
+        return True
+    if auras and enemy.type == EnemyType.SUPPORT:
+        margin = AURA_MARGIN
+    else:
+        margin = ENEMY_LABEL_MARGIN
+    x, y, size = enemy.x, enemy.y, enemy.size
+    return in_view(x - margin, y - margin, x + size + margin, y + size + margin)
+
+
+def bullet_visible(bullet) -> bool:
+    r = bullet.radius
+    return in_view(bullet.x - r, bullet.y - r, bullet.x + r, bullet.y + r)
+
+
+def powerup_visible(powerup) -> bool:
+    r = powerup.size * HALO_SCALE
+    return in_view(powerup.x - r, powerup.y - r, powerup.x + r, powerup.y + r)
+
+
+def particle_visible(particle) -> bool:
+    s = particle.size
+    return in_view(particle.x - s, particle.y - s, particle.x + s, particle.y + s)
+
+
+def damage_number_visible(dn) -> bool:
+    return in_view(dn.x, dn.y, dn.x + len(dn.text) * DAMAGE_GLYPH_W, dn.y + DAMAGE_NUMBER_H)
+
+
+class CullStats:
+    """
+    Per-category counts for the last frame: drawn, and culled (draws
+    skipped, or cosmetic entities retired). *totals* accumulates culled.
+    """
+
+    def __init__(self):
+        self.drawn = dict.fromkeys(CATEGORIES, 0)
+        self.culled = dict.fromkeys(CATEGORIES, 0)
+        self.totals = dict.fromkeys(CATEGORIES, 0)
+
+    def visible(self, category: str, items: list, test) -> list:
+        """The items passing *test*, counted as drawn; the rest as culled."""
+        shown = [item for item in items if test(item)]
+        culled = len(items) - len(shown)
+        self.drawn[category] = len(shown)
+        self.culled[category] = culled
+        self.totals[category] += culled
+        return shown
+
+    def drawn_all(self, category: str, items: list) -> list:
+        """Count *items* as drawn without testing (already culled upstream)."""
+        self.drawn[category] = len(items)
+        return items
+
+    def retired(self, category: str, count: int):
+        """*count* cosmetic entities left the screen this frame."""
+        self.culled[category] = count
+        self.totals[category] += count
@@ -1,46 +1,333 @@
 """
 core/data_loader.py
-Cached JSON loader for all game configuration data.
+Validated, immutable game configuration data.
 All modules should use this instead of hardcoding stats.
+
+Each data file is checked against its schema and compiled once into a
+read-only mapping of frozen dataclasses (EnemyStats, WeaponStats,
+PowerupDef, UpgradeDef), so callers can never mutate shared state. Compiled files are
+cached on disk under data/.cache/, keyed by the sha256 of the source file,
+so unchanged data skips parsing and validation on the next start.
+
+Dev mode: poll_changes() (call it every second or so) stats the source
+files, recompiles any whose mtime moved, swaps them in and calls every
+subscribe()d callback with the data kind ("enemies", "weapons",
+"powerups", "upgrades") — no restart needed. A file that fails validation is reported
+and the previous data stays live.
 """
+import hashlib
 import json
 import os
+import pickle
+import sys
+from dataclasses import MISSING, dataclass, fields, replace
+from types import MappingProxyType
+from typing import get_args, get_origin
 
-_cache: dict = {}
+from core.modifiers import Modifier
 
 _BASE = os.path.join(os.path.dirname(__file__), "..", "data")
+_CACHE_DIR = os.path.join(_BASE, ".cache")
+
+# Bump when a schema or the compiled representation changes
+COMPILER_VERSION = 2
+
+# Player stats an upgrade may modify (entities.player.BASE_STATS)
+UPGRADE_STATS = frozenset({
+    "damage", "damage_boost", "fire_rate", "reload_time", "max_ammo",
+    "crit_chance", "max_health", "speed", "lifesteal", "dash_unlocked",
+})
+
+
+class DataError(ValueError):
+    """A data file failed validation."""
+
+
+# ----------------------------------------------------------------------
+# Schemas
+# ----------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class EnemyStats:
+    size: int
+    base_speed: float
+    health: int
+    damage: int
+    color: tuple
+    score_value: int
+
+
+@dataclass(frozen=True, slots=True)
+class WeaponStats:
+    name: str
+    max_ammo: int
+    damage: int
+    fire_rate: int       # minimum frames between shots
+    reload_time: int     # milliseconds
+    spread_count: int
+    charge_frames: int
+    burst_count: int
+    burst_interval: int
+    spread_angle: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class PowerupDef:
+    display_name: str
+    symbol: str
+    color: tuple
+    drop_weight: float
+    effect: str
+
+
+@dataclass(frozen=True, slots=True)
+class UpgradeDef:
+    name: str
+    description: str
+    modifiers: tuple[Modifier, ...]
+    heal: bool = False       # restore full health when picked
+
+
+_SCHEMAS = {
+    "enemies": EnemyStats,
+    "weapons": WeaponStats,
+    "powerups": PowerupDef,
+    "upgrades": UpgradeDef,
+}
+
+
+def _check(where: str, ftype: type, value):
+    """Validate and normalise one field value against its annotation."""
+    if ftype is bool:
+        if not isinstance(value, bool):
+            raise DataError(f"{where}: expected true/false, got {value!r}")
+        return value
+    if ftype is int:
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise DataError(f"{where}: expected int, got {value!r}")
+        return value
+    if ftype is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise DataError(f"{where}: expected number, got {value!r}")
+        return float(value)
+    if ftype is str:
+        if not isinstance(value, str):
+            raise DataError(f"{where}: expected string, got {value!r}")
+        return value
+    if ftype is tuple:   # colours
+        if (not isinstance(value, (list, tuple)) or len(value) != 3
+                or not all(isinstance(c, int) and 0 <= c <= 255 for c in value)):
+            raise DataError(f"{where}: expected [r, g, b], got {value!r}")
+        return tuple(value)
+    if get_origin(ftype) is tuple:   # tuple[Schema, ...]: a list of nested entries
+        cls = get_args(ftype)[0]
+        if not isinstance(value, list):
+            raise DataError(f"{where}: expected a list, got {value!r}")
+        return tuple(_compile_entry(cls, f"{where}[{i}]", v) for i, v in enumerate(value))
+    raise DataError(f"{where}: unsupported field type {ftype}")
+
+
+def _compile_entry(cls, where: str, raw) -> object:
+    if not isinstance(raw, dict):
+        raise DataError(f"{where}: expected an object")
+    known = {f.name for f in fields(cls)}
+    unknown = set(raw) - known
+    if unknown:
+        raise DataError(f"{where}: unknown field(s) {sorted(unknown)}")
+    values = {}
+    for f in fields(cls):
+        if f.name in raw:
+            values[f.name] = _check(f"{where}.{f.name}", f.type, raw[f.name])
+        elif f.default is MISSING:
+            raise DataError(f"{where}: missing field {f.name!r}")
+    if cls is Modifier and values["stat"] not in UPGRADE_STATS:
+        raise DataError(f"{where}.stat: unknown stat {values['stat']!r}")
+    try:
+        return cls(**values)
+    except ValueError as e:   # the schema's own checks (e.g. Modifier.op)
+        raise DataError(f"{where}: {e}") from None
+
+
+def compile_data(kind: str, raw) -> dict:
+    """Validate parsed JSON for *kind* into {key: frozen dataclass}."""
+    cls = _SCHEMAS[kind]
+    if not isinstance(raw, dict):
+        raise DataError(f"{kind}.json: expected an object of entries")
+    return {key: _compile_entry(cls, f"{kind}.{key}", entry) for key, entry in raw.items()}
+
+
+# ----------------------------------------------------------------------
+# Loading, disk cache
+# ----------------------------------------------------------------------
+
+_cache: dict = {}          # kind -> MappingProxyType of compiled entries
+_mtimes: dict = {}         # kind -> source mtime_ns when loaded
+_subscribers: dict = {}    # kind -> [callback(kind)]
+
+
+def _source(kind: str) -> str:
+    return os.path.join(_BASE, kind + ".json")
+
+
+def _compile_file(kind: str) -> dict:
+    path = _source(kind)
+    with open(path, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(source).hexdigest()[:20]
+    cached = os.path.join(_CACHE_DIR, f"{kind}.v{COMPILER_VERSION}.{digest}.pickle")
+    try:
+        with open(cached, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError, ImportError):
+        pass   # missing or stale: recompile
+
+    try:
+        raw = json.loads(source)
+    except ValueError as e:
+        raise DataError(f"{kind}.json: {e}") from None
+    compiled = compile_data(kind, raw)
+
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        # Drop stale compilations of this file, then publish atomically
+        for name in os.listdir(_CACHE_DIR):
+            if name.startswith(kind + ".") and name.endswith(".pickle"):
+                os.remove(os.path.join(_CACHE_DIR, name))
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cached)
+    except OSError:
+        pass   # read-only install: just compile every start
+    return compiled
+
+
+def _load(kind: str) -> MappingProxyType:
+    data = _cache.get(kind)
+    if data is None:
+        mtime = os.stat(_source(kind)).st_mtime_ns
+        data = _cache[kind] = MappingProxyType(_compile_file(kind))
+        _mtimes[kind] = mtime
+    return data
+
+
+def reset():
+    """Forget compiled data and overrides; the next access reloads from disk."""
+    _cache.clear()
+    _mtimes.clear()
+
+
+def get_enemy_stats(type_name: str) -> EnemyStats:
+    """Return the stats for the given enemy type name (e.g. 'rusher')."""
+    return _load("enemies")[type_name]
+
+
+def get_weapon(name: str) -> WeaponStats:
+    """Return the stats for the given weapon name (e.g. 'rifle')."""
+    return _load("weapons")[name]
+
+
+def get_powerup(name: str) -> PowerupDef:
+    """Return the config for the given powerup name (e.g. 'health')."""
+    return _load("powerups")[name]
+
+
+def get_upgrade(key: str) -> UpgradeDef:
+    """Return the definition for the given upgrade key (e.g. 'damage_surge')."""
+    return _load("upgrades")[key]
+
+
+def get_all_enemies() -> MappingProxyType:
+    return _load("enemies")
+
+
+def get_all_weapons() -> MappingProxyType:
+    return _load("weapons")
+
+
+def get_all_powerups() -> MappingProxyType:
+    return _load("powerups")
 
 
-def _load(filename: str) -> dict:
-    if filename not in _cache:
-        path = os.path.join(_BASE, filename)
-        with open(path, "r", encoding="utf-8") as f:
-            _cache[filename] = json.load(f)
-    return _cache[filename]
+def get_all_upgrades() -> MappingProxyType:
+    return _load("upgrades")
 
 
-def get_enemy_stats(type_name: str) -> dict:
-    """Return the stat dict for the given enemy type name (e.g. 'rusher')."""
-    return _load("enemies.json")[type_name]
+# ----------------------------------------------------------------------
+# Hot reload (dev mode)
+# ----------------------------------------------------------------------
 
+def subscribe(kind: str, callback):
+    """Call *callback(kind)* after *kind*'s data is hot-swapped."""
+    if kind not in _SCHEMAS:
+        raise KeyError(f"unknown data kind {kind!r}; expected one of {sorted(_SCHEMAS)}")
+    _subscribers.setdefault(kind, []).append(callback)
 
-def get_weapon(name: str) -> dict:
-    """Return the stat dict for the given weapon name (e.g. 'rifle')."""
-    return _load("weapons.json")[name]
 
+def unsubscribe(kind: str, callback):
+    handlers = _subscribers.get(kind, [])
+    if callback in handlers:
+        handlers.remove(callback)
 
-def get_powerup(name: str) -> dict:
-    """Return the config dict for the given powerup name (e.g. 'health')."""
-    return _load("powerups.json")[name]
 
+def poll_changes() -> list:
+    """
+    Recompile loaded files whose mtime changed and notify subscribers.
+    Returns the kinds that were swapped. One stat() per loaded file.
+    """
+    swapped = []
+    for kind in list(_cache):
+        try:
+            mtime = os.stat(_source(kind)).st_mtime_ns
+        except OSError:
+            continue
+        if mtime == _mtimes.get(kind):
+            continue
+        _mtimes[kind] = mtime   # don't retry a broken file every poll
+        try:
+            compiled = _compile_file(kind)
+        except (DataError, OSError) as e:
+            print(f"data reload failed, keeping previous {kind}: {e}", file=sys.stderr)
+            continue
+        _cache[kind] = MappingProxyType(compiled)
+        swapped.append(kind)
+        for callback in list(_subscribers.get(kind, ())):
+            callback(kind)
+    return swapped
 
-def get_all_enemies() -> dict:
-    return _load("enemies.json")
 
+# ----------------------------------------------------------------------
+# Overrides (batch simulation / balance sweeps)
+# ----------------------------------------------------------------------
 
-def get_all_weapons() -> dict:
-    return _load("weapons.json")
+def apply_overrides(overrides: dict):
+    """
+    Replace compiled entries from dotted keys, e.g.
+    {"weapons.rifle.damage": 30, "enemies.tank.health": 400}.
+    The first segment names the data file (weapons -> weapons.json).
+    Values are validated like file data. Process-local: meant for
+    headless sim workers, not the live game; reset() undoes them.
+    """
+    for dotted, value in overrides.items():
+        kind, *path, leaf = dotted.split(".")
+        if len(path) != 1:
+            raise KeyError(f"override {dotted!r} must be <file>.<entry>.<field>")
+        if kind not in _SCHEMAS:
+            raise KeyError(f"override {dotted!r}: unknown data file {kind!r}")
+        data = dict(_load(kind))
+        entry = data[path[0]]
+        field = next((f for f in fields(entry) if f.name == leaf), None)
+        if field is None:
+            raise KeyError(f"override {dotted!r}: unknown field {leaf!r}")
+        data[path[0]] = replace(entry, **{leaf: _check(dotted, field.type, value)})
+        _cache[kind] = MappingProxyType(data)
 
 
-def get_all_powerups() -> dict:
-    return _load("powerups.json")
+def data_fingerprint() -> str:
+    """sha256 over the on-disk data files that drive the simulation."""
+    h = hashlib.sha256()
+    for filename in ("enemies.json", "powerups.json", "upgrades.json", "weapons.json"):
+        with open(os.path.join(_BASE, filename), "rb") as f:
+            h.update(filename.encode())
+            h.update(f.read())
+    return h.hexdigest()
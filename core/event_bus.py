@@ -1,21 +1,106 @@
 """
 core/event_bus.py
-Simple publish/subscribe event bus.
+Deferred publish/subscribe event bus.
 Allows decoupled communication between systems.
-Subscribe events can be used later for UI animations, analytics, multiplayer sync.
+
+Events are typed records (core/events.py) keyed by their class. emit()
+only queues; GameManager.update() calls flush() once per frame at a fixed
+point, after every system has run, so handlers never execute in the middle
+of gameplay loops.
+
+    subscribe(EnemyKilled, fn)         fn(event) for every event
+    subscribe_batch(EnemyHit, fn)      fn([events...]) once per flush
+
+Unsubscribed types are dropped on emit with a single dict lookup; hot
+paths can skip building the record entirely by checking `type in bus.active`.
 """
-from collections import defaultdict
+import time
 
 
 class EventBus:
     def __init__(self):
-        self._handlers: dict[str, list] = defaultdict(list)
+        self._handlers: dict[type, list] = {}   # event type -> per-event handlers
+        self._batch: dict[type, list] = {}      # event type -> batch handlers
+        self._queues: dict[type, list] = {}     # only subscribed types have a queue
+        self.active: set[type] = set()          # event types with at least one handler
+        # handler -> [calls, events, total_ms, max_ms]
+        self.handler_stats: dict = {}
+
+    # ------------------------------------------------------------------
+    # Subscription
+    # ------------------------------------------------------------------
+
+    def subscribe(self, event_type: type, fn):
+        """Register fn(event), called for each queued event of event_type."""
+        self._handlers.setdefault(event_type, []).append(fn)
+        self._activate(event_type)
+
+    def subscribe_batch(self, event_type: type, fn):
+        """Register fn(events), called once per flush with all events of event_type."""
+        self._batch.setdefault(event_type, []).append(fn)
+        self._activate(event_type)
+
+    def unsubscribe(self, event_type: type, fn):
+        for table in (self._handlers, self._batch):
+            handlers = table.get(event_type)
+            if handlers and fn in handlers:
+                handlers.remove(fn)
+                if not handlers:
+                    del table[event_type]
+        if event_type not in self._handlers and event_type not in self._batch:
+            self.active.discard(event_type)
+            self._queues.pop(event_type, None)
+
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
+    def emit(self, event):
+        """Queue *event* for the next flush (dropped if nobody listens)."""
+        queue = self._queues.get(type(event))
+        if queue is not None:
+            queue.append(event)
+
+    def flush(self):
+        """Deliver every queued event. Events emitted by handlers wait for the next flush."""
+        for event_type, queue in list(self._queues.items()):
+            if not queue:
+                continue
+            # Swap in a fresh queue so handlers can emit into the next frame
+            self._queues[event_type] = []
+            events = queue
+
+            for fn in self._handlers.get(event_type, ()):
+                start = time.perf_counter()
+                for event in events:
+                    fn(event)
+                self._record(fn, len(events), start)
+
+            for fn in self._batch.get(event_type, ()):
+                start = time.perf_counter()
+                fn(events)
+                self._record(fn, len(events), start)
+
+    def clear(self):
+        """Drop queued events without delivering them."""
+        for queue in self._queues.values():
+            queue.clear()
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
 
-    def subscribe(self, event_name: str, fn):
-        """Register a handler for the given event."""
-        self._handlers[event_name].append(fn)
+    def _activate(self, event_type: type):
+        self.active.add(event_type)
+        self._queues.setdefault(event_type, [])
 
-    def emit(self, event_name: str, **kwargs):
-        """Fire all handlers registered for event_name."""
-        for fn in self._handlers[event_name]:
-            fn(**kwargs)
+    def _record(self, fn, n_events: int, start: float):
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        stats = self.handler_stats.get(fn)
+        if stats is None:
+            stats = self.handler_stats[fn] = [0, 0, 0.0, 0.0]
+        stats[0] += 1
+        stats[1] += n_events
+        stats[2] += elapsed_ms
+        if elapsed_ms > stats[3]:
+            stats[3] = elapsed_ms
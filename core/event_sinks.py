@@ -0,0 +1,168 @@
+"""
+core/event_sinks.py
+Off-thread event sinks for slow subscribers (analytics, combat logs,
+telemetry). The game thread only appends to a bounded deque; a background
+worker drains it in batches and does the expensive part (encoding, I/O).
+
+    sink = JsonlFileSink("combat_log.jsonl")
+    sink.attach(game.event_bus, EnemyHit, EnemyKilled, PlayerDamaged)
+    ...
+    sink.close()   # drains what is left, joins the worker
+
+Overflow policy when the queue is full:
+    "drop_newest"  reject incoming events (default — never stalls the frame)
+    "drop_oldest"  evict the oldest queued events
+    "block"        wait up to block_timeout for space, then drop (backpressure)
+"""
+import json
+import threading
+import time
+from collections import deque
+
+from core.events import event_to_dict
+
+POLICIES = ("drop_newest", "drop_oldest", "block")
+
+
+class AsyncSink:
+    """
+    Bounded producer/consumer queue feeding *write_batch(events)* on a
+    daemon worker thread. deque append/popleft are atomic under the GIL, so
+    the producer side takes no lock.
+    """
+
+    def __init__(self, write_batch, maxsize: int = 8192, policy: str = "drop_newest",
+                 batch_size: int = 256, flush_interval: float = 0.25,
+                 block_timeout: float = 0.005, name: str = "event-sink"):
+        if policy not in POLICIES:
+            raise ValueError(f"unknown overflow policy {policy!r}; expected one of {POLICIES}")
+        self._write_batch = write_batch
+        self.maxsize = maxsize
+        self.policy = policy
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+
+        self._queue = deque(maxlen=maxsize if policy == "drop_oldest" else None)
+        self._wake = threading.Event()
+        self._closing = False
+
+        # Counters (producer-side counts are only written by the game thread)
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.errors = 0
+
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    # ------------------------------------------------------------------
+    # Producer side (game thread)
+    # ------------------------------------------------------------------
+
+    def attach(self, bus, *event_types):
+        """Subscribe this sink to *event_types* as a batch handler on *bus*."""
+        for event_type in event_types:
+            bus.subscribe_batch(event_type, self.push_many)
+
+    def push(self, event):
+        self.push_many((event,))
+
+    def push_many(self, events):
+        """Enqueue *events*; the only cost the game thread ever pays."""
+        queue = self._queue
+        n = len(events)
+        space = self.maxsize - len(queue)
+
+        if n > space:
+            if self.policy == "drop_newest":
+                self.dropped += n - max(space, 0)
+                events = events[:max(space, 0)]
+            elif self.policy == "drop_oldest":
+                # deque(maxlen) evicts from the left on extend
+                self.dropped += min(n - space, self.maxsize)
+            else:
+                self._wait_for_space(n)
+                space = self.maxsize - len(queue)
+                if n > space:
+                    self.dropped += n - max(space, 0)
+                    events = events[:max(space, 0)]
+
+        queue.extend(events)
+        self.enqueued += len(events)
+        if len(queue) >= self.batch_size:
+            self._wake.set()
+
+    def wake(self):
+        """Drain now rather than at the next flush interval."""
+        self._wake.set()
+
+    def close(self, timeout: float = 2.0):
+        """Stop accepting work, drain the queue and join the worker."""
+        self._closing = True
+        self._wake.set()
+        self._worker.join(timeout)
+
+    def stats(self) -> dict:
+        return {
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "written": self.written,
+            "batches": self.batches,
+            "errors": self.errors,
+            "queued": len(self._queue),
+        }
+
+    # ------------------------------------------------------------------
+    # Consumer side (worker thread)
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        queue = self._queue
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            closing = self._closing
+            while queue:
+                batch = []
+                try:
+                    for _ in range(self.batch_size):
+                        batch.append(queue.popleft())
+                except IndexError:
+                    pass
+                try:
+                    self._write_batch(batch)
+                    self.written += len(batch)
+                    self.batches += 1
+                except Exception:  # a broken sink must never take the game down
+                    self.errors += 1
+            if closing:
+                self._on_close()
+                return
+
+    def _wait_for_space(self, n: int):
+        deadline = time.perf_counter() + self.block_timeout
+        while self.maxsize - len(self._queue) < n and time.perf_counter() < deadline:
+            self._wake.set()
+            time.sleep(0)
+
+    def _on_close(self):
+        """Hook for subclasses to release resources on the worker thread."""
+        pass
+
+
+class JsonlFileSink(AsyncSink):
+    """Appends one JSON object per event to *path*, one write() per batch."""
+
+    def __init__(self, path: str, **kwargs):
+        self._file = open(path, "a", encoding="utf-8")
+        kwargs.setdefault("name", f"jsonl-sink:{path}")
+        super().__init__(self._write, **kwargs)
+
+    def _write(self, events):
+        self._file.write("".join(json.dumps(event_to_dict(e)) + "\n" for e in events))
+        self._file.flush()
+
+    def _on_close(self):
+        self._file.close()
@@ -0,0 +1,67 @@
+"""
+core/events.py
+Typed gameplay event records published through core/event_bus.py.
+Records are frozen + slotted: cheap to build, safe to hand to many handlers.
+
+Hot paths guard construction so unsubscribed events cost one set lookup:
+    bus = game.event_bus
+    if EnemyHit in bus.active:
+        bus.emit(EnemyHit(...))
+"""
+from dataclasses import asdict, dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class UpgradeApplied:
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class EnemySpawned:
+    enemy_type: str
+    x: float
+    y: float
+
+
+@dataclass(frozen=True, slots=True)
+class ShotFired:
+    player_id: int
+    weapon: str          # weapons.json key
+
+
+@dataclass(frozen=True, slots=True)
+class EnemyHit:
+    enemy_type: str
+    x: float
+    y: float
+    damage: int
+    critical: bool
+
+
+@dataclass(frozen=True, slots=True)
+class EnemyKilled:
+    enemy_type: str
+    x: float
+    y: float
+    score: int
+    combo: int
+
+
+@dataclass(frozen=True, slots=True)
+class PowerupPicked:
+    powerup_type: str
+    x: float
+    y: float
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerDamaged:
+    player_id: int
+    amount: int
+
+
+def event_to_dict(event) -> dict:
+    """Plain-dict form of a record (type name under "event"), for logs/sinks."""
+    data = asdict(event)
+    data["event"] = type(event).__name__
+    return data
@@ -0,0 +1,52 @@
+"""
+core/frame_input.py
+One frame of player input, sampled once in main.py and fed to
+GameManager.step(). Everything the simulation reads from the player goes
+through here, so a run can be recorded and replayed frame-for-frame.
+"""
+from dataclasses import dataclass
+
+import pygame
+
+from config.settings import WIDTH, HEIGHT
+
+
+@dataclass(frozen=True, slots=True)
+class FrameInput:
+    up: bool = False
+    down: bool = False
+    left: bool = False
+    right: bool = False
+    fire_held: bool = False       # LMB held this frame (continuous fire / charge)
+    fire_released: bool = False   # LMB released this frame (railgun fires)
+    reload: bool = False          # R pressed
+    restart: bool = False         # SPACE pressed
+    upgrade_choice: int = -1      # 0-2 when [1]/[2]/[3] pressed, else -1
+    mouse_pos: tuple = (WIDTH // 2, HEIGHT // 2)
+
+    def key_state(self) -> dict:
+        """Key lookup compatible with Player.update (pygame key codes)."""
+        return {
+            pygame.K_w: self.up,
+            pygame.K_s: self.down,
+            pygame.K_a: self.left,
+            pygame.K_d: self.right,
+        }
+
+    @staticmethod
+    def sample(fire_held=False, fire_released=False, reload=False, restart=False,
+               upgrade_choice=-1) -> "FrameInput":
+        """Read held keys + mouse position now; edge events come from the event loop."""
+        keys = pygame.key.get_pressed()
+        return FrameInput(
+            up=bool(keys[pygame.K_w]),
+            down=bool(keys[pygame.K_s]),
+            left=bool(keys[pygame.K_a]),
+            right=bool(keys[pygame.K_d]),
+            fire_held=fire_held,
+            fire_released=fire_released,
+            reload=reload,
+            restart=restart,
+            upgrade_choice=upgrade_choice,
+            mouse_pos=pygame.mouse.get_pos(),
+        )
@@ -0,0 +1,106 @@
+"""
+core/frame_pacer.py
+Frame pacing for the main loop, plus input-to-present latency.
+
+    pacer = FramePacer(FPS, mode="late", busy=True)
+    while running:
+        pacer.wait()
+        ...events...
+        inp = FrameInput.sample(...); pacer.sampled()
+        ...step, render, flip...
+        latency_ms = pacer.presented()    # pacer.busy_ms: wake -> present
+
+Modes:
+    tick    clock.tick(fps) at the top of the frame (the classic loop);
+            busy=True uses clock.tick_busy_loop for sub-ms accuracy
+    late    present on a fixed grid of deadlines and sleep until just
+            before the next one, leaving only the estimated frame work
+            (sampling -> present) plus a safety margin. Input is sampled
+            as late as possible, so it reaches the screen sooner; with
+            busy=True the last SPIN_MS are spun instead of slept through
+            (sleep() can overshoot by a millisecond or more)
+
+The work estimate rises at once on a slow frame and decays slowly, so one
+hitch doesn't make the next frames miss their deadline. A missed deadline
+resyncs the grid instead of trying to catch up.
+"""
+import time
+
+import pygame
+
+PACING_MODES = ("tick", "late")
+
+# Wake this long before (estimated work + deadline) in "late" mode
+MARGIN_MS = 1.0
+# Spin (rather than sleep) through the last part of the wait when busy
+SPIN_MS = 2.0
+# How fast the work estimate falls back after a slow frame
+WORK_DECAY = 0.05
+
+
+class FramePacer:
+    def __init__(self, fps: int, mode: str = "tick", busy: bool = False,
+                 margin_ms: float = MARGIN_MS):
+        if mode not in PACING_MODES:
+            raise ValueError(f"pacing mode {mode!r}; expected one of {PACING_MODES}")
+        self.fps = fps
+        self.mode = mode
+        self.busy = busy
+        self.margin_ms = margin_ms
+        self.period = 1.0 / fps if fps > 0 else 0.0
+        self.clock = pygame.time.Clock()
+        self.work_ms = 0.0               # estimated sample -> present time
+        self.busy_ms = 0.0               # last frame's wake -> present time
+        self.missed = 0                  # "late" deadlines missed (grid resynced)
+        self._next_present: float | None = None
+        self._sampled_at: float | None = None
+        self._woke_at = time.perf_counter()
+
+    # ------------------------------------------------------------------
+    # Per-frame calls
+    # ------------------------------------------------------------------
+
+    def wait(self):
+        """Block until it is time to read input for the next frame."""
+        if self.mode == "tick" or not self.period:
+            if self.busy:
+                self.clock.tick_busy_loop(self.fps)
+            else:
+                self.clock.tick(self.fps)
+        elif self._next_present is not None:   # first frame: start the grid at its present
+            wake = self._next_present - (self.work_ms + self.margin_ms) / 1000.0
+            sleep_until = wake - SPIN_MS / 1000.0 if self.busy else wake
+            remaining = sleep_until - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            while time.perf_counter() < wake:
+                pass
+        self._woke_at = time.perf_counter()
+
+    def sampled(self):
+        """Input for this frame has just been read."""
+        self._sampled_at = time.perf_counter()
+
+    def presented(self) -> float | None:
+        """
+        The frame has just been flipped. Returns its input-to-present
+        latency in ms (None when no input was sampled this frame).
+        """
+        now = time.perf_counter()
+        self.busy_ms = (now - self._woke_at) * 1000.0
+        latency_ms = None
+        if self._sampled_at is not None:
+            latency_ms = (now - self._sampled_at) * 1000.0
+            if latency_ms > self.work_ms:
+                self.work_ms = latency_ms
+            else:
+                self.work_ms += (latency_ms - self.work_ms) * WORK_DECAY
+            self._sampled_at = None
+        if self.mode == "late" and self.period:
+            if self._next_present is None:
+                self._next_present = now
+            self._next_present += self.period
+            if self._next_present < now:
+                self.missed += 1
+                self._next_present = now + self.period
+        return latency_ms
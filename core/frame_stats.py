@@ -0,0 +1,175 @@
+"""
+core/frame_stats.py
+Frame-time distribution tracking: a ring buffer of every frame's duration,
+p50/p95/p99/max over sliding windows, over-budget frame counts and GC pause
+attribution via gc.callbacks. Input-to-present latency (core.frame_pacer)
+is kept in a second ring alongside.
+
+A frame counts as over budget only past OVER_BUDGET_SLACK x the budget:
+paced frames (especially --pacing late, which aims each present right at
+the deadline) land on either side of the budget itself, so only a frame
+long enough to have missed its present slot is a real overrun.
+"""
+import gc
+import time
+from array import array
+
+from config.settings import FPS
+
+# Sliding windows reported by summary(), in frames
+WINDOWS = {"1s": FPS, "10s": FPS * 10}
+
+OVER_BUDGET_SLACK = 1.5
+
+
+class FrameStats:
+    """
+    Call tick() once per frame (after present). The time since the previous
+    tick is recorded as that frame's duration.
+
+    GC pauses are timed per generation while attached; a pause is charged
+    to the frame it happened in, so hitches can be split into "GC" and
+    "not GC".
+    """
+
+    def __init__(self, capacity: int = 1 << 15, budget_ms: float = 1000.0 / FPS):
+        self.capacity = capacity
+        self.budget_ms = budget_ms
+        self.over_budget_ms = budget_ms * OVER_BUDGET_SLACK
+        self._buf = array("d", bytes(8 * capacity))
+        self._latency = array("d", bytes(8 * capacity))
+        self._gc_start = 0.0
+        self._attached = False
+        self.reset()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def reset(self):
+        """Start a new run (buffer contents are simply overwritten)."""
+        self._index = 0
+        self.frames = 0
+        self._latency_index = 0
+        self.latency_frames = 0
+        self.max_ms = 0.0
+        self.over_budget = 0
+        self.over_budget_with_gc = 0
+        self._last_tick: float | None = None
+        self._frame_gc_ms = 0.0
+        # generation -> [pauses, total_ms, max_ms]
+        self.gc_pauses = {0: [0, 0.0, 0.0], 1: [0, 0.0, 0.0], 2: [0, 0.0, 0.0]}
+
+    def attach_gc(self):
+        """Start timing collector pauses (idempotent)."""
+        if not self._attached:
+            gc.callbacks.append(self._on_gc)
+            self._attached = True
+
+    def detach_gc(self):
+        if self._attached:
+            gc.callbacks.remove(self._on_gc)
+            self._attached = False
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def tick(self):
+        """Close the current frame; its duration is the time since the last tick."""
+        now = time.perf_counter()
+        if self._last_tick is not None:
+            self.record((now - self._last_tick) * 1000.0)
+        self._last_tick = now
+
+    def record(self, frame_ms: float):
+        self._buf[self._index] = frame_ms
+        self._index = (self._index + 1) % self.capacity
+        self.frames += 1
+        if frame_ms > self.max_ms:
+            self.max_ms = frame_ms
+        if frame_ms > self.over_budget_ms:
+            self.over_budget += 1
+            if self._frame_gc_ms > 0.0:
+                self.over_budget_with_gc += 1
+        self._frame_gc_ms = 0.0
+
+    def record_latency(self, latency_ms: float):
+        """Input-to-present time of the frame just presented."""
+        self._latency[self._latency_index] = latency_ms
+        self._latency_index = (self._latency_index + 1) % self.capacity
+        self.latency_frames += 1
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+            return
+        pause_ms = (time.perf_counter() - self._gc_start) * 1000.0
+        entry = self.gc_pauses.setdefault(info["generation"], [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += pause_ms
+        if pause_ms > entry[2]:
+            entry[2] = pause_ms
+        self._frame_gc_ms += pause_ms
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def recent(self, n: int | None = None) -> list[float]:
+        """The last *n* frame durations (all buffered frames if None), oldest first."""
+        return self._tail(self._buf, self._index, self.frames, n)
+
+    def recent_latency(self, n: int | None = None) -> list[float]:
+        """The last *n* input-to-present latencies, oldest first."""
+        return self._tail(self._latency, self._latency_index, self.latency_frames, n)
+
+    def _tail(self, buf, index: int, count: int, n: int | None) -> list[float]:
+        stored = min(count, self.capacity)
+        n = stored if n is None else min(n, stored)
+        start = (index - n) % self.capacity
+        if start + n <= self.capacity:
+            return buf[start:start + n].tolist()
+        return (buf[start:] + buf[:index]).tolist()
+
+    def percentiles(self, n: int | None = None) -> dict:
+        """p50/p95/p99/max (ms) over the last *n* frames (nearest-rank)."""
+        return self._percentiles(self.recent(n))
+
+    def latency_percentiles(self, n: int | None = None) -> dict:
+        """p50/p95/p99/max input-to-present latency (ms) over the last *n* frames."""
+        return self._percentiles(self.recent_latency(n))
+
+    @staticmethod
+    def _percentiles(samples: list) -> dict:
+        samples = sorted(samples)
+        if not samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        last = len(samples) - 1
+        return {
+            "p50": samples[int(last * 0.50)],
+            "p95": samples[int(last * 0.95)],
+            "p99": samples[int(last * 0.99)],
+            "max": samples[last],
+        }
+
+    def summary(self) -> dict:
+        """Run summary: whole-run + sliding-window percentiles, budget and GC counts."""
+        return {
+            "frames": self.frames,
+            "budget_ms": round(self.budget_ms, 3),
+            "over_budget_ms": round(self.over_budget_ms, 3),
+            "over_budget": self.over_budget,
+            "over_budget_with_gc": self.over_budget_with_gc,
+            "run": {k: round(v, 3) for k, v in self.percentiles().items()},
+            "windows": {
+                name: {k: round(v, 3) for k, v in self.percentiles(n).items()}
+                for name, n in WINDOWS.items()
+            },
+            "max_ms": round(self.max_ms, 3),
+            "input_latency": {k: round(v, 3) for k, v in self.latency_percentiles().items()},
+            "gc": {
+                str(gen): {"pauses": c, "total_ms": round(t, 3), "max_ms": round(m, 3)}
+                for gen, (c, t, m) in sorted(self.gc_pauses.items())
+            },
+        }
@@ -1,26 +1,49 @@
+import math
+import random
+
 import pygame
 
 from config.settings import (
+    FPS,
     STATE_GAME_OVER,
     STATE_PLAYING,
     STATE_UPGRADE,
     WIDTH,
     HEIGHT,
 )
+from core.culling import CullStats, damage_number_visible
+from core.data_loader import get_enemy_stats
 from core.event_bus import EventBus
+from core.frame_stats import FrameStats
 from core.modes.survival_mode import SurvivalMode
+from core.profiler import Profiler
+from core.quality import QualityGovernor
+from core.snapshot import restore as restore_snapshot, take as take_snapshot
 from core.stats_tracker import StatsTracker
+from core.timer_wheel import TimerWheel
 from entities.bullet import EnemyBullet
 from entities.player import Player
 from entities.particle import Particle
 from systems.collision import check_collisions
 from systems.combat import CombatSystem
-from systems.weapon_system import WeaponSystem, RIFLE
+from systems.targeting import NearestPlayerIndex
+from systems.upgrade_system import apply_upgrade, reapply_upgrades
+from systems.weapon_system import DEFAULT_WEAPON, Weapon, WeaponSystem
+
+
+# Idle key lookup for players without input this frame
+_NO_KEYS = {pygame.K_w: False, pygame.K_s: False, pygame.K_a: False, pygame.K_d: False}
 
 
 class GameManager:
-    def __init__(self):
-        self.players = [Player(WIDTH // 2 - 22, HEIGHT // 2 - 22, player_id=0)]
+    def __init__(self, seed: int | None = None, players: int = 1, stats: StatsTracker = None):
+        # --- Determinism: one seed drives the module-level RNG for the run ---
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        random.seed(self.seed)
+        self.frame = 0          # simulation frames (only advances while playing)
+        self.persist_stats = True   # False during replay playback / headless sims
+
+        self.players = [self._spawn_player(i, players) for i in range(players)]
         self.enemies = []
         self.enemy_bullets = []
         self.particles = []
@@ -31,18 +54,8 @@ class GameManager:
         self.kills = 0
         self.wave = 1
 
-        # --- Weapon system (owns firing, ammo, fire rate) ---
-        self.weapon_system = WeaponSystem(RIFLE)
-
-        # Ammo state mirrors current weapon (read by HUD + CombatSystem)
-        self.max_ammo = RIFLE.max_ammo
-        self.current_ammo = self.max_ammo
-        self.reload_time = RIFLE.reload_time
-        self.last_reload = 0
-        self.is_reloading = False
-
-        # Temporary mouse pos store for burst drip-feed
-        self._last_mouse_pos = (WIDTH // 2, HEIGHT // 2)
+        # --- Enemy targeting (rebuilt each frame from living players) ---
+        self.targeting = NearestPlayerIndex()
 
         # --- Wave spawning state ---
         self.spawn_timer = 0
@@ -54,7 +67,8 @@ class GameManager:
         self.screen_shake = 0
 
         # --- P3: Upgrade state ---
-        self.pending_upgrades: list = []
+        self.pending_upgrades: list = []    # upgrade keys on offer
+        self.upgrades_taken: tuple = ()     # keys in pick order (modifier sources, run history)
         self.upgrade_hovered: int = 0
 
         # --- Event bus (pub/sub for future systems) ---
@@ -63,38 +77,170 @@ class GameManager:
         # --- Mode (plug-and-play game modes) ---
         self.active_mode = SurvivalMode()
 
-        # --- P6: Retention / stats ---
-        self.stats = StatsTracker()
+        # --- P6: Retention / stats (restart() passes its tracker: no disk reads) ---
+        self.stats = stats if stats is not None else StatsTracker()
 
         # --- Combat sub-system ---
         self.combat = CombatSystem()
 
-    def reload(self):
-        if not self.is_reloading and self.current_ammo < self.max_ammo:
-            self.is_reloading = True
-            self.last_reload = pygame.time.get_ticks()
+        # --- Scheduled state flips (invulnerability, boosts, combo, expiry) ---
+        self.timers = TimerWheel()
+
+        # --- Per-system timing scopes (no-op unless enabled) ---
+        self.profiler = Profiler()
+
+        # --- Frame-time distribution + GC pauses (written at game over) ---
+        self.frame_stats = FrameStats()
+
+        # --- Effect quality tier (particle budget, glows, auras) ---
+        self.quality = QualityGovernor()
+
+        # --- Drawn vs. culled counts per entity category ---
+        self.culling = CullStats()
+
+    def now(self) -> int:
+        """Simulation clock in ms, derived from the frame counter (replay-safe)."""
+        return self.frame * 1000 // FPS
 
-    def update(self):
+    @staticmethod
+    def _spawn_player(index: int, count: int) -> Player:
+        """Players start in a ring around the arena centre, each with its own rifle."""
+        radius = 0 if count == 1 else 80
+        angle = 2 * math.pi * index / count
+        player = Player(WIDTH // 2 - 22 + radius * math.cos(angle),
+                        HEIGHT // 2 - 22 + radius * math.sin(angle), player_id=index)
+        # A private copy, so one player's upgrades never touch another's weapon
+        WeaponSystem().equip(Weapon.from_json(DEFAULT_WEAPON), player)
+        return player
+
+    def alive_players(self) -> list:
+        return [p for p in self.players if p.is_alive()]
+
+    def reload(self, player=None):
+        player = player or self.players[0]
+        if not player.is_reloading and player.current_ammo < player.max_ammo:
+            player.is_reloading = True
+            player.last_reload = self.now()
+
+    def step(self, inputs):
+        """
+        Apply one frame of input, then advance the simulation. *inputs* is a
+        FrameInput for player 0 or a sequence with one per player (missing
+        entries idle). Per player, order matches the old main-loop event
+        handling: release-fire, reload, restart, upgrade pick, held fire;
+        then update.
+        """
+        if not isinstance(inputs, (list, tuple)):
+            inputs = (inputs,)
+
+        for player, inp in zip(self.players, inputs):
+            if not player.is_alive():
+                continue
+            if inp.fire_released and self.state == STATE_PLAYING:
+                player.weapon_system.handle_shoot(self, player, inp.mouse_pos, mouse_held=False)
+            if inp.reload and self.state == STATE_PLAYING:
+                self.reload(player)
+
+        for inp in inputs:
+            if inp.restart and self.state == STATE_GAME_OVER:
+                self.restart()
+                break
+
+        # Whoever presses first picks; the upgrade applies to the whole team
+        for inp in inputs:
+            if (inp.upgrade_choice >= 0 and self.state == STATE_UPGRADE
+                    and inp.upgrade_choice < len(self.pending_upgrades)):
+                key = self.pending_upgrades[inp.upgrade_choice]
+                pick = len(self.upgrades_taken)
+                for player in self.alive_players():
+                    apply_upgrade(key, player, self, pick)
+                self.upgrades_taken += (key,)
+                self.pending_upgrades = []
+                self.state = STATE_PLAYING
+                break
+
+        for player, inp in zip(self.players, inputs):
+            if inp.fire_held and self.state == STATE_PLAYING and player.is_alive():
+                player.weapon_system.handle_shoot(self, player, inp.mouse_pos, mouse_held=True)
+
+        self.update([inp.key_state() for inp in inputs])
+
+    def update(self, keys=None):
+        """
+        Advance one simulation frame. *keys* is a pygame-style key lookup
+        (or a list of them, one per player); None reads the live keyboard
+        for player 0 (tools and stress tests).
+        """
         if self.state not in (STATE_PLAYING,):
             return
 
-        current_time = pygame.time.get_ticks()
+        self.frame += 1
+        current_time = self.now()
+        prof = self.profiler
+
+        # Timers due this frame (see core/timer_wheel.py)
+        with prof.scope("timers"):
+            for _, owner, index, action in self.timers.advance(self.frame):
+                self._fire_timer(owner, index, action)
 
         # Reload completion
-        if self.is_reloading:
-            if current_time - self.last_reload >= self.reload_time:
-                self.current_ammo = self.max_ammo
-                self.is_reloading = False
+        for player in self.players:
+            if player.is_reloading and current_time - player.last_reload >= player.reload_time:
+                player.current_ammo = player.max_ammo
+                player.is_reloading = False
 
         # Player movement
-        keys = pygame.key.get_pressed()
-        for player in self.players:
-            player.update(keys)
+        with prof.scope("player"):
+            if keys is None:
+                keys = pygame.key.get_pressed()
+            if not isinstance(keys, list):
+                keys = [keys]
+            for i, player in enumerate(self.players):
+                if player.is_alive():
+                    player.update(keys[i] if i < len(keys) else _NO_KEYS)
 
         # Enemy AI + shooting
-        player_center = self.players[0].get_center()
+        with prof.scope("ai"):
+            self._update_enemies()
+
+        # Entity updates
+        with prof.scope("bullets"):
+            self._update_bullets()
+        with prof.scope("particles"):
+            self._update_particles()
+        with prof.scope("damage_numbers"):
+            self._update_damage_numbers()
+
+        with prof.scope("mode"):
+            self.active_mode.update(self)
+        with prof.scope("collision"):
+            check_collisions(self)
+
+        # Deliver this frame's queued events — the one point handlers run
+        with prof.scope("events"):
+            self.event_bus.flush()
+
+        if not self.alive_players() and self.state != STATE_GAME_OVER:
+            self.state = STATE_GAME_OVER
+            if self.persist_stats:
+                self.stats.commit_run(self)   # fires once (guarded inside StatsTracker)
+
+        if self.screen_shake > 0:
+            self.screen_shake -= 1
+
+    # ------------------------------------------------------------------
+    # Per-system update passes (called in order from update())
+    # ------------------------------------------------------------------
+
+    def _update_enemies(self):
+        targeting = self.targeting
+        targeting.rebuild(self.players)
+        fallback = self.players[0].get_center()
+        nearest_center = targeting.nearest_center
         for enemy in self.enemies[:]:
-            should_shoot, direction = enemy.update(player_center, self.enemies)
+            half = enemy.size // 2
+            target_center = nearest_center(enemy.x + half, enemy.y + half) or fallback
+            should_shoot, direction = enemy.update(target_center, self.enemies, self.frame)
             if should_shoot and direction:
                 enemy_center = enemy.get_center()
                 self.enemy_bullets.append(
@@ -106,46 +252,104 @@ class GameManager:
                     )
                 )
 
-        # Entity updates
+    def _update_bullets(self):
         for bullet in self.enemy_bullets[:]:
             bullet.update()
             if bullet.is_off_screen():
                 self.enemy_bullets.remove(bullet)
 
-        for powerup in self.powerups[:]:
-            powerup.update()
-            if powerup.is_expired():
-                self.powerups.remove(powerup)
-
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.is_dead():
-                self.particles.remove(particle)
+    def _update_particles(self):
+        kept = []
+        left_screen = 0
+        for particle in self.particles:
+            if particle.update():
+                kept.append(particle)
+            elif not particle.is_dead():
+                left_screen += 1
+        self.particles = kept
+        self.culling.retired("particles", left_screen)
 
-        for dn in self.damage_numbers[:]:
+    def _update_damage_numbers(self):
+        kept = []
+        left_screen = 0
+        for dn in self.damage_numbers:
             dn.update()
             if dn.is_dead():
-                self.damage_numbers.remove(dn)
+                continue
+            if not damage_number_visible(dn):
+                left_screen += 1
+                continue
+            kept.append(dn)
+        self.damage_numbers = kept
+        self.culling.retired("damage_numbers", left_screen)
 
-        self.active_mode.update(self)
-        check_collisions(self)
+    # ------------------------------------------------------------------
+    # Timer callbacks
+    # ------------------------------------------------------------------
 
-        # Tick weapon system (burst queue + crosshair decay)
-        self.weapon_system.update(self)
+    def _fire_timer(self, owner, index, action):
+        if owner is None:
+            getattr(self, action)()
+            return
+        target = getattr(self, owner)
+        if index is not None:
+            target = target[index]
+        getattr(target, action)(self)
 
-        # Delegate combat timer ticks to CombatSystem
-        self.combat.update(self)
+    def _expire_powerups(self):
+        frame = self.frame
+        self.powerups = [p for p in self.powerups if not p.is_expired(frame)]
 
-        previous_alive = self.players[0].is_alive()
-        if not previous_alive and self.state != STATE_GAME_OVER:
-            self.state = STATE_GAME_OVER
-            self.stats.commit_run(self)   # fires once (guarded inside StatsTracker)
+    # ------------------------------------------------------------------
+    # Snapshots (rollback, replay keyframes, checkpoints)
+    # ------------------------------------------------------------------
 
-        if self.screen_shake > 0:
-            self.screen_shake -= 1
+    def snapshot(self, base=None):
+        """Capture the full simulation state (incremental against *base*)."""
+        return take_snapshot(self, base)
+
+    def restore_snapshot(self, snap):
+        """Roll the simulation back (or forward) to *snap* in place."""
+        restore_snapshot(self, snap)
+
+    # ------------------------------------------------------------------
+    # Data hot reload (dev mode; see core.data_loader.subscribe)
+    # ------------------------------------------------------------------
+
+    def on_data_reloaded(self, kind: str):
+        """Swap new balance data into the running match."""
+        if kind == "weapons":
+            # Fresh base stats; the run's upgrade modifiers stay on top
+            for player in self.players:
+                ws = player.weapon_system
+                weapon = Weapon.from_json(ws.current_weapon.key)
+                ws.current_weapon = weapon
+                player.set_weapon_stats(weapon)
+                player.current_ammo = min(player.current_ammo, player.max_ammo)
+        elif kind == "upgrades":
+            for player in self.players:
+                reapply_upgrades(player, self.upgrades_taken)
+        elif kind == "enemies":
+            # Living enemies keep their wave-scaled health and speed
+            for enemy in self.enemies:
+                stats = get_enemy_stats(enemy.type.value)
+                enemy.damage = stats.damage
+                enemy.color = stats.color
+                enemy.score_value = stats.score_value
 
     def restart(self):
         old_stats = self.stats  # preserve stats tracker across restarts
-        self.__init__()
-        self.stats = old_stats
+        old_profiler = self.profiler
+        old_frame_stats = self.frame_stats  # keeps its gc.callbacks hook
+        old_quality = self.quality          # tier and preset carry over
+        old_bus = self.event_bus            # keep subscribers across restarts
+        persist_stats = self.persist_stats  # a headless server stays off the local log
+        self.__init__(players=len(self.players), stats=old_stats)
+        self.persist_stats = persist_stats
+        self.event_bus = old_bus
+        self.event_bus.clear()
+        self.profiler = old_profiler
+        self.frame_stats = old_frame_stats
+        self.quality = old_quality
+        self.frame_stats.reset()
         self.stats.reset_guard()
@@ -2,6 +2,7 @@
 core/modes/__init__.py
 """
 from core.modes.base_mode import GameMode
+from core.modes.horde_mode import HordeMode
 from core.modes.survival_mode import SurvivalMode
 
-__all__ = ["GameMode", "SurvivalMode"]
+__all__ = ["GameMode", "HordeMode", "SurvivalMode"]
@@ -0,0 +1,209 @@
+"""
+core/modes/horde_mode.py
+Stress-test mode: ramps live enemy counts into the thousands on a schedule
+and logs frame time against entity counts to build a scaling curve.
+"""
+import csv
+import random
+import time
+
+from config.settings import FPS, WIDTH, HEIGHT
+from core.events import EnemySpawned
+from core.modes.base_mode import GameMode
+from entities.enemy import Enemy, EnemyType
+
+
+# Weighted archetype mix — ranged/AI-heavy types stress the expensive paths
+DEFAULT_MIX = {
+    EnemyType.SHOOTER: 40,
+    EnemyType.SNIPER: 30,
+    EnemyType.SUPPORT: 30,
+}
+
+# (frame, target live enemy count) — counts are interpolated between points
+DEFAULT_SCHEDULE = [
+    (0, 50),
+    (600, 250),
+    (1200, 500),
+    (1800, 1000),
+    (2400, 2000),
+    (3000, 4000),
+    (3600, 4000),
+]
+
+# Profiler scopes reported as the headline subsystems of the curve
+CURVE_SYSTEMS = ("ai", "collision", "particles", "render")
+
+
+class HordeMode(GameMode):
+    """
+    Spawns a configurable archetype mix at up to *spawn_rate* enemies per
+    frame until the live count reaches the scheduled target.
+
+    Each frame records (frame_ms, entity counts, per-scope ms from the
+    profiler) unless *record* is False. When the schedule ends the curve
+    is written to *log_path* and `finished` flips to True.
+    """
+
+    def __init__(self, mix=None, schedule=None, spawn_rate=50, wave=1,
+                 invulnerable=True, bucket_size=100, log_path="horde_curve.csv",
+                 record=True):
+        mix = mix or DEFAULT_MIX
+        self.types = list(mix.keys())
+        self.weights = list(mix.values())
+        self.schedule = sorted(schedule or DEFAULT_SCHEDULE)
+        self.spawn_rate = spawn_rate
+        self.wave = wave
+        self.invulnerable = invulnerable
+        self.bucket_size = bucket_size
+        self.log_path = log_path
+        self.record = record
+
+        self.frame = 0
+        self.finished = False
+        self.samples: list[dict] = []
+        self._last_tick = None
+
+    # ------------------------------------------------------------------
+    # GameMode hooks
+    # ------------------------------------------------------------------
+
+    def update(self, game):
+        """Per-frame update: sample the previous frame, then ramp spawns."""
+        if self.finished:
+            return
+
+        if self.record:
+            game.profiler.set_enabled(True)
+            now = time.perf_counter()
+            if self._last_tick is not None:
+                self._record(game, (now - self._last_tick) * 1000.0)
+            self._last_tick = now
+
+        # Keep the player standing so the run only ends on schedule
+        if self.invulnerable:
+            for player in game.players:
+                player.health = player.max_health
+
+        target = self.target_count(self.frame)
+        spawned = 0
+        announce = EnemySpawned in game.event_bus.active
+        while len(game.enemies) < target and spawned < self.spawn_rate:
+            enemy = self._spawn()
+            game.enemies.append(enemy)
+            if announce:
+                game.event_bus.emit(EnemySpawned(enemy.type.value, enemy.x, enemy.y))
+            spawned += 1
+
+        self.frame += 1
+        if self.frame > self.schedule[-1][0]:
+            self.finished = True
+            if self.log_path:
+                self.write_curve(self.log_path)
+
+    def on_enemy_killed(self, game, enemy):
+        pass
+
+    def on_wave_end(self, game):
+        pass
+
+    def on_player_damaged(self, game, amount):
+        pass
+
+    # ------------------------------------------------------------------
+    # Schedule + curve
+    # ------------------------------------------------------------------
+
+    def target_count(self, frame: int) -> int:
+        """Linearly interpolate the scheduled enemy count at *frame*."""
+        prev_f, prev_n = self.schedule[0]
+        if frame <= prev_f:
+            return prev_n
+        for f, n in self.schedule[1:]:
+            if frame <= f:
+                t = (frame - prev_f) / (f - prev_f)
+                return int(prev_n + (n - prev_n) * t)
+            prev_f, prev_n = f, n
+        return prev_n
+
+    def scaling_curve(self) -> list[dict]:
+        """
+        Average the samples into buckets of *bucket_size* live enemies.
+        Each row: enemies, frames, frame_ms, bullets, particles, <scope>_ms...
+        """
+        buckets: dict[int, list[dict]] = {}
+        for s in self.samples:
+            key = s["enemies"] // self.bucket_size * self.bucket_size
+            buckets.setdefault(key, []).append(s)
+
+        scopes = sorted({name for s in self.samples for name in s["scopes"]})
+        rows = []
+        for key in sorted(buckets):
+            group = buckets[key]
+            n = len(group)
+            row = {
+                "enemies": key,
+                "frames": n,
+                "frame_ms": sum(s["frame_ms"] for s in group) / n,
+                "bullets": sum(s["bullets"] for s in group) / n,
+                "particles": sum(s["particles"] for s in group) / n,
+            }
+            for name in scopes:
+                row[f"{name}_ms"] = sum(s["scopes"].get(name, 0.0) for s in group) / n
+            rows.append(row)
+        return rows
+
+    def breaking_points(self, budget_ms: float = 1000.0 / FPS) -> dict:
+        """
+        Smallest enemy bucket at which each headline subsystem alone
+        exceeds *budget_ms* (None if it never does).
+        """
+        curve = self.scaling_curve()
+        result = {}
+        for name in CURVE_SYSTEMS + ("frame",):
+            col = f"{name}_ms"
+            result[name] = next(
+                (row["enemies"] for row in curve if row.get(col, 0.0) > budget_ms),
+                None,
+            )
+        return result
+
+    def write_curve(self, path: str):
+        """Write the bucketed scaling curve to *path* as CSV."""
+        curve = self.scaling_curve()
+        if not curve:
+            return
+        fields = list(curve[0].keys())
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for row in curve:
+                writer.writerow({k: round(v, 3) if isinstance(v, float) else v
+                                 for k, v in row.items()})
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    def _record(self, game, frame_ms: float):
+        self.samples.append({
+            "frame": self.frame,
+            "frame_ms": frame_ms,
+            "enemies": len(game.enemies),
+            "bullets": len(game.enemy_bullets),
+            "particles": len(game.particles),
+            "scopes": dict(game.profiler.last_frame),
+        })
+
+    def _spawn(self) -> Enemy:
+        enemy_type = random.choices(self.types, weights=self.weights)[0]
+        edge = random.choice(["top", "bottom", "left", "right"])
+        if edge == "top":
+            x, y = random.randint(0, WIDTH - 50), -50
+        elif edge == "bottom":
+            x, y = random.randint(0, WIDTH - 50), HEIGHT + 50
+        elif edge == "left":
+            x, y = -50, random.randint(0, HEIGHT - 50)
+        else:
+            x, y = WIDTH + 50, random.randint(0, HEIGHT - 50)
+        return Enemy(x, y, self.wave, enemy_type)
@@ -0,0 +1,116 @@
+"""
+core/modifiers.py
+Stacked stat modifiers with cached derived values.
+
+A StatSheet holds base values (e.g. from the equipped weapon) and
+modifiers grouped by a stable source key ("upgrade0.damage_surge",
+"powerup.damage_boost"). Every stat is derived as
+
+    (base + sum(add)) * product(mul), then the last "set" wins
+
+and cached until a base value or a source changes. Adding a source that
+already exists replaces its modifiers in place, so re-applying is
+idempotent and removal is exact (a timed powerup can never wipe an
+upgrade, and vice versa).
+
+Stats whose base is an int derive to ints (truncated, as the old
+per-upgrade code did); *minimums* clamps from below (fire_rate >= 1).
+
+Sheets are plain objects with dict/tuple state, so core.snapshot captures
+and restores them with their owner.
+"""
+from dataclasses import dataclass
+
+ADD = "add"
+MUL = "mul"
+SET = "set"
+OPS = (ADD, MUL, SET)
+
+
+@dataclass(frozen=True, slots=True)
+class Modifier:
+    stat: str
+    op: str
+    value: float
+
+    def __post_init__(self):
+        if self.op not in OPS:
+            raise ValueError(f"modifier op {self.op!r}; expected one of {OPS}")
+
+
+class StatSheet:
+    def __init__(self, base: dict, minimums: dict | None = None):
+        self.base = dict(base)
+        self.minimums = minimums or {}
+        self.sources: dict = {}      # source -> tuple[Modifier, ...], in apply order
+        self._values: dict = {}
+        self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Changes
+    # ------------------------------------------------------------------
+
+    def set_base(self, **values):
+        unknown = set(values) - set(self.base)
+        if unknown:
+            raise KeyError(f"unknown stat(s) {sorted(unknown)}")
+        self.base.update(values)
+        self._dirty = True
+
+    def add(self, source: str, modifiers):
+        """Apply *modifiers* under *source*, replacing what it applied before."""
+        modifiers = tuple(modifiers)
+        for mod in modifiers:
+            if mod.stat not in self.base:
+                raise KeyError(f"{source}: unknown stat {mod.stat!r}")
+        self.sources[source] = modifiers
+        self._dirty = True
+
+    def remove(self, source: str) -> bool:
+        if self.sources.pop(source, None) is None:
+            return False
+        self._dirty = True
+        return True
+
+    def has(self, source: str) -> bool:
+        return source in self.sources
+
+    # ------------------------------------------------------------------
+    # Derived values
+    # ------------------------------------------------------------------
+
+    @property
+    def values(self) -> dict:
+        """Every derived stat (cached; recomputed after a change)."""
+        if self._dirty:
+            self._values = self._derive()
+            self._dirty = False
+        return self._values
+
+    def __getitem__(self, stat: str):
+        return self.values[stat]
+
+    def _derive(self) -> dict:
+        add = {}
+        mul = {}
+        override = {}
+        for modifiers in self.sources.values():
+            for mod in modifiers:
+                if mod.op == ADD:
+                    add[mod.stat] = add.get(mod.stat, 0) + mod.value
+                elif mod.op == MUL:
+                    mul[mod.stat] = mul.get(mod.stat, 1.0) * mod.value
+                else:
+                    override[mod.stat] = mod.value
+
+        values = {}
+        minimums = self.minimums
+        for stat, base in self.base.items():
+            value = (base + add.get(stat, 0)) * mul.get(stat, 1)
+            value = override.get(stat, value)
+            if isinstance(base, int):
+                value = int(value)
+            if stat in minimums:
+                value = max(minimums[stat], value)
+            values[stat] = value
+        return values
@@ -0,0 +1,142 @@
+"""
+core/profiler.py
+Named timing scopes for simulation systems and render passes.
+Disabled by default — scope() hands back a shared no-op context manager,
+so instrumented code pays only for one attribute check when profiling is off.
+"""
+import time
+from collections import deque
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed_ms = (time.perf_counter() - self._start) * 1000.0
+        frame = self._profiler.frame
+        frame[self._name] = frame.get(self._name, 0.0) + elapsed_ms
+        return False
+
+
+class _AllocScope(_Scope):
+    """Timing scope that also accounts allocations via the profiler's AllocTracker."""
+    __slots__ = ()
+
+    def __enter__(self):
+        self._profiler.alloc.begin(self._name)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _Scope.__exit__(self, *exc)
+        self._profiler.alloc.end()
+        return False
+
+
+class Profiler:
+    """
+    Accumulates milliseconds per named scope for the current frame and keeps
+    a rolling window of completed frames for averages / maxima.
+
+    Usage:
+        with game.profiler.scope("ai"):
+            ...
+        game.profiler.end_frame()   # once per frame, after present
+
+    end_frame() also records the wall time between calls as the "frame" scope.
+
+    track_allocations() attaches a core.alloc_tracker.AllocTracker so every
+    scope additionally reports blocks/bytes allocated (tracemalloc); while
+    it is attached every scope stays on and toggle() is ignored.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 120):
+        self.enabled = enabled
+        self.window = window
+        self.frame: dict[str, float] = {}       # ms per scope, frame in progress
+        self.last_frame: dict[str, float] = {}  # ms per scope, last completed frame
+        self._history: dict[str, deque] = {}    # scope -> last *window* frame values
+        self._frame_start: float | None = None
+        self.alloc = None                       # AllocTracker while tracking allocations
+
+    def track_allocations(self):
+        """Start tracemalloc-backed allocation accounting (implies enabled)."""
+        from core.alloc_tracker import AllocTracker
+
+        if self.alloc is None:
+            self.alloc = AllocTracker()
+            self.alloc.start()
+        self.set_enabled(True)
+
+    def set_enabled(self, enabled: bool):
+        """Switch profiling on/off; history restarts when re-enabled."""
+        if enabled and not self.enabled:
+            self.frame = {}
+            self._history.clear()
+            self._frame_start = None
+        self.enabled = enabled
+
+    def toggle(self):
+        if self.alloc is not None:
+            return   # switching scopes off would silently stop the accounting
+        self.set_enabled(not self.enabled)
+
+    def scope(self, name: str):
+        """Return a context manager that times its body under *name*."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        if self.alloc is not None:
+            return _AllocScope(self, name)
+        return _Scope(self, name)
+
+    def end_frame(self):
+        """Close the current frame, publish it as last_frame and roll stats."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.frame["frame"] = (now - self._frame_start) * 1000.0
+        self._frame_start = now
+
+        frame = self.frame
+        history = self._history
+        for name in frame:
+            if name not in history:
+                history[name] = deque(maxlen=self.window)
+        for name, samples in history.items():
+            samples.append(frame.get(name, 0.0))
+
+        self.last_frame = frame
+        self.frame = {}
+        if self.alloc is not None:
+            self.alloc.end_frame()
+
+    def stats(self) -> dict[str, tuple[float, float]]:
+        """Rolling (avg_ms, max_ms) per scope over the window, in first-seen order."""
+        return {
+            name: (sum(samples) / len(samples), max(samples))
+            for name, samples in self._history.items()
+            if samples
+        }
@@ -0,0 +1,158 @@
+"""
+core/quality.py
+Effect quality tiers and the governor that picks one from measured frame
+time.
+
+Effects scale with the fight (25-particle death bursts, 20-particle
+railgun flashes, a full-screen aura surface per support enemy), so late
+waves can miss the frame budget on weaker machines. A tier caps them:
+
+    particle_scale   multiplier on every burst's particle count
+    particle_budget  live particles allowed; a burst that would overflow
+                     culls lower-priority particles (muzzle flashes before
+                     death bursts), soonest-to-die first, or is trimmed
+    auras            support-enemy aura rings and the sniper laser's
+                     translucent overlay (drawn as a plain line without)
+    glows            player glow and powerup halos
+
+The "auto" preset lets QualityGovernor.observe() step down a tier while
+the rolling busy time (wake -> present, see core.frame_pacer) is above
+DOWNGRADE_AT of the frame budget and back up once it has stayed below
+UPGRADE_AT for a few seconds. Other presets pin a tier. The chosen preset
+is kept in the player profile.
+
+Particles draw their randomness from a cosmetic RNG, so emitting fewer of
+them never shifts the seeded simulation RNG (replays stay in sync at any
+quality).
+"""
+import heapq
+from dataclasses import dataclass
+
+from config.settings import FPS
+from entities.particle import Particle
+
+# Burst priorities: a burst may cull live particles of lower priority
+PRIORITY_MUZZLE = 0
+PRIORITY_SPARK = 1
+PRIORITY_PICKUP = 2
+PRIORITY_DEATH = 3
+PRIORITY_PLAYER_HIT = 4
+
+# Rolling busy time vs. the frame budget (1000 / FPS ms)
+DOWNGRADE_AT = 0.9
+UPGRADE_AT = 0.6
+DOWNGRADE_FRAMES = FPS // 2      # sustained over before stepping down
+UPGRADE_FRAMES = FPS * 3         # sustained headroom before stepping up
+SMOOTHING = 0.1                  # EMA weight of the newest frame
+
+
+@dataclass(frozen=True, slots=True)
+class QualityTier:
+    name: str
+    particle_scale: float
+    particle_budget: int
+    auras: bool
+    glows: bool
+
+
+TIERS = (
+    QualityTier("high", 1.0, 1500, auras=True, glows=True),
+    QualityTier("medium", 0.6, 600, auras=False, glows=True),
+    QualityTier("low", 0.35, 250, auras=False, glows=False),
+    QualityTier("minimal", 0.15, 100, auras=False, glows=False),
+)
+
+AUTO = "auto"
+PRESETS = (AUTO,) + tuple(t.name for t in TIERS)
+
+
+class QualityGovernor:
+    def __init__(self, preset: str = AUTO, budget_ms: float = 1000.0 / FPS):
+        self.budget_ms = budget_ms
+        self.preset = AUTO
+        self.level = 0                   # index into TIERS
+        self.avg_ms = 0.0                # rolling busy time
+        self.changes = 0                 # tier changes made by "auto"
+        self.culled = 0                  # live particles culled for higher-priority bursts
+        self.trimmed = 0                 # burst particles never emitted (scale + budget)
+        self._over = 0
+        self._under = 0
+        self.set_preset(preset)
+
+    @property
+    def tier(self) -> QualityTier:
+        return TIERS[self.level]
+
+    # ------------------------------------------------------------------
+    # Presets
+    # ------------------------------------------------------------------
+
+    def set_preset(self, preset: str) -> str:
+        """Switch preset; unknown names (an old profile) fall back to auto."""
+        if preset not in PRESETS:
+            preset = AUTO
+        self.preset = preset
+        if preset != AUTO:
+            self.level = PRESETS.index(preset) - 1
+        self._over = self._under = 0
+        return preset
+
+    def cycle_preset(self) -> str:
+        """Next preset in PRESETS order (the F4 key)."""
+        return self.set_preset(PRESETS[(PRESETS.index(self.preset) + 1) % len(PRESETS)])
+
+    # ------------------------------------------------------------------
+    # Governor
+    # ------------------------------------------------------------------
+
+    def observe(self, busy_ms: float):
+        """Feed one frame's busy time; may move one tier under "auto"."""
+        self.avg_ms += (busy_ms - self.avg_ms) * SMOOTHING
+        if self.preset != AUTO:
+            return
+        if self.avg_ms > self.budget_ms * DOWNGRADE_AT:
+            self._over += 1
+            self._under = 0
+            if self._over >= DOWNGRADE_FRAMES and self.level < len(TIERS) - 1:
+                self._step(1)
+        elif self.avg_ms < self.budget_ms * UPGRADE_AT:
+            self._under += 1
+            self._over = 0
+            if self._under >= UPGRADE_FRAMES and self.level > 0:
+                self._step(-1)
+        else:
+            self._over = self._under = 0
+
+    def _step(self, delta: int):
+        self.level += delta
+        self.changes += 1
+        self._over = self._under = 0
+
+    # ------------------------------------------------------------------
+    # Particle emission
+    # ------------------------------------------------------------------
+
+    def emit(self, particles: list, count: int, priority: int, x, y, color,
+             velocity_range=3, gravity=True):
+        """Append a burst of up to *count* particles, scaled and budgeted by the tier."""
+        tier = self.tier
+        n = max(1, int(count * tier.particle_scale + 0.5))
+        room = tier.particle_budget - len(particles)
+        if n > room:
+            room += self._cull(particles, n - room, priority)
+        emitted = max(0, min(n, room))
+        self.trimmed += count - emitted
+        for _ in range(emitted):
+            particles.append(Particle(x, y, color, velocity_range, gravity, priority))
+
+    def _cull(self, particles: list, needed: int, priority: int) -> int:
+        """Drop up to *needed* live particles below *priority*; returns how many."""
+        candidates = [p for p in particles if p.priority < priority]
+        if not candidates:
+            return 0
+        if len(candidates) > needed:
+            candidates = heapq.nsmallest(needed, candidates, key=lambda p: (p.priority, p.life))
+        doomed = set(map(id, candidates))
+        particles[:] = [p for p in particles if id(p) not in doomed]
+        self.culled += len(doomed)
+        return len(doomed)
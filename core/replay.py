@@ -0,0 +1,208 @@
+"""
+core/replay.py
+Compact deterministic replays: the run's RNG seed + one packed FrameInput
+per player per frame, plus periodic full-state keyframes for random-access
+seeking.
+
+File layout (little-endian):
+    header      magic b"PARP", version u16, fps u16, seed u64,
+                frames u32, keyframe_interval u32, players u8
+    inputs      u32 length + zlib(frames * players * 6-byte records)
+    keyframes   core.snapshot encode() blobs, back to back
+    index       u32 count + count * (frame u32, offset u64, length u32)
+    footer      index offset u64
+
+Input record: flags u8 (W S A D held, fire held, fire released, reload,
+restart), mouse x u16, mouse y u16, upgrade choice u8 (255 = none).
+"""
+import struct
+import zlib
+
+from core import snapshot
+from core.frame_input import FrameInput
+
+MAGIC = b"PARP"
+VERSION = 7
+
+_HEADER = struct.Struct("<4sHHQIIB")
+_INPUT = struct.Struct("<BHHB")
+_INDEX_ENTRY = struct.Struct("<IQI")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+_IDLE = FrameInput()
+
+# ----------------------------------------------------------------------
+# Input packing
+# ----------------------------------------------------------------------
+
+def pack_input(inp: FrameInput) -> bytes:
+    flags = (
+        inp.up
+        | inp.down << 1
+        | inp.left << 2
+        | inp.right << 3
+        | inp.fire_held << 4
+        | inp.fire_released << 5
+        | inp.reload << 6
+        | inp.restart << 7
+    )
+    mx = max(0, min(0xFFFF, int(inp.mouse_pos[0])))
+    my = max(0, min(0xFFFF, int(inp.mouse_pos[1])))
+    choice = inp.upgrade_choice if inp.upgrade_choice >= 0 else 0xFF
+    return _INPUT.pack(flags, mx, my, choice)
+
+
+def unpack_input(buf, offset: int = 0) -> FrameInput:
+    flags, mx, my, choice = _INPUT.unpack_from(buf, offset)
+    return FrameInput(
+        up=bool(flags & 1),
+        down=bool(flags & 2),
+        left=bool(flags & 4),
+        right=bool(flags & 8),
+        fire_held=bool(flags & 16),
+        fire_released=bool(flags & 32),
+        reload=bool(flags & 64),
+        restart=bool(flags & 128),
+        upgrade_choice=-1 if choice == 0xFF else choice,
+        mouse_pos=(mx, my),
+    )
+
+
+# ----------------------------------------------------------------------
+# Keyframe state
+# ----------------------------------------------------------------------
+
+def capture_state(game) -> bytes:
+    """Serialise the full simulation state of *game* (incl. RNG) to bytes."""
+    return snapshot.encode(snapshot.take(game))
+
+
+def restore_state(game, blob: bytes):
+    """Load a capture_state() blob back into *game* in place."""
+    snapshot.restore(game, snapshot.decode(blob))
+
+
+# ----------------------------------------------------------------------
+# Recording
+# ----------------------------------------------------------------------
+
+class ReplayRecorder:
+    """
+    Call record(game, inputs) immediately before game.step(inputs) each
+    frame (a FrameInput, or one per player).
+    A keyframe of the pre-step state is taken every *keyframe_interval*
+    frames (frame 0 always), so seeking never replays more than that.
+    """
+
+    def __init__(self, game, fps: int, keyframe_interval: int = 600):
+        self.seed = game.seed
+        self.players = len(game.players)
+        self.fps = fps
+        self.keyframe_interval = keyframe_interval
+        self._inputs = bytearray()
+        self.frames = 0
+        self.keyframes: list[tuple[int, bytes]] = []
+
+    def record(self, game, inputs):
+        if self.frames % self.keyframe_interval == 0:
+            self.keyframes.append((self.frames, capture_state(game)))
+        if not isinstance(inputs, (list, tuple)):
+            inputs = (inputs,)
+        for i in range(self.players):
+            self._inputs += pack_input(inputs[i] if i < len(inputs) else _IDLE)
+        self.frames += 1
+
+    def save(self, path: str):
+        inputs = zlib.compress(bytes(self._inputs), 9)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.fps, self.seed,
+                                 self.frames, self.keyframe_interval, self.players))
+            f.write(_U32.pack(len(inputs)))
+            f.write(inputs)
+
+            index = []
+            for frame, blob in self.keyframes:
+                index.append((frame, f.tell(), len(blob)))
+                f.write(blob)
+
+            index_offset = f.tell()
+            f.write(_U32.pack(len(index)))
+            for entry in index:
+                f.write(_INDEX_ENTRY.pack(*entry))
+            f.write(_U64.pack(index_offset))
+
+
+# ----------------------------------------------------------------------
+# Playback
+# ----------------------------------------------------------------------
+
+class ReplayPlayer:
+    """
+    Drives a GameManager from a replay file at whatever speed the caller
+    runs it (headless: uncapped). Keyframes are read lazily from disk.
+
+        player = ReplayPlayer(path)
+        game = GameManager(seed=player.seed, players=player.players)
+        player.start(game)
+        while not player.finished:
+            player.step(game)
+        player.seek(game, 1800)   # random access
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            (magic, version, self.fps, self.seed, self.frames, self.keyframe_interval,
+             self.players) = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: not a v{VERSION} Pulse Arena replay")
+            (length,) = _U32.unpack(f.read(_U32.size))
+            self._inputs = zlib.decompress(f.read(length))
+
+            f.seek(-_U64.size, 2)
+            (index_offset,) = _U64.unpack(f.read(_U64.size))
+            f.seek(index_offset)
+            (count,) = _U32.unpack(f.read(_U32.size))
+            self.index = [_INDEX_ENTRY.unpack(f.read(_INDEX_ENTRY.size)) for _ in range(count)]
+
+        self.frame = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.frame >= self.frames
+
+    def input_at(self, frame: int, player: int = 0) -> FrameInput:
+        return unpack_input(self._inputs, (frame * self.players + player) * _INPUT.size)
+
+    def inputs_at(self, frame: int) -> list:
+        return [self.input_at(frame, i) for i in range(self.players)]
+
+    def start(self, game):
+        """Reset *game* to the first keyframe (frame 0)."""
+        self.seek(game, 0)
+
+    def step(self, game):
+        """Apply the next recorded input to *game*."""
+        if self.finished:
+            return
+        game.persist_stats = False
+        game.step(self.inputs_at(self.frame))
+        self.frame += 1
+
+    def seek(self, game, frame: int):
+        """Jump to *frame*: restore the nearest keyframe at or before it, then simulate forward."""
+        frame = max(0, min(frame, self.frames))
+        kf_frame, offset, length = self.index[0]
+        for entry in self.index:
+            if entry[0] > frame:
+                break
+            kf_frame, offset, length = entry
+
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            restore_state(game, f.read(length))
+        game.persist_stats = False
+        self.frame = kf_frame
+        while self.frame < frame:
+            self.step(game)
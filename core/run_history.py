@@ -0,0 +1,223 @@
+"""
+core/run_history.py
+Per-run history in an embedded SQLite database (data/history.db).
+
+The connection lives on a worker thread: the game thread only queues
+inserts and queries. Queued inserts are committed in one transaction per
+batch (WAL journal, synchronous=NORMAL), and queries run on the same
+thread after every insert queued before them, returning a PendingQuery
+the caller polls each frame:
+
+    history = RunHistory()
+    history.record(run)
+    board = history.best_by_weapon()
+    ...
+    if board.ready:
+        draw(board.rows)
+
+Indexes:
+    runs_score          (score DESC)                global leaderboard
+    runs_weapon_score   (weapon, score DESC, wave)  per-weapon bests (covering)
+    runs_weapon         (weapon) -> rowid order     per-weapon recent trends
+    run_upgrades_name   (name, run_id)              per-upgrade outcomes
+Recent-run trends walk the rowid backwards and need no index.
+"""
+import json
+import os
+import sqlite3
+import threading
+
+from core.event_sinks import AsyncSink
+
+
+_DB_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "history.db")
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id          INTEGER PRIMARY KEY,
+    time        REAL    NOT NULL,
+    seed        INTEGER,
+    weapon      TEXT,
+    players     INTEGER NOT NULL DEFAULT 1,
+    wave        INTEGER NOT NULL,
+    score       INTEGER NOT NULL,
+    kills       INTEGER NOT NULL,
+    combo       INTEGER NOT NULL DEFAULT 0,
+    duration    REAL,
+    frames      INTEGER,
+    frame_p50   REAL,
+    frame_p99   REAL,
+    frame_max   REAL,
+    over_budget INTEGER,
+    frame_stats TEXT
+);
+CREATE TABLE IF NOT EXISTS run_upgrades (
+    run_id  INTEGER NOT NULL REFERENCES runs(id),
+    pick    INTEGER NOT NULL,
+    name    TEXT    NOT NULL,
+    PRIMARY KEY (run_id, pick)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_score ON runs (score DESC);
+CREATE INDEX IF NOT EXISTS runs_weapon_score ON runs (weapon, score DESC, wave);
+CREATE INDEX IF NOT EXISTS runs_weapon ON runs (weapon);
+CREATE INDEX IF NOT EXISTS run_upgrades_name ON run_upgrades (name, run_id);
+"""
+
+_INSERT_RUN = """
+INSERT INTO runs (time, seed, weapon, players, wave, score, kills, combo, duration,
+                  frames, frame_p50, frame_p99, frame_max, over_budget, frame_stats)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class PendingQuery:
+    """Result slot filled by the worker; poll *ready* or wait()."""
+
+    __slots__ = ("sql", "params", "rows", "error", "_done")
+
+    def __init__(self, sql: str, params=()):
+        self.sql = sql
+        self.params = params
+        self.rows: list | None = None
+        self.error: Exception | None = None
+        self._done = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float | None = None) -> list | None:
+        self._done.wait(timeout)
+        return self.rows
+
+
+def _row(run: dict) -> tuple:
+    fs = run.get("frame_stats") or {}
+    pct = fs.get("run", {})
+    return (
+        run["time"], run.get("seed"), run.get("weapon"), run.get("players", 1),
+        run["wave"], run["score"], run["kills"], run.get("combo", 0), run.get("duration"),
+        fs.get("frames"), pct.get("p50"), pct.get("p99"), fs.get("max_ms"),
+        fs.get("over_budget"), json.dumps(fs) if fs else None,
+    )
+
+
+class RunHistory(AsyncSink):
+    def __init__(self, path: str = _DB_PATH, backfill=None, **kwargs):
+        """
+        *backfill* is an optional callable returning run dicts; it is
+        imported once, on the worker, when the database is first created.
+        """
+        self.path = path
+        self._backfill = backfill
+        self._conn = None          # owned by the worker thread
+        self.inserted = 0
+        kwargs.setdefault("maxsize", 4096)
+        kwargs.setdefault("batch_size", 64)
+        kwargs.setdefault("flush_interval", 0.1)
+        kwargs.setdefault("name", "run-history")
+        super().__init__(self._run_jobs, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Game-thread API (never blocks)
+    # ------------------------------------------------------------------
+
+    def record(self, run: dict):
+        """Queue one finished run (a stats-tracker run record)."""
+        self.push(("insert", run))
+
+    def query(self, sql: str, params=()) -> PendingQuery:
+        pending = PendingQuery(sql, params)
+        self.push(("query", pending))
+        self.wake()
+        return pending
+
+    def leaderboard(self, limit: int = 10, weapon: str | None = None) -> PendingQuery:
+        if weapon is None:
+            return self.query("SELECT id, time, seed, weapon, wave, score, kills FROM runs "
+                              "ORDER BY score DESC LIMIT ?", (limit,))
+        return self.query("SELECT id, time, seed, weapon, wave, score, kills FROM runs "
+                          "WHERE weapon = ? ORDER BY score DESC LIMIT ?", (weapon, limit))
+
+    def best_by_weapon(self) -> PendingQuery:
+        return self.query("SELECT weapon, MAX(score) AS best_score, MAX(wave) AS best_wave, "
+                          "COUNT(*) AS runs FROM runs GROUP BY weapon ORDER BY best_score DESC")
+
+    def trend(self, last: int = 100, weapon: str | None = None) -> PendingQuery:
+        """Averages over the most recent *last* runs (optionally one weapon)."""
+        where, params = ("WHERE weapon = ? ", (weapon, last)) if weapon else ("", (last,))
+        return self.query(
+            "SELECT COUNT(*) AS runs, AVG(wave) AS avg_wave, AVG(score) AS avg_score, "
+            "AVG(kills) AS avg_kills, AVG(duration) AS avg_duration, AVG(frame_p99) AS avg_p99 "
+            f"FROM (SELECT * FROM runs {where}ORDER BY id DESC LIMIT ?)", params)
+
+    def upgrade_outcomes(self) -> PendingQuery:
+        """Per upgrade: times picked and the average wave of runs that took it."""
+        return self.query("SELECT u.name AS name, COUNT(*) AS picks, AVG(r.wave) AS avg_wave "
+                          "FROM run_upgrades u JOIN runs r ON r.id = u.run_id "
+                          "GROUP BY u.name ORDER BY avg_wave DESC")
+
+    def stats(self) -> dict:
+        return dict(super().stats(), inserted=self.inserted)
+
+    # ------------------------------------------------------------------
+    # Worker thread
+    # ------------------------------------------------------------------
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            if version == 0 and self._backfill is not None:
+                self._insert(conn, self._backfill())
+        self._conn = conn
+
+    def _insert(self, conn, runs):
+        if not runs:
+            return
+        with conn:   # one transaction for the whole batch
+            for run in runs:
+                try:
+                    cur = conn.execute(_INSERT_RUN, _row(run))
+                except (KeyError, TypeError, sqlite3.Error):
+                    continue   # malformed record (e.g. from an old log line)
+                upgrades = run.get("upgrades") or ()
+                if upgrades:
+                    conn.executemany("INSERT INTO run_upgrades (run_id, pick, name) VALUES (?, ?, ?)",
+                                     [(cur.lastrowid, i, name) for i, name in enumerate(upgrades)])
+                self.inserted += 1
+
+    def _run_jobs(self, jobs):
+        if self._conn is None:
+            self._connect()
+        conn = self._conn
+        runs = []
+        for kind, payload in jobs:
+            if kind == "insert":
+                runs.append(payload)
+                continue
+            # Queries see every run queued before them
+            if runs:
+                self._insert(conn, runs)
+                runs = []
+            try:
+                payload.rows = [dict(r) for r in conn.execute(payload.sql, payload.params)]
+            except sqlite3.Error as e:
+                payload.error = e
+                payload.rows = []
+            payload._done.set()
+        if runs:
+            self._insert(conn, runs)
+
+    def _on_close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
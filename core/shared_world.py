@@ -0,0 +1,297 @@
+"""
+core/shared_world.py
+Double-buffered world state in one multiprocessing.shared_memory block:
+written by the simulation process, read by the render process in split
+mode (see core/split.py).
+
+    [slot 0][slot 1][burst ring]
+
+A slot is a sequence number followed by one tick's state: a header (frame,
+score, wave, state, HUD counters, entity counts) and fixed-size records
+for players, enemies, enemy bullets, powerups and damage numbers. Ticks
+alternate slots, and the writer brackets each write with the slot's
+sequence number — odd while writing, even once complete — so the reader
+takes the newest even slot, copies it out and checks the number again (a
+seqlock). A reader that the writer laps mid-copy just retries; it never
+sees a torn tick and the writer never waits for it.
+
+Particle bursts (the QualityGovernor.emit() calls made during a tick) are
+effect events rather than state: they go into a ring after the slots, with
+a running total in the header, so a reader that skips ticks still gets
+every burst (up to BURST_RING behind). The ring sits outside the slots'
+seqlock, so it has its own guard: the writer raises the ring's claimed
+count before overwriting entries, and the reader, after copying entries,
+drops (as lost) any that the claimed count says may have been overwritten
+during the copy.
+
+Records hold what the draw code reads and nothing else; entities past a
+list's cap are left out of the view (counted in `overflow`).
+"""
+import math
+import struct
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+from entities.enemy import AIState, EnemyType
+from net.protocol import encode_state
+
+# Per-slot capacity
+MAX_PLAYERS = 8
+MAX_ENEMIES = 1024
+MAX_BULLETS = 1024
+MAX_POWERUPS = 64
+MAX_NUMBERS = 256
+BURST_RING = 1024
+
+_READ_TRIES = 4
+
+_ENEMY_TYPES = tuple(EnemyType)
+_ENEMY_TYPE_CODES = {t: i for i, t in enumerate(_ENEMY_TYPES)}
+_NO_TARGET = math.nan
+
+# Player flags
+FLAG_SHIELD = 1
+FLAG_INVULNERABLE = 2
+FLAG_RELOADING = 4
+FLAG_DAMAGE_DIRECTION = 8
+
+
+class FrameHeader(NamedTuple):
+    frame: int
+    score: int
+    kills: int
+    wave: int
+    state: int              # net.protocol state code
+    combo: int
+    screen_shake: int
+    upgrade_hovered: int
+    flash_until: int
+    hitmarker_until: int
+    players: int
+    enemies: int
+    bullets: int
+    powerups: int
+    numbers: int
+    bursts_total: int       # bursts written to the ring so far
+
+
+class WorldFrame(NamedTuple):
+    header: FrameHeader
+    players: list           # raw record tuples, see the _PLAYER etc. layouts
+    enemies: list
+    bullets: list
+    powerups: list
+    numbers: list
+    bursts: list            # (count, priority, x, y, color, velocity_range, gravity)
+
+
+_SEQ = struct.Struct("<Q")
+_HEADER = struct.Struct("<IiIHBHBbIIBHHHHQ")
+# x, y, id, flags, health, max_health, ammo, max_ammo, invulnerable_until,
+# damage_indicator_until, speed_boost_until, spread_until, last_reload (ms),
+# reload_time (ms), damage_boost, charge, damage direction x, y
+_PLAYER = struct.Struct("<ffBBhHHHIIIIIIffff")
+# x, y, type, AI state, hit_flash, health, max_health, aim_timer, laser target x, y
+_ENEMY = struct.Struct("<ffBBBiiHff")
+_BULLET = struct.Struct("<ff")
+# x, y, PowerupType value, born
+_POWERUP = struct.Struct("<ffBI")
+# x, y, damage, is_critical, life
+_NUMBER = struct.Struct("<ffiBB")
+# count, priority, x, y, r, g, b, velocity_range, gravity
+_BURST = struct.Struct("<HBffBBBfB")
+
+# Slot layout: each list gets a fixed region sized for its cap
+_PLAYERS_AT = _SEQ.size + _HEADER.size
+_ENEMIES_AT = _PLAYERS_AT + MAX_PLAYERS * _PLAYER.size
+_BULLETS_AT = _ENEMIES_AT + MAX_ENEMIES * _ENEMY.size
+_POWERUPS_AT = _BULLETS_AT + MAX_BULLETS * _BULLET.size
+_NUMBERS_AT = _POWERUPS_AT + MAX_POWERUPS * _POWERUP.size
+SLOT_SIZE = _NUMBERS_AT + MAX_NUMBERS * _NUMBER.size
+_CLAIMED_AT = 2 * SLOT_SIZE          # bursts the writer has started writing
+_RING_AT = _CLAIMED_AT + _SEQ.size
+BLOCK_SIZE = _RING_AT + BURST_RING * _BURST.size
+
+
+def enemy_type(code: int) -> EnemyType:
+    return _ENEMY_TYPES[code]
+
+
+def ai_state(value: int) -> AIState:
+    return AIState(value)
+
+
+class SharedWorld:
+    """
+    One end of the block. The sim process calls publish() once per tick;
+    the render process calls read() whenever it wants the newest tick.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self.shm = shm
+        self._buf = shm.buf
+        # Writer
+        self.ticks = 0
+        self.bursts_total = 0
+        self.overflow = 0          # entities left out (over a list's cap)
+        # Reader
+        self.seq_read = 0
+        self.bursts_read = 0
+        self.retries = 0           # copies redone because the writer lapped the reader
+        self.bursts_lost = 0       # ring entries overwritten before they were read
+
+    @classmethod
+    def create(cls) -> "SharedWorld":
+        return cls(shared_memory.SharedMemory(create=True, size=BLOCK_SIZE))
+
+    def close(self):
+        self._buf = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+    # ------------------------------------------------------------------
+    # Writer (sim process)
+    # ------------------------------------------------------------------
+
+    def publish(self, game, bursts=()):
+        """Write *game*'s state (and this tick's *bursts*) into the next slot."""
+        buf = self._buf
+        base = (self.ticks & 1) * SLOT_SIZE
+        seq = self.ticks * 2 + 1
+        _SEQ.pack_into(buf, base, seq)
+
+        if bursts:
+            # Claim the entries before overwriting them (see _read_bursts)
+            _SEQ.pack_into(buf, _CLAIMED_AT, self.bursts_total + len(bursts))
+        for burst in bursts:
+            count, priority, x, y, color, velocity_range, gravity = burst
+            at = _RING_AT + (self.bursts_total % BURST_RING) * _BURST.size
+            _BURST.pack_into(buf, at, min(count, 0xFFFF), priority, x, y,
+                             *color[:3], velocity_range, gravity)
+            self.bursts_total += 1
+
+        frame = game.frame
+        players = game.players[:MAX_PLAYERS]
+        at = base + _PLAYERS_AT
+        for p in players:
+            ws = p.weapon_system
+            direction = p.damage_direction
+            flags = (p.shield_active * FLAG_SHIELD | p.is_invulnerable * FLAG_INVULNERABLE
+                     | p.is_reloading * FLAG_RELOADING
+                     | (direction is not None) * FLAG_DAMAGE_DIRECTION)
+            dx, dy = direction if direction is not None else (0.0, 0.0)
+            _PLAYER.pack_into(
+                buf, at, p.x, p.y, p.id, flags, p.health, p.max_health, p.current_ammo,
+                p.max_ammo, p.invulnerable_until, p.damage_indicator_until,
+                p.speed_boost_until, ws.spread_until, p.last_reload, int(p.reload_time),
+                p.damage_boost, ws.get_charge_pct(), dx, dy)
+            at += _PLAYER.size
+
+        enemies = game.enemies[:MAX_ENEMIES]
+        at = base + _ENEMIES_AT
+        pack = _ENEMY.pack_into
+        codes = _ENEMY_TYPE_CODES
+        for e in enemies:
+            lx, ly = e.laser_target or (_NO_TARGET, _NO_TARGET)
+            pack(buf, at, e.x, e.y, codes[e.type], e.state.value, e.hit_flash, e.health,
+                 e.max_health, e.aim_timer, lx, ly)
+            at += _ENEMY.size
+
+        bullets = game.enemy_bullets[:MAX_BULLETS]
+        at = base + _BULLETS_AT
+        pack = _BULLET.pack_into
+        for b in bullets:
+            pack(buf, at, b.x, b.y)
+            at += _BULLET.size
+
+        powerups = game.powerups[:MAX_POWERUPS]
+        at = base + _POWERUPS_AT
+        for p in powerups:
+            _POWERUP.pack_into(buf, at, p.x, p.y, p.type.value, p.born)
+            at += _POWERUP.size
+
+        numbers = game.damage_numbers[:MAX_NUMBERS]
+        at = base + _NUMBERS_AT
+        for dn in numbers:
+            _NUMBER.pack_into(buf, at, dn.x, dn.y, dn.damage, dn.is_critical, max(0, dn.life))
+            at += _NUMBER.size
+
+        self.overflow += (len(game.players) - len(players) + len(game.enemies) - len(enemies)
+                          + len(game.enemy_bullets) - len(bullets)
+                          + len(game.powerups) - len(powerups)
+                          + len(game.damage_numbers) - len(numbers))
+
+        combat = game.combat
+        _HEADER.pack_into(
+            buf, base + _SEQ.size, frame, game.score, game.kills, game.wave,
+            encode_state(game.state), combat.combo, min(game.screen_shake, 0xFF),
+            game.upgrade_hovered, combat.flash_until, combat.hitmarker_until,
+            len(players), len(enemies), len(bullets), len(powerups), len(numbers),
+            self.bursts_total)
+
+        _SEQ.pack_into(buf, base, seq + 1)
+        self.ticks += 1
+
+    # ------------------------------------------------------------------
+    # Reader (render process)
+    # ------------------------------------------------------------------
+
+    def read(self) -> WorldFrame | None:
+        """The newest complete tick, or None if there is none newer than the last read."""
+        buf = self._buf
+        for _ in range(_READ_TRIES):
+            (seq0,) = _SEQ.unpack_from(buf, 0)
+            (seq1,) = _SEQ.unpack_from(buf, SLOT_SIZE)
+            # An odd slot is mid-write; the other one holds the newest complete tick
+            if seq0 & 1:
+                seq0 = 0
+            if seq1 & 1:
+                seq1 = 0
+            seq, base = (seq0, 0) if seq0 > seq1 else (seq1, SLOT_SIZE)
+            if seq <= self.seq_read:
+                return None
+            data = bytes(buf[base:base + SLOT_SIZE])
+            if _SEQ.unpack_from(buf, base)[0] == seq:
+                break
+            self.retries += 1
+        else:
+            return None
+        self.seq_read = seq
+        return self._decode(data)
+
+    def _decode(self, data: bytes) -> WorldFrame:
+        header = FrameHeader._make(_HEADER.unpack_from(data, _SEQ.size))
+        view = memoryview(data)
+
+        def records(layout, at, count):
+            return list(layout.iter_unpack(view[at:at + count * layout.size]))
+
+        return WorldFrame(
+            header,
+            records(_PLAYER, _PLAYERS_AT, header.players),
+            records(_ENEMY, _ENEMIES_AT, header.enemies),
+            records(_BULLET, _BULLETS_AT, header.bullets),
+            records(_POWERUP, _POWERUPS_AT, header.powerups),
+            records(_NUMBER, _NUMBERS_AT, header.numbers),
+            self._read_bursts(header.bursts_total),
+        )
+
+    def _read_bursts(self, total: int) -> list:
+        if total < self.bursts_read:          # a fresh writer (never the case in one session)
+            self.bursts_read = 0
+        start = max(self.bursts_read, total - BURST_RING)
+        buf = self._buf
+        ring = [bytes(buf[at:at + _BURST.size]) for at in
+                (_RING_AT + (i % BURST_RING) * _BURST.size for i in range(start, total))]
+        # Entries the writer may have lapped while they were copied are dropped
+        (claimed,) = _SEQ.unpack_from(buf, _CLAIMED_AT)
+        torn = min(len(ring), max(0, claimed - BURST_RING - start))
+        self.bursts_lost += start - self.bursts_read + torn
+        bursts = []
+        for data in ring[torn:]:
+            count, priority, x, y, r, g, b, velocity_range, gravity = _BURST.unpack(data)
+            bursts.append((count, priority, x, y, (r, g, b), velocity_range, bool(gravity)))
+        self.bursts_read = total
+        return bursts
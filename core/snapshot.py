@@ -0,0 +1,297 @@
+"""
+core/snapshot.py
+Whole-world snapshot / restore for rollback, replay keyframes and
+crash-recovery checkpoints.
+
+take() copies every entity's attribute dict (a C-level dict copy — entity
+attributes are immutable values: numbers, tuples, enums) and keeps a
+reference to the entity itself, so restore() just swaps the saved dicts
+back into the same objects and rebuilds the lists. No entity is
+constructed and nothing is pickled on the hot path.
+
+    snap = take(game)                 # ~0.1 ms for a few hundred enemies
+    ...
+    restore(game, snap)               # rollback in place
+
+    delta = take(game, base=snap)     # incremental: unchanged entities share
+                                      # the base's saved dict (no copy)
+
+    blob = encode(snap)               # compact bytes for disk / replay
+    save_checkpoint(game, path)       # crash recovery: atomic write
+    blob = encode(delta, base=snap)   # only changed fields since *base*
+    snap = decode(blob)               # fresh objects (or decode(blob, base))
+
+Incremental capture trades each copy for a dict compare, so it saves
+memory (and encode() bytes) rather than time when most entities move.
+
+Players (with their weapon systems) and systems (combat, mode) hold nested
+objects and lists; they are captured recursively since there are only a
+handful of them.
+"""
+import os
+import pickle
+import random
+import zlib
+from enum import Enum
+
+FORMAT_VERSION = 6
+
+# GameManager attributes that are plain values
+_SCALARS = (
+    "score", "kills", "wave", "frame",
+    "spawn_timer", "spawn_interval", "enemies_per_wave", "enemies_spawned_this_wave",
+    "state", "screen_shake", "upgrade_hovered", "upgrades_taken",
+)
+
+# GameManager lists of flat entities
+_ENTITY_LISTS = (
+    "enemies", "enemy_bullets", "particles", "damage_numbers", "powerups",
+)
+
+# GameManager-owned systems with nested state
+_SYSTEMS = ("combat", "active_mode", "timers")
+
+_new = object.__new__
+
+
+class Snapshot:
+    """In-memory world state. Holds references to the live entities."""
+
+    __slots__ = ("scalars", "players", "lists", "systems", "pending_upgrades", "rng", "_index")
+
+    def __init__(self, scalars, players, lists, systems, pending_upgrades, rng):
+        self.scalars = scalars                     # {attr: value}
+        self.players = players                     # (_Nested, ...) — own weapon state
+        self.lists = lists                         # {list name: ((obj, state), ...)}
+        self.systems = systems                     # {attr: _Nested}
+        self.pending_upgrades = pending_upgrades   # tuple of upgrade keys
+        self.rng = rng                             # random.getstate()
+        self._index = None
+
+    @property
+    def frame(self) -> int:
+        return self.scalars["frame"]
+
+    def entity_count(self) -> int:
+        return len(self.players) + sum(len(pairs) for pairs in self.lists.values())
+
+    def index(self) -> dict:
+        """id(entity) -> (position, state) over all lists, built lazily."""
+        if self._index is None:
+            index = {}
+            i = 0
+            for name in _ENTITY_LISTS:
+                for obj, state in self.lists[name]:
+                    index[id(obj)] = (i, state)
+                    i += 1
+            self._index = index
+        return self._index
+
+
+class _Nested:
+    """Captured state of a system object (one level of nested objects/containers)."""
+
+    __slots__ = ("obj", "state")
+
+    def __init__(self, obj, state):
+        self.obj = obj
+        self.state = state
+
+
+# ----------------------------------------------------------------------
+# Capture / restore
+# ----------------------------------------------------------------------
+
+def _capture_nested(obj) -> _Nested:
+    state = {}
+    for key, value in obj.__dict__.items():
+        if isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        elif hasattr(value, "__dict__") and not isinstance(value, Enum) and not callable(value):
+            value = _capture_nested(value)
+        state[key] = value
+    return _Nested(obj, state)
+
+
+def _restore_nested(nested: _Nested):
+    state = {}
+    for key, value in nested.state.items():
+        if isinstance(value, _Nested):
+            value = _restore_nested(value)
+        elif isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        state[key] = value
+    nested.obj.__dict__ = state
+    return nested.obj
+
+
+def take(game, base: Snapshot | None = None) -> Snapshot:
+    """
+    Capture *game*'s full simulation state. With *base*, entities whose
+    attributes are unchanged since *base* share its saved dict instead of
+    copying it.
+    """
+    lists = {}
+    if base is None:
+        for name in _ENTITY_LISTS:
+            lists[name] = tuple([(obj, obj.__dict__.copy()) for obj in getattr(game, name)])
+    else:
+        index = base.index()
+        for name in _ENTITY_LISTS:
+            pairs = []
+            for obj in getattr(game, name):
+                prev = index.get(id(obj))
+                d = obj.__dict__
+                if prev is not None and prev[1] == d:
+                    pairs.append((obj, prev[1]))
+                else:
+                    pairs.append((obj, d.copy()))
+            lists[name] = tuple(pairs)
+
+    return Snapshot(
+        scalars={name: getattr(game, name) for name in _SCALARS},
+        players=tuple(_capture_nested(p) for p in game.players),
+        lists=lists,
+        systems={name: _capture_nested(getattr(game, name)) for name in _SYSTEMS},
+        pending_upgrades=tuple(game.pending_upgrades),
+        rng=random.getstate(),
+    )
+
+
+def restore(game, snap: Snapshot):
+    """Put *game* back into the state captured in *snap* (in place)."""
+    for name, value in snap.scalars.items():
+        setattr(game, name, value)
+    game.players = [_restore_nested(n) for n in snap.players]
+    for name, pairs in snap.lists.items():
+        objs = []
+        for obj, state in pairs:
+            obj.__dict__ = state.copy()
+            objs.append(obj)
+        setattr(game, name, objs)
+    for name, nested in snap.systems.items():
+        setattr(game, name, _restore_nested(nested))
+    game.pending_upgrades = list(snap.pending_upgrades)
+    random.setstate(snap.rng)
+    game.event_bus.clear()   # queued events belong to the abandoned timeline
+
+
+# ----------------------------------------------------------------------
+# Serialisation
+# ----------------------------------------------------------------------
+
+def _diff(state: dict, prev: dict) -> dict:
+    return {k: v for k, v in state.items() if k not in prev or prev[k] != v}
+
+
+class _NestedRecord:
+    """Serialisable form of _Nested: the class instead of the live object."""
+
+    __slots__ = ("cls", "state")
+
+    def __init__(self, cls, state):
+        self.cls = cls
+        self.state = state
+
+
+def _nested_to_record(nested: _Nested) -> _NestedRecord:
+    state = {k: _nested_to_record(v) if isinstance(v, _Nested) else v
+             for k, v in nested.state.items()}
+    return _NestedRecord(type(nested.obj), state)
+
+
+def _record_to_nested(record: _NestedRecord) -> _Nested:
+    state = {k: _record_to_nested(v) if isinstance(v, _NestedRecord) else v
+             for k, v in record.state.items()}
+    return _Nested(_new(record.cls), state)
+
+
+def encode(snap: Snapshot, base: Snapshot | None = None, level: int = 1) -> bytes:
+    """
+    Compact byte form of *snap*. With *base* (which the decoder must also
+    have), entities present in both are written as a base position plus
+    their changed fields only; unchanged ones cost a single int.
+    """
+    index = base.index() if base is not None else {}
+    lists = {}
+    for name, pairs in snap.lists.items():
+        entries = []
+        for obj, state in pairs:
+            prev = index.get(id(obj))
+            if prev is None:
+                entries.append((type(obj), state))
+            elif prev[1] is state:
+                entries.append(prev[0])
+            else:
+                entries.append((prev[0], _diff(state, prev[1])))
+        lists[name] = entries
+
+    payload = {
+        "v": FORMAT_VERSION,
+        "delta": base is not None,
+        "scalars": _diff(snap.scalars, base.scalars) if base is not None else snap.scalars,
+        "players": [_nested_to_record(n) for n in snap.players],
+        "lists": lists,
+        "systems": {name: _nested_to_record(n) for name, n in snap.systems.items()},
+        "pending_upgrades": list(snap.pending_upgrades),
+        "rng": snap.rng,
+    }
+    return zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL), level)
+
+
+def decode(blob: bytes, base: Snapshot | None = None) -> Snapshot:
+    """Rebuild a Snapshot from encode() output. Delta blobs need the same *base*."""
+    payload = pickle.loads(zlib.decompress(blob))
+    if payload["v"] != FORMAT_VERSION:
+        raise ValueError(f"snapshot format v{payload['v']}, expected v{FORMAT_VERSION}")
+    if payload["delta"] and base is None:
+        raise ValueError("delta snapshot needs its base to decode")
+
+    base_pairs = [p for name in _ENTITY_LISTS for p in base.lists[name]] if base else []
+    lists = {}
+    for name, entries in payload["lists"].items():
+        pairs = []
+        for entry in entries:
+            if isinstance(entry, int):
+                pairs.append(base_pairs[entry])
+            elif isinstance(entry[0], int):
+                obj, prev = base_pairs[entry[0]]
+                pairs.append((obj, {**prev, **entry[1]}))
+            else:
+                pairs.append((_new(entry[0]), entry[1]))
+        lists[name] = tuple(pairs)
+
+    scalars = payload["scalars"]
+    if payload["delta"]:
+        scalars = {**base.scalars, **scalars}
+
+    return Snapshot(
+        scalars=scalars,
+        players=tuple(_record_to_nested(r) for r in payload["players"]),
+        lists=lists,
+        systems={name: _record_to_nested(p) for name, p in payload["systems"].items()},
+        pending_upgrades=tuple(payload["pending_upgrades"]),
+        rng=payload["rng"],
+    )
+
+
+# ----------------------------------------------------------------------
+# Checkpoints
+# ----------------------------------------------------------------------
+
+def save_checkpoint(game, path: str):
+    """Write a full snapshot to *path* atomically (temp file + rename)."""
+    blob = encode(take(game))
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(blob)
+    os.replace(tmp, path)
+
+
+def load_checkpoint(game, path: str):
+    with open(path, "rb") as f:
+        restore(game, decode(f.read()))
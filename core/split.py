@@ -0,0 +1,461 @@
+"""
+core/split.py
+Split mode (main.py --split): the simulation runs in a process of its own
+and the window process only draws, so a heavy render frame no longer holds
+up the simulation (or the other way round) and big waves use two cores.
+
+    sim process                                 window process (main.py)
+    GameManager.step() at FPS  -- shared  -->   SplitGame.step(): newest
+    SharedWorld.publish()         memory        complete tick -> render_frame
+                               <-- pipe ----    input each frame, settings
+    meta: upgrade offer, weapons,
+    profile (on change)        --- pipe --->
+
+SplitGame stands in for the GameManager in the main loop: it carries the
+attributes render_frame(), the HUD, the menus and the profiler overlay
+read, filled from shared memory (core/shared_world.py), and its step()
+forwards input instead of simulating. Entity views borrow the entities'
+own draw methods, so the frame looks the same as in one process.
+
+Particles live on the render side. The sim process records every emit()
+as a burst (BurstRecorder stands in for its QualityGovernor) and SplitGame
+replays them through its own governor, so the effect tier follows the
+window process's frame time, which is what it is meant to protect.
+
+The sim process is forked before the window or any worker thread exists
+(see main.py): it inherits the shared-memory mapping and never re-imports
+main.py. The game-over screen shows personal bests but not the run
+history panel (its queries live in the sim process).
+"""
+import json
+import math
+import multiprocessing
+import time
+from dataclasses import replace
+from typing import NamedTuple
+
+from config.settings import FPS
+from core.culling import CullStats
+from core.data_loader import get_enemy_stats
+from core.frame_input import FrameInput
+from core.frame_stats import FrameStats
+from core.game_manager import GameManager
+from core.profiler import Profiler
+from core.quality import QualityGovernor
+from core.replay import pack_input, unpack_input
+from core.shared_world import (
+    FLAG_DAMAGE_DIRECTION, FLAG_INVULNERABLE, FLAG_RELOADING, FLAG_SHIELD,
+    SharedWorld, ai_state, enemy_type,
+)
+from entities.bullet import EnemyBullet
+from entities.damage_number import DamageNumber
+from entities.enemy import Enemy
+from entities.player import PLAYER_COLORS, Player
+from entities.powerup import Powerup, PowerupType
+from net.protocol import decode_state
+from systems.weapon_system import WeaponSystem
+
+# Window -> sim messages (first byte of each pipe message)
+MSG_INPUT = 0        # + core.replay input record
+MSG_PREFERENCE = 1   # + JSON [key, value] for StatsTracker.set_preference
+MSG_QUIT = 2
+
+START_TIMEOUT = 10.0     # seconds to wait for the sim process's first message
+STOP_TIMEOUT = 3.0
+# Particle updates replayed at most per drawn frame when the window falls behind
+MAX_CATCHUP = 8
+
+
+def available() -> bool:
+    """Split mode needs fork() (the sim process must not re-run main.py)."""
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+# ----------------------------------------------------------------------
+# Sim process
+# ----------------------------------------------------------------------
+
+class BurstRecorder:
+    """QualityGovernor stand-in for the sim process: records emit() calls."""
+
+    def __init__(self):
+        self.bursts = []
+
+    def emit(self, particles: list, count: int, priority: int, x, y, color,
+             velocity_range=3, gravity=True):
+        self.bursts.append((count, priority, x, y, color, velocity_range, gravity))
+
+    def take(self) -> list:
+        bursts, self.bursts = self.bursts, []
+        return bursts
+
+
+def _merge(held: FrameInput, new: FrameInput) -> FrameInput:
+    """*new* held state; edge events from either (several frames may arrive per tick)."""
+    return replace(
+        new,
+        fire_released=held.fire_released or new.fire_released,
+        reload=held.reload or new.reload,
+        restart=held.restart or new.restart,
+        upgrade_choice=new.upgrade_choice if new.upgrade_choice >= 0 else held.upgrade_choice,
+    )
+
+
+def _held_only(inp: FrameInput) -> FrameInput:
+    return replace(inp, fire_released=False, reload=False, restart=False, upgrade_choice=-1)
+
+
+def _meta(game) -> dict:
+    return {
+        "upgrades": list(game.pending_upgrades),
+        "weapons": [p.weapon_system.current_weapon.name for p in game.players],
+        "profile": dict(game.stats.profile),
+    }
+
+
+def _run_sim(conn, shm, players: int):
+    """Sim process: step at FPS on forwarded input, publish every tick."""
+    game = GameManager(players=players)
+    game.quality = recorder = BurstRecorder()   # kept across restarts
+    world = SharedWorld(shm)
+    if players > 1:
+        from core.autopilot import kite
+
+    inp = FrameInput()
+    meta_key = None
+    period = 1.0 / FPS
+    next_tick = time.perf_counter()
+    try:
+        while True:
+            while conn.poll():
+                msg = conn.recv_bytes()
+                if msg[0] == MSG_INPUT:
+                    inp = _merge(inp, unpack_input(msg, 1))
+                elif msg[0] == MSG_PREFERENCE:
+                    game.stats.set_preference(*json.loads(msg[1:]))
+                elif msg[0] == MSG_QUIT:
+                    return
+
+            inputs = [inp] + [replace(kite(game, mate), upgrade_choice=-1)
+                              for mate in game.players[1:]]
+            game.step(inputs)
+            game.frame_stats.tick()
+            world.publish(game, recorder.take())
+            inp = _held_only(inp)
+
+            key = (game.state, tuple(game.pending_upgrades), game.stats.profile.get("games_played"),
+                   tuple(p.weapon_system.current_weapon.name for p in game.players))
+            if key != meta_key:
+                conn.send(_meta(game))
+                meta_key = key
+
+            # Fixed step; a tick that overran resyncs instead of bursting to catch up
+            next_tick += period
+            remaining = next_tick - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            elif remaining < -period:
+                next_tick = time.perf_counter()
+    except (EOFError, OSError, KeyboardInterrupt):
+        pass   # window process gone
+    finally:
+        game.stats.close()
+        world.close()
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# Entity views (render side)
+# ----------------------------------------------------------------------
+
+# Constant per-class fields, taken from a default instance
+_PLAYER = Player(0, 0)
+_BULLET = EnemyBullet(0, 0, 0, 0)
+_POWERUP = Powerup(0, 0, PowerupType.HEALTH)
+
+
+class _WeaponLabel(NamedTuple):
+    name: str
+
+
+class _WeaponView:
+    __slots__ = ("current_weapon", "spread_until", "charge")
+
+    crosshair_spread = WeaponSystem.crosshair_spread
+
+    def __init__(self, name, spread_until, charge):
+        self.current_weapon = _WeaponLabel(name)
+        self.spread_until = spread_until
+        self.charge = charge
+
+    def get_charge_pct(self) -> float:
+        return self.charge
+
+
+class _PlayerView:
+    __slots__ = ("x", "y", "id", "size", "color", "health", "max_health", "current_ammo",
+                 "max_ammo", "shield_active", "is_invulnerable", "is_reloading",
+                 "invulnerable_until", "damage_indicator_until", "speed_boost_until",
+                 "last_reload", "reload_time", "damage_boost", "damage_direction",
+                 "weapon_system")
+
+    draw = Player.draw
+    get_center = Player.get_center
+    is_alive = Player.is_alive
+
+    def __init__(self, record, weapon_name):
+        (self.x, self.y, self.id, flags, self.health, self.max_health, self.current_ammo,
+         self.max_ammo, self.invulnerable_until, self.damage_indicator_until,
+         self.speed_boost_until, spread_until, self.last_reload, self.reload_time,
+         self.damage_boost, charge, dx, dy) = record
+        self.size = _PLAYER.size
+        self.color = PLAYER_COLORS[self.id % len(PLAYER_COLORS)]
+        self.shield_active = bool(flags & FLAG_SHIELD)
+        self.is_invulnerable = bool(flags & FLAG_INVULNERABLE)
+        self.is_reloading = bool(flags & FLAG_RELOADING)
+        self.damage_direction = (dx, dy) if flags & FLAG_DAMAGE_DIRECTION else None
+        self.weapon_system = _WeaponView(weapon_name, spread_until, charge)
+
+
+class _EnemyView:
+    __slots__ = ("x", "y", "type", "size", "color", "state", "hit_flash", "health",
+                 "max_health", "aim_timer", "laser_target")
+
+    draw = Enemy.draw
+
+    def __init__(self, record):
+        (self.x, self.y, code, state, hit_flash, self.health, self.max_health,
+         self.aim_timer, lx, ly) = record
+        self.type = enemy_type(code)
+        stats = get_enemy_stats(self.type.value)
+        self.size = stats.size
+        self.color = stats.color
+        self.state = ai_state(state)
+        self.hit_flash = bool(hit_flash)
+        self.laser_target = None if math.isnan(lx) else (lx, ly)
+
+
+class _BulletView:
+    __slots__ = ("x", "y")
+
+    radius = _BULLET.radius
+    color = _BULLET.color
+    draw = EnemyBullet.draw
+
+    def __init__(self, record):
+        self.x, self.y = record
+
+
+class _PowerupView:
+    __slots__ = ("x", "y", "type", "born")
+
+    size = _POWERUP.size
+    colors = _POWERUP.colors
+    draw = Powerup.draw
+
+    def __init__(self, record):
+        self.x, self.y, type_value, self.born = record
+        self.type = PowerupType(type_value)
+
+
+def _damage_number(record) -> DamageNumber:
+    x, y, damage, is_critical, life = record
+    dn = DamageNumber(x, y, damage, bool(is_critical))
+    dn.life = life
+    return dn
+
+
+class _CombatView:
+    __slots__ = ("combo", "flash_until", "hitmarker_until")
+
+    def __init__(self):
+        self.combo = 0
+        self.flash_until = 0
+        self.hitmarker_until = 0
+
+
+class _StatsView:
+    """The profile as of the sim's last meta message; settings go back over the pipe."""
+
+    def __init__(self, game):
+        self._game = game
+        self.profile: dict = {}
+        self.boards: dict = {}
+
+    def set_preference(self, key: str, value):
+        self.profile[key] = value
+        self._game._send(MSG_PREFERENCE, json.dumps([key, value]).encode())
+
+    def close(self):
+        """Stop the sim process (it flushes its run log on the way out)."""
+        self._game.close()
+
+
+# ----------------------------------------------------------------------
+# Render side
+# ----------------------------------------------------------------------
+
+class SimExited(RuntimeError):
+    """The sim process is gone (crashed or killed); the window cannot go on."""
+
+
+class SplitGame:
+    """
+    Starts the sim process; looks like a GameManager to the main loop's
+    drawing and profiling code. Create it before the window exists.
+    """
+
+    def __init__(self, players: int = 1):
+        ctx = multiprocessing.get_context("fork")
+        self.world = SharedWorld.create()
+        self._conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_run_sim, args=(child, self.world.shm, players),
+                                   name="pulse-sim", daemon=True)
+        self.process.start()
+        child.close()
+        self._closed = False
+
+        # GameManager-shaped state, filled from shared memory
+        self.frame = 0
+        self.score = 0
+        self.kills = 0
+        self.wave = 1
+        self.state = decode_state(0)
+        self.screen_shake = 0
+        self.upgrade_hovered = 0
+        self.pending_upgrades: list = []
+        self.players: list = []
+        self.enemies: list = []
+        self.enemy_bullets: list = []
+        self.powerups: list = []
+        self.damage_numbers: list = []
+        self.particles: list = []
+        self.combat = _CombatView()
+        self._weapons: list = []
+
+        # Window-side systems (the sim process has its own)
+        self.quality = QualityGovernor()
+        self.culling = CullStats()
+        self.profiler = Profiler()
+        self.frame_stats = FrameStats()
+        self.stats = _StatsView(self)
+
+        self._tick = 0
+        self.ticks_skipped = 0     # sim ticks the window never drew (it fell behind)
+
+    def now(self) -> int:
+        return self.frame * 1000 // FPS
+
+    def wait_ready(self, timeout: float = START_TIMEOUT):
+        """Block until the sim process is up (its first meta message) and a tick is out."""
+        if not self._conn.poll(timeout):
+            raise SimExited("simulation process did not start")
+        self._receive()
+        deadline = time.perf_counter() + timeout
+        while not self.players:
+            if time.perf_counter() > deadline or not self.process.is_alive():
+                raise SimExited("simulation process stopped before its first tick")
+            time.sleep(0.001)
+            self.poll()
+
+    def step(self, inputs):
+        """Forward player 0's input (teammates run in the sim) and pick up the newest tick."""
+        inp = inputs[0] if isinstance(inputs, (list, tuple)) else inputs
+        self._send(MSG_INPUT, pack_input(inp))
+        self.poll()
+
+    def poll(self) -> bool:
+        """Apply pipe messages and the newest published tick; True if a tick was new."""
+        self._receive()
+        frame = self.world.read()
+        if frame is None:
+            return False
+        self._apply(frame)
+        return True
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._send(MSG_QUIT, b"")
+        except SimExited:
+            pass
+        self.process.join(STOP_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self._conn.close()
+        self.world.close()
+        self.world.unlink()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _send(self, kind: int, payload: bytes):
+        try:
+            self._conn.send_bytes(bytes((kind,)) + payload)
+        except OSError as exc:
+            raise self._exited() from exc
+
+    def _receive(self):
+        while self._conn.poll():
+            try:
+                meta = self._conn.recv()
+            except (EOFError, OSError) as exc:
+                raise self._exited() from exc
+            self.pending_upgrades = meta["upgrades"]
+            self._weapons = meta["weapons"]
+            self.stats.profile = meta["profile"]
+
+    def _exited(self) -> SimExited:
+        self.process.join(STOP_TIMEOUT)
+        return SimExited(f"simulation process exited (code {self.process.exitcode})")
+
+    def _apply(self, frame):
+        h = frame.header
+        advanced = h.frame - self.frame
+        if advanced < 0:          # the sim restarted
+            self.particles = []
+            advanced = h.frame
+        tick = self.world.seq_read // 2
+        self.ticks_skipped += max(0, tick - self._tick - 1)
+        self._tick = tick
+
+        self.frame = h.frame
+        self.score = h.score
+        self.kills = h.kills
+        self.wave = h.wave
+        self.state = decode_state(h.state)
+        self.screen_shake = h.screen_shake
+        self.upgrade_hovered = h.upgrade_hovered
+        combat = self.combat
+        combat.combo = h.combo
+        combat.flash_until = h.flash_until
+        combat.hitmarker_until = h.hitmarker_until
+
+        weapons = self._weapons
+        self.players = [_PlayerView(r, weapons[i] if i < len(weapons) else "")
+                        for i, r in enumerate(frame.players)]
+        self.enemies = [_EnemyView(r) for r in frame.enemies]
+        self.enemy_bullets = [_BulletView(r) for r in frame.bullets]
+        self.powerups = [_PowerupView(r) for r in frame.powerups]
+        self.damage_numbers = [_damage_number(r) for r in frame.numbers]
+
+        for count, priority, x, y, color, velocity_range, gravity in frame.bursts:
+            self.quality.emit(self.particles, count, priority, x, y, color,
+                              velocity_range, gravity)
+        for _ in range(min(advanced, MAX_CATCHUP)):
+            self._update_particles()
+
+    def _update_particles(self):
+        kept = []
+        left_screen = 0
+        for particle in self.particles:
+            if particle.update():
+                kept.append(particle)
+            elif not particle.is_dead():
+                left_screen += 1
+        self.particles = kept
+        self.culling.retired("particles", left_screen)
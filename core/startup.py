@@ -0,0 +1,68 @@
+"""
+core/startup.py
+Startup timeline: wall-clock time from process start to the first
+presented frame, split into phases and checked against a budget.
+
+    timeline = StartupTimeline()      # as early as possible in main.py
+    ...imports...
+    timeline.mark("import")
+    ...
+    timeline.mark("first_frame")
+    print(timeline.report())
+
+Each mark closes the phase that began at the previous mark, so phases
+add up to the total. Phases that ran concurrently (the prewarm thread)
+are recorded with add() and reported separately.
+"""
+import time
+
+# Process start to first presented frame, in ms
+STARTUP_BUDGET_MS = 500.0
+
+# Phases in the order main.py marks them
+PHASES = ("import", "init", "data", "prewarm", "first_frame")
+
+
+class StartupTimeline:
+    def __init__(self, budget_ms: float = STARTUP_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self._t0 = time.perf_counter()
+        self._last = self._t0
+        self.phases: dict = {}       # name -> ms (sequential)
+        self.background: dict = {}   # name -> ms (overlapped other phases)
+
+    def mark(self, phase: str):
+        """End *phase* now."""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + (now - self._last) * 1000.0
+        self._last = now
+
+    def add(self, phase: str, ms: float):
+        """Record a phase that ran in the background."""
+        self.background[phase] = ms
+
+    @property
+    def total_ms(self) -> float:
+        return (self._last - self._t0) * 1000.0
+
+    @property
+    def over_budget(self) -> bool:
+        return self.total_ms > self.budget_ms
+
+    def summary(self) -> dict:
+        return {
+            "phases": {k: round(v, 2) for k, v in self.phases.items()},
+            "background": {k: round(v, 2) for k, v in self.background.items()},
+            "total_ms": round(self.total_ms, 2),
+            "budget_ms": self.budget_ms,
+        }
+
+    def report(self) -> str:
+        lines = ["startup timeline:"]
+        for name, ms in self.phases.items():
+            lines.append(f"  {name:>12}: {ms:8.1f} ms")
+        for name, ms in self.background.items():
+            lines.append(f"  {name:>12}: {ms:8.1f} ms (background)")
+        verdict = "OVER BUDGET" if self.over_budget else "ok"
+        lines.append(f"  {'total':>12}: {self.total_ms:8.1f} ms / {self.budget_ms:.0f} ms budget ({verdict})")
+        return "\n".join(lines)
@@ -1,14 +1,51 @@
 """
 core/stats_tracker.py
-Persists player stats to data/profile.json.
+Persists player stats without touching the disk on the game thread.
+
+Every completed run is appended as one JSON line to data/runs.jsonl (the
+source of truth); data/profile.json is a compacted aggregate of that log
+plus the byte offset it covers. Both are written by a background writer:
+log lines are flushed and fsync'd per run, the profile is rewritten
+atomically (temp file + os.replace) every COMPACT_EVERY runs and on close.
+The profile also holds player settings (the effect quality preset); it is
+rewritten as soon as one changes.
+
+On load the profile is read and any log lines past its offset are folded
+in, so a crash between compactions loses nothing; a corrupt profile is set
+aside and rebuilt from the whole log. A torn final log line (crash
+mid-append) is skipped.
+
+A failed write (disk full, permissions) is reported on stderr and retried
+with the next job and again on close(); close() raises if runs are still
+unsaved, so a lost record never goes unnoticed.
+
+Runs are also recorded in the SQLite run history (core/run_history.py),
+which serves the game-over screen's leaderboard and trend queries.
+
 commit_run() includes a guard so it fires ONCE per game-over transition
 (prevents double-writes on restart loops).
+Each run's frame-time summary is appended to data/frame_stats.jsonl.
 """
 import json
 import os
+import sys
+import time
+from typing import TYPE_CHECKING
 
+from core.event_sinks import AsyncSink
+from systems.upgrade_system import upgrade_name
 
-_PROFILE_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "profile.json")
+if TYPE_CHECKING:
+    from core.run_history import RunHistory
+
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+_PROFILE_PATH = os.path.join(_DATA_DIR, "profile.json")
+_RUNS_PATH = os.path.join(_DATA_DIR, "runs.jsonl")
+_HISTORY_PATH = os.path.join(_DATA_DIR, "history.db")
+_FRAME_STATS_PATH = os.path.join(_DATA_DIR, "frame_stats.jsonl")
+
+COMPACT_EVERY = 20        # runs appended between profile rewrites
 
 _DEFAULTS = {
     "highest_wave": 0,
@@ -16,55 +53,277 @@ _DEFAULTS = {
     "best_score": 0,
     "longest_combo": 0,
     "games_played": 0,
+    "quality": "auto",        # effect quality preset (core/quality.py)
 }
 
 
+def fold_run(profile: dict, run: dict):
+    """Apply one run-log record to an aggregate profile, in place."""
+    profile["games_played"] += 1
+    profile["highest_wave"]  = max(profile["highest_wave"],  run["wave"])
+    profile["total_kills"]  += run["kills"]
+    profile["best_score"]    = max(profile["best_score"],    run["score"])
+    profile["longest_combo"] = max(profile["longest_combo"], run["combo"])
+
+
+def read_runs(path: str = _RUNS_PATH, offset: int = 0):
+    """
+    Yield (run dict, end offset) for every complete, valid line of the run
+    log at or after *offset*. Unparseable lines (a torn tail) are skipped.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        if offset > os.fstat(f.fileno()).st_size:
+            return   # log was replaced; the profile alone is authoritative
+        f.seek(offset)
+        pos = offset
+        for line in f:
+            pos += len(line)
+            if not line.endswith(b"\n"):
+                break
+            try:
+                run = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(run, dict):
+                yield run, pos
+
+
+def _write_atomic(path: str, text: str):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 class StatsTracker:
-    def __init__(self):
+    def __init__(self, profile_path: str = _PROFILE_PATH, runs_path: str = _RUNS_PATH,
+                 frame_stats_path: str = _FRAME_STATS_PATH, history_path: str = _HISTORY_PATH):
+        self.profile_path = profile_path
+        self.runs_path = runs_path
+        self.frame_stats_path = frame_stats_path
+        self.history_path = history_path
+        self.log_offset = 0        # run-log bytes folded into self.profile
         self.profile = self._load()
-        self._committed = False   # transition guard: fire once per game-over
+        self._committed = False    # transition guard: fire once per game-over
+        self._writer = None        # started on the first commit
+        self._history = None       # opened on first use
+        self._started = time.time()
+        self.boards: dict = {}     # name -> PendingQuery for the game-over screen
+
+        # Writer-thread state
+        self._runs_file = None
+        self._since_compact = 0
+        self._unsaved: list = []   # run jobs whose append failed, retried with the next job
+        self._profile_dirty = False
+        self.write_errors = 0
+        self.last_error = None
 
     def commit_run(self, game):
         """
         Call ONCE when state transitions to STATE_GAME_OVER.
-        Updates personal bests and writes profile.json.
+        Updates personal bests in memory and queues the run for the
+        background writer; never blocks on disk I/O.
         Guard prevents double-writes on restart loops.
         """
         if self._committed:
             return
         self._committed = True
 
-        p = self.profile
-        p["games_played"] += 1
-        p["highest_wave"]  = max(p["highest_wave"],  game.wave)
-        p["total_kills"]  += game.kills
-        p["best_score"]    = max(p["best_score"],    game.score)
-        p["longest_combo"] = max(p["longest_combo"], game.combat.combo)
+        run = {
+            "time": round(time.time(), 3),
+            "seed": game.seed,
+            "weapon": game.players[0].weapon_system.current_weapon.key,
+            "players": len(game.players),
+            "upgrades": [upgrade_name(key) for key in game.upgrades_taken],
+            "wave": game.wave,
+            "score": game.score,
+            "kills": game.kills,
+            "combo": game.combat.combo,
+            "duration": game.now() / 1000.0,
+        }
+        fold_run(self.profile, run)
+
+        frame_record = None
+        frame_stats = getattr(game, "frame_stats", None)
+        if frame_stats is not None and frame_stats.frames > 0:
+            frame_record = {"wave": game.wave, "score": game.score, "kills": game.kills}
+            frame_record.update(frame_stats.summary())
+
+        self._push(("run", run, dict(self.profile), frame_record))
+
+        history = self.history
+        history.record(dict(run, frame_stats=frame_record))
+        self.boards = {
+            "by_weapon": history.best_by_weapon(),
+            "trend": history.trend(100),
+        }
 
-        self._save()
+    @property
+    def history(self) -> "RunHistory":
+        """The run-history database (worker started on first use)."""
+        if self._history is None:
+            # Imported here so sqlite3 stays off the startup path
+            from core.run_history import RunHistory
+            # A new database imports the log, minus this session's runs,
+            # which reach it through record()
+            runs_path, started = self.runs_path, self._started
+            self._history = RunHistory(
+                self.history_path,
+                backfill=lambda: (run for run, _ in read_runs(runs_path)
+                                  if run.get("time", 0) < started),
+            )
+        return self._history
+
+    def set_preference(self, key: str, value):
+        """Store a setting in the profile; it is written off-thread right away."""
+        self.profile[key] = value
+        self._push(("settings", None, dict(self.profile), None))
 
     def reset_guard(self):
         """Reset guard when the game restarts."""
         self._committed = False
 
+    def close(self, timeout: float = 2.0):
+        """Compact the profile and stop the writers (call on shutdown)."""
+        if self._writer is not None:
+            self._writer.push(("compact", None, dict(self.profile), None))
+            self._writer.close(timeout)
+            self._writer = None
+        if self._history is not None:
+            self._history.close(timeout)
+            self._history = None
+        if self._unsaved or self._profile_dirty:
+            lost = f"{len(self._unsaved)} run(s)" if self._unsaved else "the profile"
+            raise RuntimeError(f"stats: {lost} could not be saved: {self.last_error}")
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _push(self, job):
+        if self._writer is None:
+            self._writer = AsyncSink(self._write_batch, maxsize=256, batch_size=1,
+                                     name="stats-writer")
+        self._writer.push(job)
+
     def _load(self) -> dict:
-        if os.path.exists(_PROFILE_PATH):
+        data = None
+        if os.path.exists(self.profile_path):
             try:
-                with open(_PROFILE_PATH, "r", encoding="utf-8") as f:
+                with open(self.profile_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
-                    # Merge missing keys from defaults
-                    for k, v in _DEFAULTS.items():
-                        data.setdefault(k, v)
-                    return data
-            except (json.JSONDecodeError, OSError):
+                if not isinstance(data, dict):
+                    raise ValueError("profile is not an object")
+            except (ValueError, OSError):
+                # Keep the damaged file for inspection; rebuild from the log
+                try:
+                    os.replace(self.profile_path, f"{self.profile_path}.corrupt")
+                except OSError:
+                    pass
+                data = None
+
+        profile = dict(_DEFAULTS)
+        if data is not None:
+            self.log_offset = int(data.pop("log_offset", 0))
+            profile.update(data)
+        for run, end in read_runs(self.runs_path, self.log_offset):
+            try:
+                fold_run(profile, run)
+            except (KeyError, TypeError):
+                continue
+            self.log_offset = end
+        return profile
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _write_batch(self, jobs):
+        runs = self._unsaved + [job for job in jobs if job[0] == "run"]
+        self._unsaved = []
+        if runs:
+            try:
+                self._append_runs(runs)
+            except OSError as e:
+                self._unsaved = runs
+                self._failed(e)
+            else:
+                self._since_compact += len(runs)
+                self._append_frame_stats([job[3] for job in runs if job[3] is not None])
+
+        closing = jobs[-1][0] == "compact"
+        settings = any(job[0] == "settings" for job in jobs)
+        compact = (settings or self._profile_dirty
+                   or (self._since_compact and (closing or self._since_compact >= COMPACT_EVERY)))
+        if compact and self._unsaved:
+            # The profile already counts the unsaved runs; writing it now would
+            # fold them in twice once the retry lands in the log
+            self._profile_dirty = True
+        elif compact:
+            # jobs[-1] carries the in-memory profile matching everything appended
+            offset = self._runs_file.tell() if self._runs_file is not None else self.log_offset
+            profile = dict(jobs[-1][2], log_offset=offset)
+            try:
+                _write_atomic(self.profile_path, json.dumps(profile, indent=2))
+            except OSError as e:
+                self._profile_dirty = True
+                self._failed(e)
+            else:
+                self._profile_dirty = False
+                self._since_compact = 0
+        if closing and self._runs_file is not None:
+            self._runs_file.close()
+            self._runs_file = None
+        if not self._unsaved and not self._profile_dirty:
+            self.last_error = None
+
+    def _append_runs(self, runs):
+        """Append and fsync *runs*; on failure the log is cut back to where it was."""
+        f = self._open_runs()
+        start = f.tell()
+        try:
+            f.write("".join(json.dumps(job[1]) + "\n" for job in runs).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        except OSError:
+            # Drop a partial append so the retry doesn't duplicate records
+            try:
+                f.truncate(start)
+            except OSError:
                 pass
-        return dict(_DEFAULTS)
+            f.close()
+            self._runs_file = None
+            raise
+
+    def _append_frame_stats(self, records):
+        if not records:
+            return
+        try:
+            with open(self.frame_stats_path, "a", encoding="utf-8") as fs:
+                fs.write("".join(json.dumps(r) + "\n" for r in records))
+        except OSError as e:
+            self._failed(e)   # diagnostics only: not retried
+
+    def _failed(self, error: OSError):
+        """Count a write error; the first of a run of failures is reported on stderr."""
+        if self.last_error is None:
+            print(f"stats: write failed, will retry: {error}", file=sys.stderr)
+        self.write_errors += 1
+        self.last_error = error
+
+    def _open_runs(self):
+        if self._runs_file is None:
+            os.makedirs(os.path.dirname(self.runs_path), exist_ok=True)
+            f = open(self.runs_path, "a+b")
+            # Terminate a torn line left by a crash so the next record parses
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            self._runs_file = f
+        return self._runs_file
 
-    def _save(self):
-        os.makedirs(os.path.dirname(_PROFILE_PATH), exist_ok=True)
-        with open(_PROFILE_PATH, "w", encoding="utf-8") as f:
-            json.dump(self.profile, f, indent=2)
@@ -0,0 +1,104 @@
+"""
+core/timer_wheel.py
+Hierarchical timer wheel on the simulation frame counter.
+
+Systems schedule an action at a future frame instead of decrementing a
+countdown every frame; only timers that are due cost anything on a tick.
+
+Three levels of 64 slots cover 64, 4096 and 262144 frames ahead (~73
+minutes at 60 FPS); anything later waits in an overflow list. Entries
+cascade down a level when the wheel below wraps, so each entry is touched
+at most once per level.
+
+Entries are plain data — (due, owner, index, action) — so core.snapshot
+captures the wheel like any other system and replays stay deterministic.
+GameManager resolves them when they fire (see GameManager._fire_timer):
+
+    owner   GameManager attribute holding the target ("combat",
+            "players"), or None for the GameManager itself
+    index   position in that attribute when it is a list, else None
+    action  method name on the target, called with the game (with no
+            arguments when the target is the GameManager)
+
+There is no cancel(): a target that can be rescheduled keeps its own
+deadline and ignores a timer that fires before it (lazy cancellation).
+Timers due at frame N fire, in the order they were scheduled, when the
+wheel advances to N.
+"""
+
+LEVEL_BITS = 6
+SLOTS = 1 << LEVEL_BITS          # slots per level
+LEVELS = 3
+_MASK = SLOTS - 1
+
+
+class TimerWheel:
+    def __init__(self, now: int = 0):
+        self.now = now
+        # One flat list of immutable tuples (level * SLOTS + slot), so a
+        # snapshot's shallow copy is a full copy
+        self.slots: list = [()] * (SLOTS * LEVELS)
+        self.overflow: tuple = ()
+        self.pending = 0
+        self.fired = 0
+
+    def schedule(self, delay: int, owner, action: str, index=None) -> int:
+        """Fire *action* *delay* frames from now (at least one). Returns the due frame."""
+        due = self.now + max(1, delay)
+        self._place((due, owner, index, action))
+        self.pending += 1
+        return due
+
+    def schedule_at(self, due: int, owner, action: str, index=None) -> int:
+        return self.schedule(due - self.now, owner, action, index)
+
+    def advance(self, frame: int) -> tuple:
+        """
+        Move the wheel to *frame* (exactly one past the current frame) and
+        return the entries due there.
+        """
+        self.now = frame
+        if frame & _MASK == 0:
+            self._cascade(frame)
+        slot = frame & _MASK
+        due = self.slots[slot]
+        if due:
+            self.slots[slot] = ()
+            self.pending -= len(due)
+            self.fired += len(due)
+        return due
+
+    def stats(self) -> dict:
+        return {"pending": self.pending, "fired": self.fired, "overflow": len(self.overflow)}
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _place(self, entry):
+        due, now = entry[0], self.now
+        for level in range(LEVELS):
+            shift = LEVEL_BITS * (level + 1)
+            if due >> shift == now >> shift:
+                i = level * SLOTS + ((due >> (LEVEL_BITS * level)) & _MASK)
+                self.slots[i] = self.slots[i] + (entry,)
+                return
+        self.overflow = self.overflow + (entry,)
+
+    def _cascade(self, frame: int):
+        """Re-place the entries of every higher-level slot that just came due."""
+        wrapped = 1          # levels whose wheel just wrapped (level 0 always has)
+        while wrapped < LEVELS and (frame >> (LEVEL_BITS * wrapped)) & _MASK == 0:
+            wrapped += 1
+        # Highest level first, so its entries can land in the slot cascaded next
+        if wrapped == LEVELS and self.overflow:
+            entries, self.overflow = self.overflow, ()
+            for entry in entries:
+                self._place(entry)
+        for lvl in range(min(wrapped, LEVELS - 1), 0, -1):
+            i = lvl * SLOTS + ((frame >> (LEVEL_BITS * lvl)) & _MASK)
+            entries = self.slots[i]
+            if entries:
+                self.slots[i] = ()
+                for entry in entries:
+                    self._place(entry)
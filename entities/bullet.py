@@ -17,13 +17,14 @@ class EnemyBullet:
         self.x += self.dx * self.speed
         self.y += self.dy * self.speed
 
-    def draw(self, screen):
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
+    def draw(self, screen, scale=1.0):
+        center = (int(self.x * scale), int(self.y * scale))
+        pygame.draw.circle(screen, self.color, center, self.radius * scale)
         pygame.draw.circle(
             screen,
             (255, 200, 100),
-            (int(self.x), int(self.y)),
-            self.radius - 2,
+            center,
+            (self.radius - 2) * scale,
         )
 
     def is_off_screen(self):
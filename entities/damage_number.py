@@ -1,28 +1,119 @@
+"""
+entities/damage_number.py
+Floating damage numbers, drawn from a digit atlas.
+
+Each style (normal, critical) has one atlas surface holding "-0123456789"
+rendered once; a number is a handful of area blits out of it, with its
+fade applied as surface alpha per blit. Nothing is rasterised per hit or
+per frame.
+
+Hits on the same target within COALESCE_FRAMES of its number's last hit
+add to that number instead of spawning another (see add_hit()), so
+shotgun and SMG fire show one climbing total per enemy.
+"""
 import pygame
 
+from ui.fonts import render_text, sprite
+
+LIFETIME = 60
+COALESCE_FRAMES = 12
+
+GLYPHS = "-0123456789"
+
+# is_critical -> (font size, colour)
+STYLES = {
+    False: (28, (255, 200, 100)),
+    True: (36, (255, 100, 100)),
+}
+
 
 class DamageNumber:
-    def __init__(self, x, y, damage, is_critical=False):
+    def __init__(self, x, y, damage, is_critical=False, target=None, frame=0):
         self.x = x
         self.y = y
         self.damage = damage
-        self.life = 60
+        self.life = LIFETIME
         self.is_critical = is_critical
         self.vy = -2
+        self.target = target        # id() of the enemy hit, None once closed
+        self.last_hit = frame       # sim frame of the latest merged hit
+        self.text = f"-{damage}"
+
+    def merge(self, x, y, damage, is_critical, frame):
+        """Fold another hit into this number and re-anchor it over the target."""
+        self.x = x
+        self.y = y
+        self.damage += damage
+        self.is_critical = self.is_critical or is_critical
+        self.life = LIFETIME
+        self.last_hit = frame
+        self.text = f"-{self.damage}"
 
     def update(self):
         self.y += self.vy
         self.life -= 1
 
-    def draw(self, screen):
-        font = pygame.font.Font(None, 36 if self.is_critical else 28)
-        color = (255, 100, 100) if self.is_critical else (255, 200, 100)
-        alpha = int(255 * (self.life / 60))
-
-        text = font.render(f"-{self.damage}", True, color)
-        text.set_alpha(alpha)
-        screen.blit(text, (int(self.x), int(self.y)))
+    def draw(self, screen, scale=1.0):
+        size, color = STYLES[self.is_critical]
+        atlas, glyphs = digit_atlas(size if scale == 1.0 else round(size * scale), color)
+        atlas.set_alpha(int(255 * (self.life / LIFETIME)))
+        x, y = int(self.x * scale), int(self.y * scale)
+        blits = []
+        for ch in self.text:
+            area = glyphs[ch]
+            blits.append((atlas, (x, y), area))
+            x += area.width
+        screen.blits(blits, doreturn=False)
 
     def is_dead(self):
         return self.life <= 0
 
+
+def add_hit(numbers: list, enemy, damage, is_critical, frame, killed=False):
+    """
+    Show a hit on *enemy*: merge it into the enemy's live number if its
+    last hit was within COALESCE_FRAMES, else start a new one. A killing
+    hit closes the number (nothing else merges into it).
+    """
+    x = enemy.x + enemy.size // 2
+    y = enemy.y
+    target = id(enemy)
+    for dn in reversed(numbers):
+        if dn.target == target and frame - dn.last_hit <= COALESCE_FRAMES:
+            dn.merge(x, y, damage, is_critical, frame)
+            break
+    else:
+        dn = DamageNumber(x, y, damage, is_critical, target, frame)
+        numbers.append(dn)
+    if killed:
+        dn.target = None
+
+
+# ----------------------------------------------------------------------
+# Digit atlas
+# ----------------------------------------------------------------------
+
+def _build_atlas(size, color):
+    surfaces = [render_text(ch, size, color) for ch in GLYPHS]
+    width = sum(s.get_width() for s in surfaces)
+    height = max(s.get_height() for s in surfaces)
+    atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+    glyphs = {}
+    x = 0
+    for ch, surf in zip(GLYPHS, surfaces):
+        # MAX onto the cleared atlas copies the glyph's own alpha exactly
+        atlas.blit(surf, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        glyphs[ch] = pygame.Rect(x, 0, surf.get_width(), height)
+        x += surf.get_width()
+    return atlas, glyphs
+
+
+def digit_atlas(size, color):
+    """(atlas surface, {glyph: area rect}) for one style."""
+    return sprite(("digits", size, color), _build_atlas, size, color)
+
+
+def sprite_jobs():
+    """Prewarm jobs for both styles' atlases."""
+    return [(("digits", size, color), _build_atlas, (size, color))
+            for size, color in STYLES.values()]
@@ -6,6 +6,7 @@ import pygame
 
 from config.settings import ACCENT_COLOR, WIDTH, HEIGHT
 from core.data_loader import get_enemy_stats
+from ui.fonts import render_text
 
 
 class EnemyType(Enum):
@@ -49,12 +50,12 @@ class Enemy:
 
         # --- Load stats from JSON data config ---
         stats = get_enemy_stats(enemy_type.value)
-        self.size = stats["size"]
-        self.base_speed = stats["base_speed"]
-        self.health = stats["health"]
-        self.damage = stats["damage"]
-        self.color = tuple(stats["color"])
-        self.score_value = stats["score_value"]
+        self.size = stats.size
+        self.base_speed = stats.base_speed
+        self.health = stats.health
+        self.damage = stats.damage
+        self.color = stats.color
+        self.score_value = stats.score_value
 
         # Wave scaling
         self.speed = self.base_speed + (wave_number * 0.08)
@@ -64,7 +65,7 @@ class Enemy:
         # --- AI state ---
         self.state = AIState.CHASE
         self.state_timer = 0
-        self.shoot_cooldown = 0
+        self.shoot_ready_at = 0     # sim frame the next shot is allowed
         self.strafe_direction = random.choice([-1, 1])
 
         # Hunter flank direction (perpendicular side)
@@ -73,26 +74,28 @@ class Enemy:
 
         # Sniper
         self.aim_timer = 0          # counts up to 60 before firing
-        self.sniper_cooldown = 0    # frames between sniper shots
+        self.sniper_ready_at = 0    # sim frame the post-shot recovery ends
         self.laser_target: tuple | None = None  # (x, y) of player during AIM state
 
         # Support
         self.heal_tick = 0          # counts up to 60 for heal pulse
 
-        # Hit feedback
-        self.hit_flash = 0
-        self.slow_timer = 0         # P4: enemy briefly slows on hit
+        # Hit feedback (deadlines in sim frames; nothing ticks per frame)
+        self.hit_flash = False
+        self.hit_flash_until = 0
+        self.slow_until = 0         # P4: enemy briefly slows on hit
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def update(self, player_pos, nearby_enemies=None):
+    def update(self, player_pos, nearby_enemies=None, frame=0):
         """
         Update enemy AI.
         Args:
             player_pos: (x, y) tuple of the player's center
             nearby_enemies: list of other Enemy instances (for Support heal)
+            frame: current simulation frame (cooldown / hit-effect deadlines)
         Returns:
             (should_shoot, direction) — direction is normalised (dx, dy) or None
         """
@@ -110,17 +113,11 @@ class Enemy:
             dx /= distance
             dy /= distance
 
-        if self.shoot_cooldown > 0:
-            self.shoot_cooldown -= 1
-        if self.sniper_cooldown > 0:
-            self.sniper_cooldown -= 1
-        if self.hit_flash > 0:
-            self.hit_flash -= 1
-        if self.slow_timer > 0:
-            self.slow_timer -= 1
+        if self.hit_flash and frame >= self.hit_flash_until:
+            self.hit_flash = False
 
         # Effective speed reduced on hit-slow (P4)
-        effective_speed = self.speed * (0.7 if self.slow_timer > 0 else 1.0)
+        effective_speed = self.speed * (0.7 if frame < self.slow_until else 1.0)
 
         should_shoot = False
         shoot_dir = None
@@ -128,13 +125,13 @@ class Enemy:
         # ---- Type-specific AI ----
         if self.type == EnemyType.SHOOTER:
             should_shoot, shoot_dir = self._ai_shooter(
-                dx, dy, distance, effective_speed
+                dx, dy, distance, effective_speed, frame
             )
         elif self.type == EnemyType.HUNTER:
             self._ai_hunter(dx, dy, distance, effective_speed, player_pos)
         elif self.type == EnemyType.SNIPER:
             should_shoot, shoot_dir = self._ai_sniper(
-                dx, dy, distance, effective_speed, player_pos
+                dx, dy, distance, effective_speed, player_pos, frame
             )
         elif self.type == EnemyType.SUPPORT:
             self._ai_support(dx, dy, distance, effective_speed, nearby_enemies)
@@ -149,103 +146,118 @@ class Enemy:
 
         return should_shoot, shoot_dir
 
-    def take_damage(self, amount):
+    def take_damage(self, amount, frame):
         self.health -= amount
-        self.hit_flash = 10
-        self.slow_timer = 5   # P4: brief slow on hit
+        self.hit_flash = True
+        self.hit_flash_until = frame + 10
+        self.slow_until = frame + 5   # P4: brief slow on hit
         return self.health <= 0
 
-    def draw(self, screen):
-        color = (255, 255, 255) if self.hit_flash > 0 else self.color
+    def draw(self, screen, auras=True, scale=1.0):
+        """
+        *auras* False skips the support aura and draws the sniper laser
+        opaque. *scale* maps arena coordinates onto *screen* (a reduced
+        world layer, see ui/renderer.py).
+        """
+        color = (255, 255, 255) if self.hit_flash else self.color
+        x, y, size = self.x * scale, self.y * scale, self.size * scale
+        stroke = max(1, round(2 * scale))
 
         if self.type == EnemyType.TANK:
-            draw_rounded_rect(screen, color, (self.x, self.y, self.size, self.size), radius=5)
-            draw_rounded_rect(screen, (100, 30, 30), (self.x, self.y, self.size, self.size),
-                              radius=5, border=4, border_color=(100, 30, 30))
+            radius = round(5 * scale)
+            draw_rounded_rect(screen, color, (x, y, size, size), radius=radius)
+            draw_rounded_rect(screen, (100, 30, 30), (x, y, size, size),
+                              radius=radius, border=max(1, round(4 * scale)),
+                              border_color=(100, 30, 30))
 
         elif self.type == EnemyType.SHOOTER:
             points = [
-                (self.x + self.size // 2, self.y),
-                (self.x, self.y + self.size),
-                (self.x + self.size, self.y + self.size),
+                (x + size // 2, y),
+                (x, y + size),
+                (x + size, y + size),
             ]
             pygame.draw.polygon(screen, color, points)
-            pygame.draw.polygon(screen, (150, 50, 150), points, 2)
+            pygame.draw.polygon(screen, (150, 50, 150), points, stroke)
 
         elif self.type == EnemyType.HUNTER:
             # Diamond shape — aggressive silhouette
-            cx = self.x + self.size // 2
-            cy = self.y + self.size // 2
-            r = self.size // 2
+            cx = x + size // 2
+            cy = y + size // 2
+            r = size // 2
             points = [(cx, cy - r), (cx + r, cy), (cx, cy + r), (cx - r, cy)]
             pygame.draw.polygon(screen, color, points)
-            pygame.draw.polygon(screen, (180, 30, 30), points, 2)
+            pygame.draw.polygon(screen, (180, 30, 30), points, stroke)
 
         elif self.type == EnemyType.SNIPER:
             # Thin elongated rectangle — long-range feel
             draw_rounded_rect(screen, color,
-                              (self.x + self.size // 4, self.y, self.size // 2, self.size),
-                              radius=3)
+                              (x + size // 4, y, size // 2, size),
+                              radius=round(3 * scale))
             # Draw laser during AIM state
             if self.state == AIState.AIM and self.laser_target:
-                cx = self.x + self.size // 2
-                cy = self.y + self.size // 2
-                alpha = min(255, int(255 * (self.aim_timer / 60)))
-                laser_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-                pygame.draw.line(laser_surf, (255, 50, 50, alpha),
-                                 (cx, cy), self.laser_target, 2)
-                # Small dot at muzzle
-                pygame.draw.circle(laser_surf, (255, 100, 100, alpha), (cx, cy), 4)
-                screen.blit(laser_surf, (0, 0))
+                cx = x + size // 2
+                cy = y + size // 2
+                target = (self.laser_target[0] * scale, self.laser_target[1] * scale)
+                if auras:
+                    alpha = min(255, int(255 * (self.aim_timer / 60)))
+                    laser_surf = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+                    pygame.draw.line(laser_surf, (255, 50, 50, alpha),
+                                     (cx, cy), target, stroke)
+                    # Small dot at muzzle
+                    pygame.draw.circle(laser_surf, (255, 100, 100, alpha), (cx, cy), 4 * scale)
+                    screen.blit(laser_surf, (0, 0))
+                else:
+                    pygame.draw.line(screen, (255, 50, 50), (cx, cy), target, 1)
 
         elif self.type == EnemyType.SUPPORT:
             # Hexagonal aura shape
-            cx = self.x + self.size // 2
-            cy = self.y + self.size // 2
-            r = self.size // 2
+            cx = x + size // 2
+            cy = y + size // 2
+            r = size // 2
             hex_pts = [
                 (cx + r * math.cos(math.radians(60 * i - 30)),
                  cy + r * math.sin(math.radians(60 * i - 30)))
                 for i in range(6)
             ]
             pygame.draw.polygon(screen, color, hex_pts)
-            pygame.draw.polygon(screen, (30, 80, 200), hex_pts, 2)
+            pygame.draw.polygon(screen, (30, 80, 200), hex_pts, stroke)
             # Pulsing aura ring
-            pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 15
-            aura_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            pygame.draw.circle(aura_surf, (60, 120, 220, 40),
-                               (int(cx), int(cy)), int(120 + pulse), 2)
-            screen.blit(aura_surf, (0, 0))
+            if auras:
+                pulse = abs(math.sin(pygame.time.get_ticks() * 0.005)) * 15
+                aura_surf = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+                pygame.draw.circle(aura_surf, (60, 120, 220, 40),
+                                   (int(cx), int(cy)), int((120 + pulse) * scale), stroke)
+                screen.blit(aura_surf, (0, 0))
 
         else:
             # RUSHER, SWARM
-            draw_rounded_rect(screen, color, (self.x, self.y, self.size, self.size), radius=5)
-            draw_rounded_rect(screen,
-                              tuple(max(0, c - 50) for c in self.color),
-                              (self.x, self.y, self.size, self.size),
-                              radius=5, border=2,
-                              border_color=tuple(max(0, c - 50) for c in self.color))
+            dark = tuple(max(0, c - 50) for c in self.color)
+            radius = round(5 * scale)
+            draw_rounded_rect(screen, color, (x, y, size, size), radius=radius)
+            draw_rounded_rect(screen, dark, (x, y, size, size),
+                              radius=radius, border=stroke, border_color=dark)
 
         # Health bar (all types)
-        bar_w = self.size
+        bar_w = size
+        bar_h = max(1, round(5 * scale))
         hp_pct = self.health / self.max_health
-        bar_x, bar_y = self.x, self.y - 10
-        pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_w, 5), border_radius=2)
+        bar_x, bar_y = x, y - 10 * scale
+        pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, bar_w, bar_h),
+                         border_radius=round(2 * scale))
         if hp_pct > 0:
             bar_color = ACCENT_COLOR if hp_pct < 0.3 else (255, 150, 50)
             pygame.draw.rect(screen, bar_color,
-                             (bar_x, bar_y, int(bar_w * hp_pct), 5), border_radius=2)
+                             (bar_x, bar_y, int(bar_w * hp_pct), bar_h),
+                             border_radius=round(2 * scale))
 
         # Support: draw role icon above health bar
         if self.type == EnemyType.SUPPORT:
-            font = pygame.font.Font(None, 18)
-            label = font.render("SUP", True, (100, 180, 255))
-            screen.blit(label, (self.x, self.y - 22))
+            label = render_text("SUP", round(18 * scale), (100, 180, 255))
+            screen.blit(label, (x, y - 22 * scale))
 
         if self.type == EnemyType.SNIPER and self.state == AIState.AIM:
-            font = pygame.font.Font(None, 18)
-            label = font.render("AIM", True, (255, 200, 50))
-            screen.blit(label, (self.x, self.y - 22))
+            label = render_text("AIM", round(18 * scale), (255, 200, 50))
+            screen.blit(label, (x, y - 22 * scale))
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.size, self.size)
@@ -260,7 +272,7 @@ class Enemy:
     # Private AI helpers — NO GameManager reference
     # ------------------------------------------------------------------
 
-    def _ai_shooter(self, dx, dy, distance, speed):
+    def _ai_shooter(self, dx, dy, distance, speed, frame):
         """Strafe/retreat ranged attacker."""
         if distance > 200:
             self.state = AIState.CHASE
@@ -283,9 +295,9 @@ class Enemy:
                 self.strafe_direction *= -1
 
         should_shoot = False
-        if self.shoot_cooldown == 0 and distance < 400:
+        if frame >= self.shoot_ready_at and distance < 400:
             should_shoot = True
-            self.shoot_cooldown = 90
+            self.shoot_ready_at = frame + 90
 
         return should_shoot, (dx, dy) if should_shoot else None
 
@@ -324,7 +336,7 @@ class Enemy:
         self.x += move_x * speed
         self.y += move_y * speed
 
-    def _ai_sniper(self, dx, dy, distance, speed, player_pos):
+    def _ai_sniper(self, dx, dy, distance, speed, player_pos, frame):
         """
         Keeps range, locks on with a laser indicator for 60 frames, then fires.
         """
@@ -338,7 +350,7 @@ class Enemy:
             self.y += dy * speed
             self.aim_timer = 0
             self.laser_target = None
-        elif self.sniper_cooldown > 0:
+        elif frame < self.sniper_ready_at:
             # Post-shot recovery — hold position
             self.state = AIState.STRAFE
             perp_dx, perp_dy = -dy, dx
@@ -353,7 +365,7 @@ class Enemy:
             if self.aim_timer >= 60:
                 should_shoot = True
                 shoot_dir = (dx, dy)
-                self.sniper_cooldown = 120
+                self.sniper_ready_at = frame + 120
                 self.aim_timer = 0
                 self.laser_target = None
 
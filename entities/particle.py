@@ -2,33 +2,64 @@ import random
 
 import pygame
 
+from config.settings import WIDTH, HEIGHT
+from ui.fonts import sprite
+
+# Particles are cosmetic: their own RNG keeps the seeded simulation RNG
+# independent of how many are emitted (see core/quality.py)
+_fx_rng = random.Random()
+
+# On-screen bounds padded by the largest dot (floats: float-vs-int
+# comparisons are several times slower in the per-frame update)
+_MAX_SIZE = 5.0
+_RIGHT = WIDTH + _MAX_SIZE
+_BOTTOM = HEIGHT + _MAX_SIZE
+
 
 class Particle:
-    def __init__(self, x, y, color, velocity_range=3, gravity=True):
+    def __init__(self, x, y, color, velocity_range=3, gravity=True, priority=0):
         self.x = x
         self.y = y
-        self.vx = random.uniform(-velocity_range, velocity_range)
-        self.vy = random.uniform(-velocity_range, velocity_range)
+        self.vx = _fx_rng.uniform(-velocity_range, velocity_range)
+        self.vy = _fx_rng.uniform(-velocity_range, velocity_range)
         self.life = 30
         self.max_life = 30
         self.color = color
-        self.size = random.randint(2, 5)
+        self.size = _fx_rng.randint(2, int(_MAX_SIZE))
         self.gravity = gravity
+        self.priority = priority   # burst priority for budget culling (core/quality.py)
 
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
+    def update(self) -> bool:
+        """Move one frame; False once the particle is dead or off screen."""
+        self.x = x = self.x + self.vx
+        self.y = y = self.y + self.vy
         self.life -= 1
         if self.gravity:
             self.vy += 0.2
+        return self.life > 0 and -_MAX_SIZE < x < _RIGHT and -_MAX_SIZE < y < _BOTTOM
 
-    def draw(self, screen):
-        alpha = int(255 * (self.life / self.max_life))
-        color = (*self.color, alpha)
-        s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(s, color, (self.size, self.size), self.size)
-        screen.blit(s, (int(self.x - self.size), int(self.y - self.size)))
+    def draw(self, screen, scale=1.0):
+        size = self.size if scale == 1.0 else max(1, round(self.size * scale))
+        s = dot_sprite(size, self.color)
+        s.set_alpha(int(255 * (self.life / self.max_life)))
+        screen.blit(s, (int(self.x * scale - size), int(self.y * scale - size)))
 
     def is_dead(self):
         return self.life <= 0
 
+
+def _build_dot(size, color):
+    s = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(s, (*color, 255), (size, size), size)
+    return s
+
+
+def dot_sprite(size, color):
+    """Opaque particle dot; fades via surface alpha at blit time."""
+    return sprite(("dot", size, color), _build_dot, size, color)
+
+
+def sprite_jobs(colors):
+    """Prewarm jobs for every dot size in *colors*."""
+    return [(("dot", size, color), _build_dot, (size, color))
+            for color in colors for size in range(2, 6)]
@@ -9,7 +9,9 @@ from config.settings import (
     SECONDARY_COLOR,
     TEXT_COLOR,
 )
+from core.modifiers import MUL, Modifier, StatSheet
 from entities.powerup import PowerupType
+from ui.fonts import sprite
 
 
 def draw_rounded_rect(surface, color, rect, radius=10, border=0, border_color=None):
@@ -25,34 +27,104 @@ def draw_rounded_rect(surface, color, rect, radius=10, border=0, border_color=No
         pygame.draw.rect(surface, border_color, rect, border, border_radius=radius)
 
 
+def _build_glow(side, color):
+    glow = pygame.Surface((side, side), pygame.SRCALPHA)
+    pygame.draw.rect(glow, (*color, 50), (0, 0, side, side), border_radius=8)
+    return glow
+
+
+def glow_sprite(side, color):
+    return sprite(("glow", side, color), _build_glow, side, color)
+
+
+# Co-op colours by player id (player 0 keeps the classic look)
+PLAYER_COLORS = [
+    SECONDARY_COLOR,
+    (255, 170, 60),
+    (120, 255, 140),
+    (230, 110, 255),
+]
+
+
+# Modifiable stats and their base values. Weapon stats are rebased by
+# set_weapon_stats(); upgrades (data/upgrades.json) and timed powerups
+# stack modifiers on top.
+BASE_STATS = {
+    "max_health": 100,
+    "speed": 6,
+    "crit_chance": 0.15,
+    "lifesteal": 0,          # HP restored on kill
+    "damage_boost": 1.0,     # multiplier on weapon damage
+    "dash_unlocked": 0,
+    "damage": 0,
+    "fire_rate": 1,          # minimum frames between shots
+    "reload_time": 0,        # milliseconds
+    "max_ammo": 0,
+}
+STAT_MINIMUMS = {"fire_rate": 1, "reload_time": 0, "max_ammo": 1}
+
+DAMAGE_BOOST_MODS = (Modifier("damage_boost", MUL, 2.0),)
+SPEED_BOOST_MODS = (Modifier("speed", MUL, 1.5),)
+
+
 class Player:
     def __init__(self, x, y, player_id=0):
         self.id = player_id
         self.x = x
         self.y = y
         self.size = 45
-        self.base_speed = 6
-        self.speed = self.base_speed
         self.health = 100
-        self.max_health = 100
-        self.color = SECONDARY_COLOR
-        self.invulnerable_time = 0
+        self.color = PLAYER_COLORS[player_id % len(PLAYER_COLORS)]
         self.is_invulnerable = False
 
-        self.damage_boost = 1.0
-        self.damage_boost_timer = 0
-        self.speed_boost_timer = 0
+        # Effect deadlines (sim frames); expiry runs off game.timers
+        self.invulnerable_until = 0
+        self.damage_boost_until = 0
+        self.speed_boost_until = 0
+        self.shield_until = 0
+        self.damage_indicator_until = 0
+
+        # Derived stats, mirrored onto same-named attributes by _refresh_stats()
+        self.stats = StatSheet(BASE_STATS, STAT_MINIMUMS)
+        self._refresh_stats()
+
         self.shield_active = False
-        self.shield_timer = 0
 
         # P3 — Upgrade fields
-        self.crit_chance = 0.15
-        self.lifesteal = 0           # HP restored on kill
-        self.dash_unlocked = False
         self.dash_cooldown = 0
 
         self.damage_direction = None
-        self.damage_indicator_timer = 0
+
+        # Weapon + ammo (set by WeaponSystem.equip; each player fires independently)
+        self.weapon_system = None
+        self.current_ammo = 0
+        self.last_reload = 0
+        self.is_reloading = False
+        self.aim_pos = (WIDTH // 2, HEIGHT // 2)   # last cursor position (burst drip-feed)
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def modify(self, source: str, modifiers):
+        """Apply (or replace) the modifiers from *source*."""
+        self.stats.add(source, modifiers)
+        self._refresh_stats()
+
+    def unmodify(self, source: str):
+        if self.stats.remove(source):
+            self._refresh_stats()
+
+    def set_weapon_stats(self, weapon):
+        """Rebase weapon-derived stats; modifiers on them carry over."""
+        self.stats.set_base(damage=weapon.damage, fire_rate=weapon.fire_rate,
+                            reload_time=weapon.reload_time, max_ammo=weapon.max_ammo)
+        self._refresh_stats()
+
+    def _refresh_stats(self):
+        # Hot paths (movement, firing, hits) read plain attributes
+        self.__dict__.update(self.stats.values)
+        self.hit_damage = int(self.damage * self.damage_boost)
 
     def update(self, keys):
         if keys[pygame.K_w]:
@@ -67,114 +139,115 @@ class Player:
         self.x = max(0, min(WIDTH - self.size, self.x))
         self.y = max(0, min(HEIGHT - self.size, self.y))
 
-        if self.is_invulnerable:
-            self.invulnerable_time -= 1
-            if self.invulnerable_time <= 0:
-                self.is_invulnerable = False
-
-        if self.damage_boost_timer > 0:
-            self.damage_boost_timer -= 1
-            if self.damage_boost_timer == 0:
-                self.damage_boost = 1.0
-
-        if self.speed_boost_timer > 0:
-            self.speed_boost_timer -= 1
-            self.speed = self.base_speed * 1.5
-        else:
-            self.speed = self.base_speed
-
-        if self.shield_timer > 0:
-            self.shield_timer -= 1
-            if self.shield_timer == 0:
-                self.shield_active = False
-
-        if self.damage_indicator_timer > 0:
-            self.damage_indicator_timer -= 1
-
-    def take_damage(self, amount, direction=None):
+    def take_damage(self, amount, direction, timers):
         if self.shield_active:
             self.shield_active = False
-            self.shield_timer = 0
+            self.shield_until = 0
             return False
 
         if not self.is_invulnerable:
             self.health -= amount
             self.is_invulnerable = True
-            self.invulnerable_time = 30
+            self.invulnerable_until = timers.schedule(30, "players", "end_invulnerability", self.id)
             self.damage_direction = direction
-            self.damage_indicator_timer = 30
+            self.damage_indicator_until = self.invulnerable_until
             return True
         return False
 
-    def apply_powerup(self, powerup_type):
+    def apply_powerup(self, powerup_type, timers):
         if powerup_type == PowerupType.HEALTH:
             self.health = min(self.max_health, self.health + 30)
         elif powerup_type == PowerupType.DAMAGE_BOOST:
-            self.damage_boost = 2.0
-            self.damage_boost_timer = 300
+            self.modify("powerup.damage_boost", DAMAGE_BOOST_MODS)
+            self.damage_boost_until = timers.schedule(300, "players", "end_damage_boost", self.id)
         elif powerup_type == PowerupType.SPEED_BOOST:
-            self.speed_boost_timer = 300
+            self.modify("powerup.speed_boost", SPEED_BOOST_MODS)
+            self.speed_boost_until = timers.schedule(300, "players", "end_speed_boost", self.id)
         elif powerup_type == PowerupType.SHIELD:
             self.shield_active = True
-            self.shield_timer = 300
+            self.shield_until = timers.schedule(300, "players", "end_shield", self.id)
+
+    # ------------------------------------------------------------------
+    # Timer callbacks (a pickup or hit that moved the deadline wins)
+    # ------------------------------------------------------------------
+
+    def end_invulnerability(self, game):
+        if game.frame >= self.invulnerable_until:
+            self.is_invulnerable = False
+
+    def end_damage_boost(self, game):
+        if game.frame >= self.damage_boost_until:
+            self.unmodify("powerup.damage_boost")
+
+    def end_speed_boost(self, game):
+        if game.frame >= self.speed_boost_until:
+            self.unmodify("powerup.speed_boost")
+
+    def end_shield(self, game):
+        if game.frame >= self.shield_until:
+            self.shield_active = False
+
+    def fire_burst(self, game):
+        self.weapon_system.burst_shot(game, self)
+
+    def draw(self, screen, particles, frame, glow=True, scale=1.0):
+        """*scale* maps arena coordinates onto *screen* (see ui/renderer.py)."""
+        x, y, size = self.x * scale, self.y * scale, self.size * scale
+        stroke = max(1, round(2 * scale))
 
-    def draw(self, screen, particles):
         if self.shield_active:
             shield_pulse = math.sin(pygame.time.get_ticks() * 0.01) * 5
             pygame.draw.circle(
                 screen,
                 (200, 100, 255),
-                (int(self.x + self.size // 2), int(self.y + self.size // 2)),
-                int(self.size // 2 + 15 + shield_pulse),
-                2,
+                (int(x + size // 2), int(y + size // 2)),
+                int((self.size // 2 + 15 + shield_pulse) * scale),
+                stroke,
             )
 
-        if self.damage_indicator_timer > 0 and self.damage_direction:
-            center_x = self.x + self.size // 2
-            center_y = self.y + self.size // 2
+        indicator_left = self.damage_indicator_until - frame
+        if indicator_left > 0 and self.damage_direction:
+            center_x = x + size // 2
+            center_y = y + size // 2
             angle = math.atan2(self.damage_direction[1], self.damage_direction[0])
 
-            indicator_length = 40
+            indicator_length = 40 * scale
             end_x = center_x + math.cos(angle) * indicator_length
             end_y = center_y + math.sin(angle) * indicator_length
 
-            alpha = int(255 * (self.damage_indicator_timer / 30))
-            indicator_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            alpha = int(255 * (indicator_left / 30))
+            indicator_surf = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
             pygame.draw.line(
                 indicator_surf,
                 (*ACCENT_COLOR, alpha),
                 (center_x, center_y),
                 (end_x, end_y),
-                5,
+                max(1, round(5 * scale)),
             )
             screen.blit(indicator_surf, (0, 0))
 
-        if not self.is_invulnerable or (self.invulnerable_time // 5) % 2 == 0:
+        if not self.is_invulnerable or ((self.invulnerable_until - frame) // 5) % 2 == 0:
             glow_color = self.color
             if self.damage_boost > 1.0:
                 glow_color = (255, 100, 100)
 
-            glow = pygame.Surface((self.size + 20, self.size + 20), pygame.SRCALPHA)
-            pygame.draw.rect(
-                glow,
-                (*glow_color, 50),
-                (0, 0, self.size + 20, self.size + 20),
-                border_radius=8,
-            )
-            screen.blit(glow, (self.x - 10, self.y - 10))
+            if glow:
+                screen.blit(glow_sprite(round((self.size + 20) * scale), glow_color),
+                            (x - 10 * scale, y - 10 * scale))
 
+            radius = round(6 * scale)
             draw_rounded_rect(
                 screen,
                 glow_color,
-                (self.x, self.y, self.size, self.size),
-                radius=6,
+                (x, y, size, size),
+                radius=radius,
             )
             draw_rounded_rect(
                 screen,
                 TEXT_COLOR,
-                (self.x, self.y, self.size, self.size),
-                radius=6,
-                border=2,
+                (x, y, size, size),
+                radius=radius,
+                border=stroke,
                 border_color=TEXT_COLOR,
             )
 
@@ -187,3 +260,9 @@ class Player:
     def is_alive(self):
         return self.health > 0
 
+
+def sprite_jobs(size=45):
+    """Prewarm jobs for every player glow colour."""
+    side = size + 20
+    return [(("glow", side, color), _build_glow, (side, color))
+            for color in PLAYER_COLORS + [(255, 100, 100)]]
@@ -3,6 +3,8 @@ from enum import Enum
 
 import pygame
 
+from ui.fonts import render_text, sprite
+
 
 class PowerupType(Enum):
     HEALTH = 1
@@ -12,14 +14,20 @@ class PowerupType(Enum):
     SHIELD = 5
 
 
+LIFETIME = 600   # frames on the ground before it vanishes
+
+
 class Powerup:
-    def __init__(self, x, y, powerup_type):
+    def __init__(self, x, y, powerup_type, frame=0):
         self.x = x
         self.y = y
         self.type = powerup_type
         self.size = 25
-        self.lifetime = 600
-        self.pulse = 0
+        # Removed by GameManager._expire_powerups (a timer-wheel entry);
+        # the pulse animation is derived from the frame, so there is no
+        # per-frame update
+        self.born = frame
+        self.expires_at = frame + LIFETIME
 
         self.colors = {
             PowerupType.HEALTH: (100, 255, 100),
@@ -29,22 +37,17 @@ class Powerup:
             PowerupType.SHIELD: (200, 100, 255),
         }
 
-    def update(self):
-        self.lifetime -= 1
-        self.pulse += 0.1
-
-    def draw(self, screen):
-        scale = 1 + math.sin(self.pulse) * 0.15
-        size = int(self.size * scale)
+    def draw(self, screen, frame, glow=True, scale=1.0):
+        pulse = 1 + math.sin((frame - self.born) * 0.1) * 0.15
+        size = int(self.size * pulse * scale)
         color = self.colors[self.type]
+        x, y = self.x * scale, self.y * scale
 
-        glow = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (*color, 50), (size * 1.5, size * 1.5), size * 1.5)
-        screen.blit(glow, (self.x - size * 1.5, self.y - size * 1.5))
+        if glow:
+            screen.blit(halo_sprite(size, color), (x - size * 1.5, y - size * 1.5))
 
-        pygame.draw.circle(screen, color, (int(self.x), int(self.y)), size, 3)
+        pygame.draw.circle(screen, color, (int(x), int(y)), size, max(1, round(3 * scale)))
 
-        font = pygame.font.Font(None, 20)
         symbols = {
             PowerupType.HEALTH: "+",
             PowerupType.AMMO: "A",
@@ -52,8 +55,8 @@ class Powerup:
             PowerupType.SPEED_BOOST: "S",
             PowerupType.SHIELD: "X",
         }
-        text = font.render(symbols[self.type], True, color)
-        screen.blit(text, (int(self.x - 6), int(self.y - 8)))
+        text = render_text(symbols[self.type], round(20 * scale), color)
+        screen.blit(text, (int(x - 6 * scale), int(y - 8 * scale)))
 
     def get_rect(self):
         return pygame.Rect(
@@ -63,6 +66,23 @@ class Powerup:
             self.size * 2,
         )
 
-    def is_expired(self):
-        return self.lifetime <= 0
+    def is_expired(self, frame):
+        return frame >= self.expires_at
+
+
+def _build_halo(size, color):
+    glow = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
+    pygame.draw.circle(glow, (*color, 50), (size * 1.5, size * 1.5), size * 1.5)
+    return glow
+
+
+def halo_sprite(size, color):
+    return sprite(("halo", size, color), _build_halo, size, color)
+
 
+def sprite_jobs():
+    """Prewarm jobs for every pulse size and colour."""
+    colors = Powerup(0, 0, PowerupType.HEALTH).colors.values()
+    sizes = {int(25 * (1 + k / 100 * 0.15)) for k in range(-100, 101)}
+    return [(("halo", size, color), _build_halo, (size, color))
+            for color in colors for size in sorted(sizes)]
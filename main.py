@@ -1,129 +1,325 @@
-import pygame
+from core.startup import StartupTimeline
+
+timeline = StartupTimeline()   # started before the heavy imports below
+
+import argparse
+import json
 import sys
-import random
+from dataclasses import replace
+
+# pygame.pkgdata imports pkg_resources (~70-150 ms) only to locate the
+# bundled font; without it pygame falls back to the path next to its own
+# files. The block only covers pygame's import: anything imported later
+# gets the real pkg_resources.
+_blocked = "pkg_resources" not in sys.modules
+if _blocked:
+    sys.modules["pkg_resources"] = None
+try:
+    import pygame
+finally:
+    if _blocked:
+        del sys.modules["pkg_resources"]
 
-from config.settings import WIDTH, HEIGHT, FPS, BG_COLOR, STATE_PLAYING, STATE_GAME_OVER, STATE_UPGRADE
+from config.settings import (
+    WIDTH, HEIGHT, FPS, STATE_GAME_OVER, BG_COLOR, TEXT_COLOR, UI_BORDER, SECONDARY_COLOR,
+)
+from core import data_loader
+from core.frame_input import FrameInput
+from core.frame_pacer import PACING_MODES, FramePacer
 from core.game_manager import GameManager
-from systems.upgrade_system import apply_upgrade
-from ui.crosshair import draw_crosshair
-from ui.hud import draw_ui
-from ui.menus import draw_game_over
-from ui.upgrade_menu import draw_upgrade_menu
+from ui import fonts
+from ui.profiler_overlay import draw_profiler_overlay
+from ui.renderer import MIN_RENDER_SCALE, render_frame
+
+parser = argparse.ArgumentParser(description="Pulse Arena")
+parser.add_argument("--horde", action="store_true",
+                    help="run the horde stress test and write horde_curve.csv")
+parser.add_argument("--alloc", action="store_true",
+                    help="account allocations per system (tracemalloc) and write alloc_report.json")
+parser.add_argument("--combat-log", metavar="PATH",
+                    help="append combat events to PATH as JSON lines (written off-thread)")
+parser.add_argument("--record", metavar="PATH",
+                    help="record the current run to PATH as a replay (saved on restart / quit)")
+parser.add_argument("--replay", metavar="PATH",
+                    help="play back a replay uncapped (LEFT/RIGHT seek 5s)")
+parser.add_argument("--players", type=int, default=1,
+                    help="co-op players; you are P1, the rest are autopilot teammates")
+parser.add_argument("--dev", action="store_true",
+                    help="hot-reload data/*.json into the running match when edited")
+parser.add_argument("--pacing", choices=PACING_MODES, default="tick",
+                    help="frame pacing: 'tick' sleeps at the top of the frame, 'late' sleeps until "
+                         "just before the present deadline and samples input last")
+parser.add_argument("--busy-loop", action="store_true",
+                    help="spin instead of sleeping through the end of each frame wait (more CPU, "
+                         "less jitter)")
+parser.add_argument("--startup-report", action="store_true",
+                    help="print the startup timeline (import, init, data, prewarm, first frame)")
+parser.add_argument("--render-scale", type=float, default=1.0, metavar="S",
+                    help="draw the world at S x native resolution (0.25-1) and upscale it; "
+                         "the HUD stays native")
+parser.add_argument("--scaled", action="store_true",
+                    help="open a resizable SCALED window (the GPU stretches the frame to it)")
+parser.add_argument("--split", action="store_true",
+                    help="run the simulation in a second process and only draw in this one "
+                         "(state over shared memory)")
+parser.add_argument("--mute", action="store_true",
+                    help="no sound effects (the mixer is never opened)")
+args = parser.parse_args()
+if not MIN_RENDER_SCALE <= args.render_scale <= 1.0:
+    parser.error(f"--render-scale must be between {MIN_RENDER_SCALE} and 1")
+
+split = None
+if args.split:
+    from core import split as split_mode
+    for flag in ("horde", "alloc", "combat_log", "record", "replay", "dev"):
+        if getattr(args, flag):
+            parser.error(f"--split does not support --{flag.replace('_', '-')}")
+    if not split_mode.available():
+        parser.error("--split needs fork() (not available on this platform)")
+    # Fork the sim process now: before the window and any worker thread exist
+    split = split_mode.SplitGame(players=args.players)
+timeline.mark("import")
 
-pygame.init()
+# Only the modules the game uses: no joystick (pygame.init() brings up every
+# subsystem). The timer needs no init of its own; the mixer is opened by the
+# audio system. Split mode has no audio: gameplay events fire in the sim process.
+pygame.display.init()
+pygame.font.init()
+if args.mute or split:
+    audio = None
+else:
+    from core.audio import AudioSystem
+    audio = AudioSystem()
+    if audio.error:
+        print(f"audio disabled: {audio.error}", file=sys.stderr)
 
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED if args.scaled else 0)
 pygame.display.set_caption("Pulse Arena")
-clock = pygame.time.Clock()
+timeline.mark("init")
+
+
+def draw_splash(progress: float):
+    """Title and a progress bar while caches warm up."""
+    pygame.event.pump()   # keep the window responsive
+    screen.fill(BG_COLOR)
+    title = fonts.render_text("PULSE ARENA", 96, TEXT_COLOR)
+    screen.blit(title, title.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 40)))
+    bar = pygame.Rect(0, 0, 320, 8)
+    bar.center = (WIDTH // 2, HEIGHT // 2 + 40)
+    pygame.draw.rect(screen, UI_BORDER, bar, 1, border_radius=4)
+    fill = bar.inflate(-2, -2)
+    fill.width = int(fill.width * progress)
+    pygame.draw.rect(screen, SECONDARY_COLOR, fill, border_radius=3)
+    pygame.display.flip()
+
 
+# Fonts, static labels and entity sprites warm up on a worker thread while
+# the data files load and the match is built
+from entities import damage_number, particle, player, powerup
 
-game = GameManager()
+prewarm = fonts.start_prewarm(
+    particle.sprite_jobs([e.color for e in data_loader.get_all_enemies().values()])
+    + player.sprite_jobs() + powerup.sprite_jobs() + damage_number.sprite_jobs()
+)
+draw_splash(0.0)
+
+if args.replay:
+    from core.replay import ReplayPlayer
+    replay = ReplayPlayer(args.replay)
+else:
+    replay = None
+if split:
+    try:
+        split.wait_ready()
+    except split_mode.SimExited as exc:
+        split.close()
+        sys.exit(f"--split: {exc}")
+    game = split
+else:
+    game = GameManager(seed=replay.seed if replay else None,
+                       players=replay.players if replay else args.players)
+if replay:
+    replay.start(game)
+if args.horde:
+    from core.modes.horde_mode import HordeMode
+    game.active_mode = HordeMode()
+    game.quality.set_preset("high")   # the stress test measures full-quality effects
+else:
+    game.quality.set_preset(game.stats.profile.get("quality", "auto"))
+timeline.mark("data")
+
+while prewarm.is_alive():
+    draw_splash(prewarm.fraction)
+    prewarm.join(1 / FPS)
+timeline.add("prewarm", prewarm.elapsed_ms)
+if prewarm.error is not None:
+    print(f"cache prewarm failed (continuing cold): {prewarm.error}", file=sys.stderr)
+timeline.mark("prewarm")
+game.frame_stats.attach_gc()
+if args.alloc:
+    game.profiler.track_allocations()
+
+combat_log = None
+if args.combat_log:
+    from core.event_sinks import JsonlFileSink
+    from core.events import EnemyHit, EnemyKilled, PlayerDamaged, PowerupPicked, UpgradeApplied
+    combat_log = JsonlFileSink(args.combat_log)
+    combat_log.attach(game.event_bus, EnemyHit, EnemyKilled, PlayerDamaged,
+                      PowerupPicked, UpgradeApplied)
+if audio is not None:
+    audio.attach(game.event_bus)
 pygame.mouse.set_visible(False)
 
+if args.record:
+    from core.replay import ReplayRecorder
+    recorder = ReplayRecorder(game, FPS)
+else:
+    recorder = None
+# Teammates' autopilot runs wherever the simulation does
+teammates = args.players > 1 and not replay and not split
+if teammates:
+    from core.autopilot import kite
+
+if args.dev:
+    for kind in ("enemies", "weapons", "powerups", "upgrades"):
+        data_loader.subscribe(kind, game.on_data_reloaded)
+
 running = True
 mouse_held = False
+last_data_poll = 0
+UPGRADE_KEYS = {pygame.K_1: 0, pygame.K_2: 1, pygame.K_3: 2}
+
+# Horde stress test and replays run uncapped
+pacer = FramePacer(0 if args.horde or replay else FPS, args.pacing, args.busy_loop)
+
+# The split game is closed (and its shared memory unlinked) whatever ends the loop;
+# a sim process that dies mid-run ends it with a message instead of a traceback
+exit_status = 0
+sim_exited = split_mode.SimExited if split else ()
+try:
+    while running:
+        pacer.wait()
+
+        fire_released = reload_pressed = restart_pressed = False
+        upgrade_choice = -1
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
 
-while running:
-    clock.tick(FPS)
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                if event.button == 1:
+                    mouse_held = True
 
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
+            if event.type == pygame.MOUSEBUTTONUP:
+                if event.button == 1:
+                    mouse_held = False
+                    fire_released = True   # Railgun fires on mouse release
+
+            if event.type == pygame.KEYDOWN:
+                # F3: toggle profiler overlay (timing scopes are free while off)
+                if event.key == pygame.K_F3:
+                    game.profiler.toggle()
+
+                # F4: cycle effect quality (auto / high / medium / low / minimal)
+                if event.key == pygame.K_F4 and not args.horde:
+                    game.stats.set_preference("quality", game.quality.cycle_preset())
+
+                if event.key == pygame.K_r:
+                    reload_pressed = True
+
+                if event.key == pygame.K_SPACE:
+                    restart_pressed = True
+
+                # Upgrade selection: [1] [2] [3]
+                if event.key in UPGRADE_KEYS:
+                    upgrade_choice = UPGRADE_KEYS[event.key]
+
+                # Replay seeking
+                if replay and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                    delta = FPS * 5 if event.key == pygame.K_RIGHT else -FPS * 5
+                    replay.seek(game, replay.frame + delta)
+
+        if replay:
+            inp = replay.input_at(replay.frame) if not replay.finished else None
+            with game.profiler.scope("update"):
+                replay.step(game)
+            mouse_pos = inp.mouse_pos if inp else game.players[0].aim_pos
+        else:
+            inp = FrameInput.sample(mouse_held, fire_released, reload_pressed,
+                                    restart_pressed, upgrade_choice)
+            pacer.sampled()
+            # Teammates fight on their own; upgrade picks stay with P1
+            inputs = [inp]
+            if teammates:
+                inputs += [replace(kite(game, mate), upgrade_choice=-1)
+                           for mate in game.players[1:]]
+            restarting = inp.restart and game.state == STATE_GAME_OVER
+            if recorder:
+                recorder.record(game, inputs)
+                if restarting:
+                    recorder.save(args.record)
+
+            # Input + update (simulation skips when state != STATE_PLAYING)
+            with game.profiler.scope("update"):
+                game.step(inputs)
+
+            if recorder and restarting:
+                recorder = ReplayRecorder(game, FPS)   # fresh run, fresh seed
+            mouse_pos = inp.mouse_pos
+
+        # Draw
+        with game.profiler.scope("render"):
+            render_frame(screen, game, mouse_pos, args.render_scale)
+        draw_profiler_overlay(screen, game)
+
+        with game.profiler.scope("present"):
+            pygame.display.flip()
+        latency_ms = pacer.presented()
+        if latency_ms is not None:
+            game.frame_stats.record_latency(latency_ms)
+        game.quality.observe(pacer.busy_ms)
+        game.profiler.end_frame()
+        game.frame_stats.tick()
+
+        if "first_frame" not in timeline.phases:
+            timeline.mark("first_frame")
+            if args.startup_report or timeline.over_budget:
+                print(timeline.report())
+
+        if args.dev and pygame.time.get_ticks() // 1000 != last_data_poll:
+            last_data_poll = pygame.time.get_ticks() // 1000
+            data_loader.poll_changes()
+
+        if args.horde and game.active_mode.finished:
+            for system, count in game.active_mode.breaking_points().items():
+                print(f"{system:>10}: over budget at {count if count is not None else '-'} enemies")
             running = False
+except sim_exited as exc:
+    print(f"--split: {exc}", file=sys.stderr)
+    exit_status = 1
+finally:
+    if split:
+        split.close()
 
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1:
-                mouse_held = True
-
-        if event.type == pygame.MOUSEBUTTONUP:
-            if event.button == 1:
-                mouse_held = False
-                # Railgun fires on mouse release
-                if game.state == STATE_PLAYING:
-                    game.weapon_system.handle_shoot(game, pygame.mouse.get_pos(), mouse_held=False)
-
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_r and game.state == STATE_PLAYING:
-                game.reload()
-
-            if event.key == pygame.K_SPACE and game.state == STATE_GAME_OVER:
-                game.restart()
-
-            # Upgrade selection: [1] [2] [3]
-            if game.state == STATE_UPGRADE and game.pending_upgrades:
-                chosen = None
-                if event.key == pygame.K_1:
-                    chosen = 0
-                elif event.key == pygame.K_2:
-                    chosen = 1
-                elif event.key == pygame.K_3:
-                    chosen = 2
-                if chosen is not None and chosen < len(game.pending_upgrades):
-                    apply_upgrade(game.pending_upgrades[chosen], game.players[0], game)
-                    game.pending_upgrades = []
-                    game.state = STATE_PLAYING
-
-    # Continuous shooting while mouse held
-    if mouse_held and game.state == STATE_PLAYING:
-        game.weapon_system.handle_shoot(game, pygame.mouse.get_pos(), mouse_held=True)
-
-    # Update (skips when state != STATE_PLAYING)
-    game.update()
-
-    # Draw
-    screen.fill(BG_COLOR)
+if recorder is not None:
+    recorder.save(args.record)
 
-    # Screen flash effect
-    if game.combat.screen_flash > 0:
-        flash_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        alpha = int(30 * (game.combat.screen_flash / 5))
-        flash_surf.fill((255, 255, 255, alpha))
-        screen.blit(flash_surf, (0, 0))
-
-    # Grid background
-    grid_spacing = 50
-    grid_color = (25, 30, 40)
-    for x in range(0, WIDTH, grid_spacing):
-        pygame.draw.line(screen, grid_color, (x, 0), (x, HEIGHT), 1)
-    for y in range(0, HEIGHT, grid_spacing):
-        pygame.draw.line(screen, grid_color, (0, y), (WIDTH, y), 1)
-
-    # Screen shake offset
-    shake_offset = (0, 0)
-    if game.screen_shake > 0:
-        shake_offset = (random.randint(-game.screen_shake, game.screen_shake),
-                       random.randint(-game.screen_shake, game.screen_shake))
-        screen.scroll(*shake_offset)
-
-    # Draw game objects
-    for player in game.players:
-        player.draw(screen, game.particles)
-
-    for enemy in game.enemies:
-        enemy.draw(screen)
-
-    for bullet in game.enemy_bullets:
-        bullet.draw(screen)
-
-    for powerup in game.powerups:
-        powerup.draw(screen)
-
-    for particle in game.particles:
-        particle.draw(screen)
-
-    for dn in game.damage_numbers:
-        dn.draw(screen)
-
-    # Draw UI
-    draw_ui(screen, game)
-    draw_crosshair(screen, pygame.mouse.get_pos(), game.combat.hitmarker_timer > 0,
-                   game.weapon_system.crosshair_spread)
-
-    if game.state == STATE_GAME_OVER:
-        draw_game_over(screen, game)
-    elif game.state == STATE_UPGRADE and game.pending_upgrades:
-        draw_upgrade_menu(screen, game.pending_upgrades, game.upgrade_hovered)
+if combat_log is not None:
+    combat_log.close()
 
-    pygame.display.flip()
+if audio is not None:
+    audio.close()
+
+game.stats.close()   # flush queued runs, compact profile.json (stops the sim process in split mode)
+
+if args.alloc:
+    report = game.profiler.alloc.report()
+    with open("alloc_report.json", "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    for name, row in list(report.items())[:10]:
+        print(f"{name:>24}: {row['peak_bytes_per_frame'] / 1024:8.1f} kB/frame transient, "
+              f"{row['retained_blocks_per_frame']:8.1f} blocks/frame retained")
 
 pygame.quit()
-sys.exit()
+sys.exit(exit_status)
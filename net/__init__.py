@@ -0,0 +1,5 @@
+"""
+net
+UDP server/client world replication for co-op (localhost-testable).
+Run: python -m net.server / python -m net.client
+"""
@@ -0,0 +1,217 @@
+"""
+net/client.py
+Replication client: sends one input packet per frame (carrying the ack of
+the newest snapshot it holds) and rebuilds the world view from delta
+snapshots.
+
+    python -m net.client                         # connect to localhost
+    python -m net.client --server 10.0.0.5:47800
+"""
+import argparse
+import socket
+import time
+from collections import deque
+
+from config.settings import FPS
+from core.replay import pack_input
+from net.protocol import (
+    CODECS,
+    DEFAULT_PORT,
+    KIND_BULLET,
+    KIND_ENEMY,
+    KIND_PLAYER,
+    KIND_POWERUP,
+    MSG_BYE,
+    MSG_HELLO,
+    MSG_SNAPSHOT,
+    NO_BASELINE,
+    decode_snapshot,
+    pack_input_packet,
+)
+
+_MAX_VIEWS = 64
+
+
+class ReplicationClient:
+    def __init__(self, server=("127.0.0.1", DEFAULT_PORT)):
+        self.server = server
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+
+        self.input_seq = 0
+        self.seq = NO_BASELINE              # newest snapshot applied
+        self.view: dict = {}                # net_id -> (kind, quantized values)
+        self.header = {"frame": 0, "score": 0, "wave": 1, "state": "playing"}
+        self._views: dict[int, dict] = {}   # received views, kept as possible baselines
+
+        # Counters
+        self.packets_received = 0
+        self.bytes_received = 0
+        self.packets_dropped = 0            # stale or missing baseline
+        self.decode_ms_total = 0.0
+        self._recent = deque()              # (time, bytes) over the last second
+
+    def connect(self):
+        self.sock.sendto(bytes((MSG_HELLO,)), self.server)
+
+    def close(self):
+        try:
+            self.sock.sendto(bytes((MSG_BYE,)), self.server)
+        except OSError:
+            pass
+        self.sock.close()
+
+    def send_input(self, inp):
+        self.input_seq += 1
+        self.sock.sendto(pack_input_packet(self.input_seq, self.seq, pack_input(inp)), self.server)
+
+    def poll(self) -> bool:
+        """Apply every queued snapshot; True if the view changed."""
+        changed = False
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(65536)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            if data and data[0] == MSG_SNAPSHOT:
+                changed |= self._apply(data)
+        return changed
+
+    def _apply(self, data: bytes) -> bool:
+        self.packets_received += 1
+        self.bytes_received += len(data)
+        now = time.perf_counter()
+        self._recent.append((now, len(data)))
+        while self._recent and self._recent[0][0] < now - 1.0:
+            self._recent.popleft()
+
+        start = time.perf_counter()
+        seq = int.from_bytes(data[1:5], "little")
+        baseline_seq = int.from_bytes(data[5:9], "little")
+        if self.seq != NO_BASELINE and seq <= self.seq:
+            self.packets_dropped += 1
+            return False
+        if baseline_seq != NO_BASELINE and baseline_seq not in self._views:
+            self.packets_dropped += 1
+            return False
+
+        seq, _, header, view = decode_snapshot(data, self._views.get(baseline_seq))
+        self.seq = seq
+        self.view = view
+        self.header = header
+        self._views[seq] = view
+        # The server's baseline only moves forward: older views are dead
+        if baseline_seq != NO_BASELINE:
+            for old in [s for s in self._views if s < baseline_seq]:
+                del self._views[old]
+        while len(self._views) > _MAX_VIEWS:
+            del self._views[min(self._views)]
+        self.decode_ms_total += (time.perf_counter() - start) * 1000.0
+        return True
+
+    def entities(self, kind: int):
+        """Dequantized field dicts for every entity of *kind* in the view."""
+        codec = CODECS[kind]
+        return [codec.dequantize(values) for k, values in self.view.values() if k == kind]
+
+    def bandwidth(self) -> int:
+        """Bytes received over the last second."""
+        return sum(n for _, n in self._recent)
+
+    def stats(self) -> dict:
+        return {
+            "bytes_per_sec": self.bandwidth(),
+            "packets_received": self.packets_received,
+            "bytes_received": self.bytes_received,
+            "packets_dropped": self.packets_dropped,
+            "decode_ms_avg": self.decode_ms_total / max(self.packets_received, 1),
+            "entities": len(self.view),
+        }
+
+
+# ----------------------------------------------------------------------
+# Minimal viewer
+# ----------------------------------------------------------------------
+
+def draw_view(screen, client, font):
+    import pygame
+
+    from config.settings import BG_COLOR, SECONDARY_COLOR, TEXT_COLOR
+    from core.data_loader import get_enemy_stats
+
+    screen.fill(BG_COLOR)
+    for p in client.entities(KIND_POWERUP):
+        pygame.draw.circle(screen, (200, 200, 255), (int(p["x"]), int(p["y"])), 25, 3)
+    for e in client.entities(KIND_ENEMY):
+        stats = get_enemy_stats(e["type"])
+        size = stats.size
+        color = (255, 255, 255) if e["hit_flash"] else stats.color
+        pygame.draw.rect(screen, color, (int(e["x"]), int(e["y"]), size, size), border_radius=6)
+    for b in client.entities(KIND_BULLET):
+        pygame.draw.circle(screen, (255, 150, 50), (int(b["x"]), int(b["y"])), 5)
+    for p in client.entities(KIND_PLAYER):
+        pygame.draw.rect(screen, SECONDARY_COLOR, (int(p["x"]), int(p["y"]), 45, 45), border_radius=10)
+
+    h = client.header
+    s = client.stats()
+    text = (f"wave {h['wave']}  score {h['score']}  {h['state']}   "
+            f"{s['bytes_per_sec'] / 1024:.1f} kB/s  {s['entities']} entities  "
+            f"dropped {s['packets_dropped']}")
+    screen.blit(font.render(text, True, TEXT_COLOR), (10, 10))
+
+
+def main(argv=None):
+    import pygame
+
+    from config.settings import HEIGHT, WIDTH
+    from core.frame_input import FrameInput
+
+    parser = argparse.ArgumentParser(prog="python -m net.client")
+    parser.add_argument("--server", default=f"127.0.0.1:{DEFAULT_PORT}")
+    args = parser.parse_args(argv)
+    host, _, port = args.server.rpartition(":")
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Pulse Arena — client")
+    clock = pygame.time.Clock()
+    font = pygame.font.Font(None, 24)
+
+    client = ReplicationClient((host, int(port)))
+    client.connect()
+
+    running = True
+    mouse_held = False
+    upgrade_keys = {pygame.K_1: 0, pygame.K_2: 1, pygame.K_3: 2}
+    while running:
+        clock.tick(FPS)
+        fire_released = reload_pressed = restart_pressed = False
+        upgrade_choice = -1
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                mouse_held = True
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                mouse_held = False
+                fire_released = True
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:
+                    reload_pressed = True
+                elif event.key == pygame.K_SPACE:
+                    restart_pressed = True
+                elif event.key in upgrade_keys:
+                    upgrade_choice = upgrade_keys[event.key]
+
+        client.send_input(FrameInput.sample(mouse_held, fire_released, reload_pressed,
+                                            restart_pressed, upgrade_choice))
+        client.poll()
+        draw_view(screen, client, font)
+        pygame.display.flip()
+
+    client.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
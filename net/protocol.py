@@ -0,0 +1,273 @@
+"""
+net/protocol.py
+Wire format for server -> client world replication.
+
+Entities are quantized by a per-type EntityCodec into small integer
+tuples. A snapshot is a *view* {net_id: (kind, values)}; each packet is the
+client's new view delta-encoded against the last view it acknowledged
+(its baseline), so unchanged entities cost nothing and changed ones only
+carry the fields that differ.
+
+Client -> server
+    HELLO   type u8
+    INPUT   type u8, input seq u32, acked snapshot seq u32, FrameInput (replay record)
+    BYE     type u8
+
+Server -> client
+    SNAPSHOT  header (see _SNAP_HEADER), removed net_ids u16 * n,
+              then records: net_id u16, kind u8 (bit 7 = full record),
+              field mask u8, the masked fields in codec order
+"""
+import struct
+
+from config.settings import FPS, STATE_GAME_OVER, STATE_PLAYING, STATE_UPGRADE
+from entities.enemy import EnemyType
+
+DEFAULT_PORT = 47800
+DEFAULT_BUDGET = 1200          # payload bytes per snapshot (stays under a typical MTU)
+SEND_INTERVAL = 2              # simulation frames per snapshot (30 Hz at 60 FPS)
+CLIENT_TIMEOUT = 5 * FPS       # frames without a packet before a client is dropped
+
+NO_BASELINE = 0xFFFFFFFF
+
+MSG_HELLO = 0x01
+MSG_INPUT = 0x02
+MSG_BYE = 0x03
+MSG_SNAPSHOT = 0x10
+
+# type, seq, baseline seq, server frame, score, wave, state, removed count, record count
+_SNAP_HEADER = struct.Struct("<BIIIIHBHH")
+_INPUT_HEADER = struct.Struct("<BII")
+_RECORD_HEADER = struct.Struct("<HBB")
+_NET_ID = struct.Struct("<H")
+
+_FULL = 0x80
+
+# Game state strings travel as one byte
+_STATES = (STATE_PLAYING, STATE_GAME_OVER, STATE_UPGRADE)
+
+
+def encode_state(state: str) -> int:
+    return _STATES.index(state) if state in _STATES else 0xFF
+
+
+def decode_state(code: int) -> str:
+    return _STATES[code] if code < len(_STATES) else "unknown"
+
+
+# ----------------------------------------------------------------------
+# Quantization
+# ----------------------------------------------------------------------
+
+_POS_OFFSET = 64      # bullets live up to 50 px off-screen
+_POS_SCALE = 8        # 1/8 px precision
+
+
+def q_pos(v: float) -> int:
+    q = int((v + _POS_OFFSET) * _POS_SCALE + 0.5)
+    return q if 0 <= q <= 0xFFFF else (0 if q < 0 else 0xFFFF)
+
+
+def dq_pos(q: int) -> float:
+    return q / _POS_SCALE - _POS_OFFSET
+
+
+def q_u8(v) -> int:
+    v = int(v)
+    return v if 0 <= v <= 0xFF else (0 if v < 0 else 0xFF)
+
+
+def q_u16(v) -> int:
+    v = int(v)
+    return v if 0 <= v <= 0xFFFF else (0 if v < 0 else 0xFFFF)
+
+
+def _ident(q):
+    return q
+
+
+class EntityCodec:
+    """
+    Field layout for one entity kind. *fields* is a sequence of
+    (name, struct format, dequantize(int) -> value), at most 8 (one mask
+    byte); *quantize(obj)* returns the matching tuple of ints in one call.
+    """
+
+    def __init__(self, kind: int, name: str, fields, quantize):
+        if len(fields) > 8:
+            raise ValueError(f"{name}: at most 8 replicated fields")
+        self.kind = kind
+        self.name = name
+        self.quantize = quantize
+        self.field_names = tuple(f[0] for f in fields)
+        self._structs = tuple(struct.Struct("<" + f[1]) for f in fields)
+        self._dequantizers = tuple(f[2] for f in fields)
+        self.full_mask = (1 << len(fields)) - 1
+
+    def dequantize(self, values) -> dict:
+        return {name: dq(v) for name, dq, v in zip(self.field_names, self._dequantizers, values)}
+
+    def diff_mask(self, values, baseline) -> int:
+        mask = 0
+        for i, (a, b) in enumerate(zip(values, baseline)):
+            if a != b:
+                mask |= 1 << i
+        return mask
+
+    def record_size(self, mask: int) -> int:
+        size = _RECORD_HEADER.size
+        for i, s in enumerate(self._structs):
+            if mask & (1 << i):
+                size += s.size
+        return size
+
+    def write(self, out: bytearray, net_id: int, values, mask: int, full: bool):
+        out += _RECORD_HEADER.pack(net_id, self.kind | (_FULL if full else 0), mask)
+        for i, s in enumerate(self._structs):
+            if mask & (1 << i):
+                out += s.pack(values[i])
+
+    def read(self, buf, offset: int, mask: int, baseline) -> tuple[tuple, int]:
+        values = list(baseline) if baseline is not None else [0] * len(self._structs)
+        for i, s in enumerate(self._structs):
+            if mask & (1 << i):
+                (values[i],) = s.unpack_from(buf, offset)
+                offset += s.size
+        return tuple(values), offset
+
+
+# ----------------------------------------------------------------------
+# Per-type encoders
+# ----------------------------------------------------------------------
+
+KIND_PLAYER = 0
+KIND_ENEMY = 1
+KIND_BULLET = 2
+KIND_POWERUP = 3
+
+
+_ENEMY_TYPES = list(EnemyType)
+_ENEMY_TYPE_CODES = {t: i for i, t in enumerate(_ENEMY_TYPES)}
+
+
+def _enemy_type_name(q: int) -> str:
+    return _ENEMY_TYPES[q].value
+
+
+PLAYER_CODEC = EntityCodec(KIND_PLAYER, "player", (
+    ("x", "H", dq_pos),
+    ("y", "H", dq_pos),
+    ("health", "H", _ident),
+    ("max_health", "H", _ident),
+    ("flags", "B", _ident),          # bit 0 shield, bit 1 invulnerable
+    ("player_id", "B", _ident),
+), lambda p: (
+    q_pos(p.x), q_pos(p.y), q_u16(p.health), q_u16(p.max_health),
+    p.shield_active | p.is_invulnerable << 1, q_u8(p.id),
+))
+
+ENEMY_CODEC = EntityCodec(KIND_ENEMY, "enemy", (
+    ("x", "H", dq_pos),
+    ("y", "H", dq_pos),
+    ("type", "B", _enemy_type_name),
+    ("health", "H", _ident),
+    ("max_health", "H", _ident),
+    ("state", "B", _ident),          # AIState value
+    ("hit_flash", "B", _ident),
+), lambda e: (
+    q_pos(e.x), q_pos(e.y), _ENEMY_TYPE_CODES[e.type], q_u16(e.health),
+    q_u16(e.max_health), e.state.value, q_u8(e.hit_flash),
+))
+
+BULLET_CODEC = EntityCodec(KIND_BULLET, "bullet", (
+    ("x", "H", dq_pos),
+    ("y", "H", dq_pos),
+), lambda b: (q_pos(b.x), q_pos(b.y)))
+
+POWERUP_CODEC = EntityCodec(KIND_POWERUP, "powerup", (
+    ("x", "H", dq_pos),
+    ("y", "H", dq_pos),
+    ("type", "B", _ident),           # PowerupType value
+    ("expires", "H", lambda q: q * 10),   # sim frame; compare with the header frame
+), lambda p: (q_pos(p.x), q_pos(p.y), p.type.value, q_u16(p.expires_at // 10)))
+
+CODECS = {c.kind: c for c in (PLAYER_CODEC, ENEMY_CODEC, BULLET_CODEC, POWERUP_CODEC)}
+
+# GameManager list -> codec, in send-priority order
+REPLICATED_LISTS = (
+    ("players", PLAYER_CODEC),
+    ("enemy_bullets", BULLET_CODEC),
+    ("enemies", ENEMY_CODEC),
+    ("powerups", POWERUP_CODEC),
+)
+
+# Base priority gained per snapshot while an entity's change is unsent
+KIND_PRIORITY = {
+    KIND_PLAYER: 1000.0,   # always first
+    KIND_BULLET: 4.0,      # fast, lethal
+    KIND_ENEMY: 2.0,
+    KIND_POWERUP: 1.0,
+}
+
+
+# ----------------------------------------------------------------------
+# Packets
+# ----------------------------------------------------------------------
+
+def pack_input_packet(seq: int, ack: int, record: bytes) -> bytes:
+    return _INPUT_HEADER.pack(MSG_INPUT, seq, ack) + record
+
+
+def unpack_input_packet(data: bytes) -> tuple[int, int, bytes]:
+    _, seq, ack = _INPUT_HEADER.unpack_from(data)
+    return seq, ack, data[_INPUT_HEADER.size:]
+
+
+def encode_snapshot(seq: int, baseline_seq: int, header: tuple, removed, records) -> bytes:
+    """
+    *header* is (frame, score, wave, state code); *records* is a list of
+    (codec, net_id, values, mask, full).
+    """
+    out = bytearray(_SNAP_HEADER.pack(MSG_SNAPSHOT, seq, baseline_seq, *header,
+                                      len(removed), len(records)))
+    for net_id in removed:
+        out += _NET_ID.pack(net_id)
+    for codec, net_id, values, mask, full in records:
+        codec.write(out, net_id, values, mask, full)
+    return bytes(out)
+
+
+def decode_snapshot(data: bytes, baseline: dict | None):
+    """
+    Rebuild the full view from a SNAPSHOT packet and its *baseline* view.
+    Returns (seq, baseline_seq, header dict, view).
+    """
+    (_, seq, baseline_seq, frame, score, wave, state,
+     n_removed, n_records) = _SNAP_HEADER.unpack_from(data)
+    offset = _SNAP_HEADER.size
+
+    view = dict(baseline) if baseline else {}
+    for _ in range(n_removed):
+        (net_id,) = _NET_ID.unpack_from(data, offset)
+        offset += _NET_ID.size
+        view.pop(net_id, None)
+
+    for _ in range(n_records):
+        net_id, kind, mask = _RECORD_HEADER.unpack_from(data, offset)
+        offset += _RECORD_HEADER.size
+        full = kind & _FULL
+        kind &= ~_FULL
+        prev = None if full else view.get(net_id, (kind, None))[1]
+        values, offset = CODECS[kind].read(data, offset, mask, prev)
+        view[net_id] = (kind, values)
+
+    header = {"frame": frame, "score": score, "wave": wave, "state": decode_state(state)}
+    return seq, baseline_seq, header, view
+
+
+def snapshot_header_size() -> int:
+    return _SNAP_HEADER.size
+
+
+def removed_size() -> int:
+    return _NET_ID.size
@@ -0,0 +1,366 @@
+"""
+net/server.py
+Authoritative replication server. Owns the GameManager, applies client
+inputs, and sends each client its own delta-compressed snapshot stream.
+
+Bandwidth is bounded per snapshot (DEFAULT_BUDGET bytes): entities whose
+quantized state differs from the client's acked baseline gain priority
+every snapshot they are not sent, and the highest-priority changes are
+packed until the budget is spent. Entities that don't fit keep their
+baseline values on the client and go out in a later packet, so traffic
+stays flat as the enemy count grows; only staleness increases.
+
+    python -m net.server                  # survival, port 47800
+    python -m net.server --enemies 400    # constant horde, bandwidth test
+"""
+import argparse
+import socket
+import time
+import weakref
+from collections import deque
+
+from config.settings import FPS
+from core.frame_input import FrameInput
+from core.replay import unpack_input
+from net.protocol import (
+    CLIENT_TIMEOUT,
+    DEFAULT_BUDGET,
+    DEFAULT_PORT,
+    KIND_PRIORITY,
+    MSG_BYE,
+    MSG_HELLO,
+    MSG_INPUT,
+    NO_BASELINE,
+    REPLICATED_LISTS,
+    SEND_INTERVAL,
+    CODECS,
+    encode_snapshot,
+    encode_state,
+    removed_size,
+    snapshot_header_size,
+    unpack_input_packet,
+)
+
+_MAX_VIEWS = 64      # unacked snapshots remembered per client
+_MAX_QUEUED = 4      # inputs buffered per client before old ones are dropped
+
+
+class ClientConnection:
+    """Per-client replication state and counters."""
+
+    def __init__(self, addr, frame: int):
+        self.addr = addr
+        self.inputs: deque = deque()
+        self.last_input = FrameInput()
+        self.input_seq = -1
+        self.last_heard = frame
+
+        self.seq = 0                       # last snapshot seq sent
+        self.acked = NO_BASELINE           # newest snapshot seq the client confirmed
+        self.views: dict[int, dict] = {}   # seq -> view as the client will see it
+        self.priority: dict[int, float] = {}
+
+        # Counters
+        self.packets_sent = 0
+        self.bytes_sent = 0
+        self.packets_received = 0
+        self.bytes_received = 0
+        self.records_sent = 0
+        self.records_deferred = 0
+        self.serialize_ms_total = 0.0
+        self.serialize_ms_max = 0.0
+        self._recent = deque()             # (frame, bytes) over the last second
+
+    def next_input(self) -> FrameInput:
+        """One input per simulation frame; held state repeats when none arrived."""
+        if self.inputs:
+            self.last_input = self.inputs.popleft()
+            return self.last_input
+        last = self.last_input
+        return FrameInput(up=last.up, down=last.down, left=last.left, right=last.right,
+                          fire_held=last.fire_held, mouse_pos=last.mouse_pos)
+
+    def bandwidth(self) -> int:
+        """Bytes sent over the last second of simulation."""
+        return sum(n for _, n in self._recent)
+
+    def stats(self) -> dict:
+        return {
+            "addr": f"{self.addr[0]}:{self.addr[1]}",
+            "bytes_per_sec": self.bandwidth(),
+            "packets_sent": self.packets_sent,
+            "bytes_sent": self.bytes_sent,
+            "packets_received": self.packets_received,
+            "bytes_received": self.bytes_received,
+            "records_sent": self.records_sent,
+            "records_deferred": self.records_deferred,
+            "serialize_ms_avg": self.serialize_ms_total / max(self.packets_sent, 1),
+            "serialize_ms_max": self.serialize_ms_max,
+            "acked": None if self.acked == NO_BASELINE else self.acked,
+            "seq": self.seq,
+        }
+
+
+class ReplicationServer:
+    def __init__(self, game, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 budget: int = DEFAULT_BUDGET, send_interval: int = SEND_INTERVAL):
+        self.game = game
+        self.budget = budget
+        self.send_interval = send_interval
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.sock.setblocking(False)
+        self.address = self.sock.getsockname()
+
+        self.clients: dict[tuple, ClientConnection] = {}
+        self._ids = weakref.WeakKeyDictionary()    # entity -> net id
+        self._next_id = 1
+        self._wrapped = False
+        self._in_use = None
+        self.frames = 0
+        self.view_ms = 0.0                          # last world quantization cost
+
+    # ------------------------------------------------------------------
+    # Main loop pieces
+    # ------------------------------------------------------------------
+
+    def tick(self):
+        """Receive, simulate one frame with every client's input, replicate."""
+        self.poll()
+        # Clients drive players in join order; any beyond the player count spectate
+        clients = list(self.clients.values())
+        inputs = []
+        for i in range(len(self.game.players)):
+            inputs.append(clients[i].next_input() if i < len(clients) else FrameInput())
+        for client in clients[len(inputs):]:
+            client.inputs.clear()
+        self.game.step(inputs)
+        self.frames += 1
+        if self.frames % self.send_interval == 0 and self.clients:
+            self.replicate()
+
+    def poll(self):
+        while True:
+            try:
+                data, addr = self.sock.recvfrom(2048)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            self._handle(data, addr)
+
+        for addr, client in list(self.clients.items()):
+            if self.frames - client.last_heard > CLIENT_TIMEOUT:
+                del self.clients[addr]
+
+    def close(self):
+        self.sock.close()
+
+    # ------------------------------------------------------------------
+    # Receive
+    # ------------------------------------------------------------------
+
+    def _handle(self, data: bytes, addr):
+        if not data:
+            return
+        kind = data[0]
+        client = self.clients.get(addr)
+        if kind == MSG_HELLO:
+            if client is None:
+                self.clients[addr] = ClientConnection(addr, self.frames)
+            return
+        if client is None:
+            return
+        client.last_heard = self.frames
+        client.packets_received += 1
+        client.bytes_received += len(data)
+
+        if kind == MSG_BYE:
+            del self.clients[addr]
+        elif kind == MSG_INPUT:
+            seq, ack, record = unpack_input_packet(data)
+            if seq > client.input_seq:
+                client.input_seq = seq
+                client.inputs.append(unpack_input(record))
+                while len(client.inputs) > _MAX_QUEUED:
+                    client.inputs.popleft()
+            if ack in client.views and (client.acked == NO_BASELINE or ack > client.acked):
+                client.acked = ack
+                for seq in [s for s in client.views if s < ack]:
+                    del client.views[seq]
+
+    # ------------------------------------------------------------------
+    # Send
+    # ------------------------------------------------------------------
+
+    def _net_id(self, obj) -> int:
+        nid = self._ids.get(obj)
+        if nid is None:
+            nid = self._next_id
+            if self._wrapped:
+                # ids are reused after 65535; skip ones still held by live entities
+                if self._in_use is None:
+                    self._in_use = set(self._ids.values())
+                while nid in self._in_use:
+                    nid = nid % 0xFFFF + 1
+                self._in_use.add(nid)
+            if nid == 0xFFFF:
+                self._wrapped = True
+            self._next_id = nid % 0xFFFF + 1
+            self._ids[obj] = nid
+        return nid
+
+    def world_view(self) -> dict:
+        """{net_id: (kind, quantized values)} for every replicated entity."""
+        self._in_use = None
+        view = {}
+        net_id = self._net_id
+        for list_name, codec in REPLICATED_LISTS:
+            kind = codec.kind
+            quantize = codec.quantize
+            for obj in getattr(self.game, list_name):
+                view[net_id(obj)] = (kind, quantize(obj))
+        return view
+
+    def replicate(self):
+        start = time.perf_counter()
+        world = self.world_view()
+        self.view_ms = (time.perf_counter() - start) * 1000.0
+
+        game = self.game
+        header = (game.frame, game.score, game.wave, encode_state(game.state))
+        for client in self.clients.values():
+            self._send_snapshot(client, world, header)
+
+    def _send_snapshot(self, client: ClientConnection, world: dict, header: tuple):
+        start = time.perf_counter()
+        baseline = client.views.get(client.acked, {})
+        budget = self.budget - snapshot_header_size()
+
+        removed = [nid for nid in baseline if nid not in world]
+        removed = removed[:max(0, budget // removed_size())]
+        budget -= len(removed) * removed_size()
+
+        priority = client.priority
+        candidates = []
+        for nid, (kind, values) in world.items():
+            prev = baseline.get(nid)
+            if prev is not None:
+                if prev[1] == values:
+                    continue
+                if prev[0] != kind:     # net id reused by a different kind
+                    prev = None
+            priority[nid] = priority.get(nid, 0.0) + KIND_PRIORITY[kind]
+            candidates.append((priority[nid], nid, kind, values, prev))
+        candidates.sort(key=lambda c: c[0], reverse=True)
+
+        view = dict(baseline)
+        for nid in removed:
+            del view[nid]
+            priority.pop(nid, None)
+
+        records = []
+        deferred = 0
+        for _, nid, kind, values, prev in candidates:
+            codec = CODECS[kind]
+            full = prev is None
+            mask = codec.full_mask if full else codec.diff_mask(values, prev[1])
+            size = codec.record_size(mask)
+            if size > budget:
+                deferred += 1
+                continue
+            budget -= size
+            records.append((codec, nid, values, mask, full))
+            view[nid] = (kind, values)
+            priority[nid] = 0.0
+
+        client.seq += 1
+        packet = encode_snapshot(client.seq, client.acked, header, removed, records)
+        client.views[client.seq] = view
+        if len(client.views) > _MAX_VIEWS:
+            oldest = min(s for s in client.views if s != client.acked)
+            del client.views[oldest]
+        if len(priority) > 2 * len(world) + 64:
+            for nid in [n for n in priority if n not in world]:
+                del priority[nid]
+
+        ms = (time.perf_counter() - start) * 1000.0
+        try:
+            self.sock.sendto(packet, client.addr)
+        except OSError:
+            return
+        client.packets_sent += 1
+        client.bytes_sent += len(packet)
+        client.records_sent += len(records)
+        client.records_deferred += deferred
+        client.serialize_ms_total += ms
+        client.serialize_ms_max = max(client.serialize_ms_max, ms)
+        client._recent.append((self.frames, len(packet)))
+        while client._recent and client._recent[0][0] <= self.frames - FPS:
+            client._recent.popleft()
+
+    def stats(self) -> dict:
+        return {
+            "frame": self.frames,
+            "view_ms": self.view_ms,
+            "clients": [c.stats() for c in self.clients.values()],
+        }
+
+
+# ----------------------------------------------------------------------
+# Headless dedicated server
+# ----------------------------------------------------------------------
+
+def main(argv=None):
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    from core.game_manager import GameManager
+    from core.modes.horde_mode import HordeMode
+
+    parser = argparse.ArgumentParser(prog="python -m net.server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET,
+                        help="bytes per snapshot (default %(default)s)")
+    parser.add_argument("--enemies", type=int, default=0,
+                        help="hold a constant horde of this size (bandwidth testing)")
+    parser.add_argument("--players", type=int, default=2,
+                        help="co-op players; clients take them in join order")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    game = GameManager(seed=args.seed, players=args.players)
+    game.persist_stats = False
+    if args.enemies:
+        game.active_mode = HordeMode(schedule=[(0, args.enemies), (10 ** 9, args.enemies)],
+                                     spawn_rate=args.enemies, log_path=None, record=False)
+    server = ReplicationServer(game, args.host, args.port, args.budget)
+    print(f"serving on {server.address[0]}:{server.address[1]}")
+
+    frame_time = 1.0 / FPS
+    next_frame = time.perf_counter()
+    try:
+        while True:
+            server.tick()
+            if server.frames % FPS == 0:
+                for c in server.stats()["clients"]:
+                    print(f"{c['addr']}: {c['bytes_per_sec'] / 1024:6.1f} kB/s  "
+                          f"serialize {c['serialize_ms_avg']:.3f} ms avg / "
+                          f"{c['serialize_ms_max']:.3f} max  "
+                          f"deferred {c['records_deferred']}  "
+                          f"(world view {server.view_ms:.3f} ms, {len(game.enemies)} enemies)")
+            next_frame += frame_time
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame = time.perf_counter()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
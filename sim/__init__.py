@@ -0,0 +1,4 @@
+"""
+sim
+Headless batch simulation for balance and performance sweeps. Run: python -m sim
+"""
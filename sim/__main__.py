@@ -0,0 +1,80 @@
+"""
+sim/__main__.py
+Batch simulation CLI.
+
+    python -m sim --seeds 32                                   # baseline balance
+    python -m sim --set weapons.rifle.damage=20,25,30 --policy turret
+    python -m sim --set enemies.tank.health=300,400 --weapon shotgun -o sweep.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from config.settings import FPS  # noqa: E402
+from core.autopilot import POLICIES  # noqa: E402
+from sim.runner import CACHE_DIR, METRICS, aggregate, grid, run_batch  # noqa: E402
+
+
+def _parse_set(text: str):
+    key, _, values = text.partition("=")
+    if not values:
+        raise argparse.ArgumentTypeError(f"expected key=v1,v2,... got {text!r}")
+    return key, [json.loads(v) for v in values.split(",")]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m sim")
+    parser.add_argument("--set", dest="params", action="append", type=_parse_set, default=[],
+                        metavar="KEY=V1,V2", help="data override to sweep (repeatable)")
+    parser.add_argument("--seeds", type=int, default=16, help="seeds per config (default 16)")
+    parser.add_argument("--seed-base", type=int, default=0, help="first seed")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="kite")
+    parser.add_argument("--weapon", default="rifle")
+    parser.add_argument("--players", type=int, default=1, help="co-op players per run")
+    parser.add_argument("--minutes", type=float, default=5.0,
+                        help="simulated minutes per run before it counts as survived")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="pool size (default: CPUs)")
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("-o", "--output", help="write the aggregate table to a JSON file")
+    args = parser.parse_args(argv)
+
+    jobs = grid(
+        dict(args.params),
+        seeds=range(args.seed_base, args.seed_base + args.seeds),
+        policy=args.policy,
+        weapon=args.weapon,
+        max_frames=int(args.minutes * 60 * FPS),
+        players=args.players,
+    )
+
+    start = time.perf_counter()
+    results = []
+    for done, (job, metrics) in enumerate(run_batch(
+            jobs, args.workers, None if args.no_cache else CACHE_DIR), 1):
+        results.append((job, metrics))
+        print(f"\r  {done}/{len(jobs)} runs", end="", file=sys.stderr, flush=True)
+    print(f"\r  {len(jobs)} runs in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+    table = aggregate(results)
+    for key, row in table.items():
+        print(f"\n{json.loads(key)['overrides'] or '(defaults)'}  "
+              f"runs={row['runs']}  survival={row['survival_rate']:.0%}")
+        for name in METRICS:
+            m = row[name]
+            if m is not None:
+                print(f"  {name:<14} mean {m['mean']:>10}  min {m['min']:>10}  max {m['max']:>10}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(table, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+sim/runner.py
+Fans seeded headless GameManager runs out across a process pool.
+
+A SimJob is (seed, data overrides, autopilot policy, starting weapon,
+frame cap). Each worker applies the overrides to its own data cache, plays
+the run with the policy and returns a flat metrics dict. Results stream
+back as runs finish and are cached on disk by a hash of the job plus the
+data files, so re-running a sweep only simulates what changed.
+
+    jobs = grid({"weapons.rifle.damage": [20, 25, 30]}, seeds=range(16), policy="kite")
+    for job, metrics in run_batch(jobs, workers=8):
+        ...
+    table = aggregate(results)
+"""
+import hashlib
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import product
+
+from config.settings import FPS
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", ".sim_cache")
+
+# Bump when the simulation or metrics change in a way the data hash can't see
+CACHE_VERSION = 3
+
+METRICS = ("waves", "time_to_death", "dps", "kills", "score", "frame_us")
+
+
+@dataclass(frozen=True)
+class SimJob:
+    seed: int
+    overrides: dict = field(default_factory=dict)   # dotted data keys -> value
+    policy: str = "kite"
+    weapon: str = "rifle"
+    max_frames: int = FPS * 300                     # 5 simulated minutes
+    players: int = 1                                # co-op: every player runs the policy
+
+    def config_key(self) -> str:
+        """Everything except the seed — runs sharing this are aggregated together."""
+        return json.dumps(
+            {"overrides": self.overrides, "policy": self.policy,
+             "weapon": self.weapon, "max_frames": self.max_frames, "players": self.players},
+            sort_keys=True,
+        )
+
+    def cache_key(self, data_hash: str) -> str:
+        payload = f"{CACHE_VERSION}|{data_hash}|{self.seed}|{self.config_key()}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def grid(params: dict, seeds, policy: str = "kite", weapon: str = "rifle",
+         max_frames: int = FPS * 300, players: int = 1) -> list[SimJob]:
+    """Cartesian product of *params* ({dotted key: [values]}) x *seeds*."""
+    keys = sorted(params)
+    jobs = []
+    for values in product(*(params[k] for k in keys)):
+        overrides = dict(zip(keys, values))
+        for seed in seeds:
+            jobs.append(SimJob(seed, overrides, policy, weapon, max_frames, players))
+    return jobs
+
+
+# ----------------------------------------------------------------------
+# Worker side
+# ----------------------------------------------------------------------
+
+def run_job(job: SimJob) -> dict:
+    """Play one headless run to death or *max_frames*; returns its metrics."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from core import data_loader
+    from core.autopilot import POLICIES
+    from core.events import EnemyHit
+    from core.game_manager import GameManager
+    from systems.weapon_system import Weapon
+
+    # Workers are reused across jobs: start each from the on-disk data
+    data_loader.reset()
+    data_loader.apply_overrides(job.overrides)
+
+    game = GameManager(seed=job.seed, players=job.players)
+    game.persist_stats = False
+    # Fresh Weapon instance: overrides apply, and upgrades can't leak into presets
+    for player in game.players:
+        player.weapon_system.equip(Weapon.from_json(job.weapon), player)
+
+    damage = 0
+
+    def on_hits(events):
+        nonlocal damage
+        damage += sum(e.damage for e in events)
+
+    game.event_bus.subscribe_batch(EnemyHit, on_hits)
+    policy = POLICIES[job.policy]
+
+    start = time.perf_counter()
+    while game.frame < job.max_frames and game.alive_players():
+        game.step([policy(game, player) for player in game.players])
+    elapsed = time.perf_counter() - start
+
+    seconds = game.frame / FPS
+    died = not game.alive_players()
+    return {
+        "waves": game.wave,
+        "time_to_death": round(seconds, 2) if died else None,
+        "survived": not died,
+        "dps": round(damage / seconds, 2) if seconds else 0.0,
+        "kills": game.kills,
+        "score": game.score,
+        "frames": game.frame,
+        "frame_us": round(elapsed / max(game.frame, 1) * 1e6, 1),
+    }
+
+
+# ----------------------------------------------------------------------
+# Driver side
+# ----------------------------------------------------------------------
+
+def _cache_path(cache_dir: str, key: str) -> str:
+    return os.path.join(cache_dir, key[:2], key + ".json")
+
+
+def _cache_get(cache_dir, key):
+    try:
+        with open(_cache_path(cache_dir, key), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(cache_dir, key, metrics):
+    path = _cache_path(cache_dir, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(metrics, f)
+    os.replace(tmp, path)
+
+
+def run_batch(jobs, workers: int | None = None, cache_dir: str | None = CACHE_DIR):
+    """
+    Yield (job, metrics) as each run finishes — cache hits first, then
+    pool results in completion order. cache_dir=None disables the cache.
+    """
+    from core.data_loader import data_fingerprint
+
+    data_hash = data_fingerprint()
+    pending = []
+    for job in jobs:
+        cached = _cache_get(cache_dir, job.cache_key(data_hash)) if cache_dir else None
+        if cached is not None:
+            yield job, cached
+        else:
+            pending.append(job)
+
+    if not pending:
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(run_job, job): job for job in pending}
+        for future in as_completed(futures):
+            job = futures[future]
+            metrics = future.result()
+            if cache_dir:
+                _cache_put(cache_dir, job.cache_key(data_hash), metrics)
+            yield job, metrics
+
+
+def aggregate(results) -> dict:
+    """
+    Group (job, metrics) pairs by config (all seeds together) and reduce each
+    metric to mean/min/max. time_to_death only averages runs that died;
+    survival_rate covers the rest.
+    """
+    groups: dict[str, list[dict]] = {}
+    for job, metrics in results:
+        groups.setdefault(job.config_key(), []).append(metrics)
+
+    table = {}
+    for key, runs in groups.items():
+        row = {"runs": len(runs),
+               "survival_rate": round(sum(r["survived"] for r in runs) / len(runs), 3)}
+        for name in METRICS:
+            values = [r[name] for r in runs if r[name] is not None]
+            if values:
+                row[name] = {
+                    "mean": round(statistics.fmean(values), 2),
+                    "min": min(values),
+                    "max": max(values),
+                }
+            else:
+                row[name] = None
+        table[key] = row
+    return table
@@ -1,59 +1,128 @@
 from config.settings import ACCENT_COLOR
-from entities.particle import Particle
+from core.events import PlayerDamaged, PowerupPicked
+from core.quality import PRIORITY_PICKUP, PRIORITY_PLAYER_HIT
 from entities.powerup import PowerupType
 
+# Broadphase cell size: larger than any player, enemy or powerup, so every
+# box overlaps at most 2x2 cells
+CELL = 128
+
+
+def _cells(x, y, w, h):
+    x0 = int(x) // CELL
+    y0 = int(y) // CELL
+    x1 = int(x + w) // CELL
+    y1 = int(y + h) // CELL
+    if x0 == x1 and y0 == y1:
+        return ((x0, y0),)
+    return tuple((cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1))
+
+
+def _player_grid(players):
+    """
+    (cell -> [(player, x, y, x2, y2)], bounding box of all of them) for
+    every living player; the box rejects most far-away objects before any
+    cell lookup.
+    """
+    grid = {}
+    left = top = float("inf")
+    right = bottom = float("-inf")
+    for player in players:
+        if not player.is_alive():
+            continue
+        x, y, s = player.x, player.y, player.size
+        entry = (player, x, y, x + s, y + s)
+        for cell in _cells(x, y, s, s):
+            grid.setdefault(cell, []).append(entry)
+        left, top = min(left, x), min(top, y)
+        right, bottom = max(right, x + s), max(bottom, y + s)
+    return grid, (left, top, right, bottom)
+
+
+def _overlapping(grid, x, y, w, h):
+    """Living players whose box overlaps (x, y, w, h); order = player order."""
+    found = []
+    for cell in _cells(x, y, w, h):
+        for entry in grid.get(cell, ()):
+            player, px, py, px2, py2 = entry
+            if (x < px2 and px < x + w and y < py2 and py < y + h
+                    and player not in found):
+                found.append(player)
+    return found
+
 
 def check_collisions(game):
-    player = game.players[0]
-    player_rect = player.get_rect()
+    """
+    One broadphase pass for all players: living players are bucketed into
+    a coarse grid, then each enemy / bullet / powerup only tests the
+    players sharing its cells (usually none).
+    """
+    grid, (left, top, right, bottom) = _player_grid(game.players)
+    if not grid:
+        return
+    bus = game.event_bus
 
-    for enemy in game.enemies[:]:
-        if player_rect.colliderect(enemy.get_rect()):
-            enemy_center = enemy.get_center()
+    for enemy in game.enemies:
+        ex, ey, size = enemy.x, enemy.y, enemy.size
+        if ex >= right or ex + size <= left or ey >= bottom or ey + size <= top:
+            continue
+        hits = _overlapping(grid, ex, ey, size, size)
+        if not hits:
+            continue
+        enemy_center = enemy.get_center()
+        for player in hits:
             player_center = player.get_center()
             direction = (
                 enemy_center[0] - player_center[0],
                 enemy_center[1] - player_center[1],
             )
 
-            if player.take_damage(enemy.damage, direction):
+            if player.take_damage(enemy.damage, direction, game.timers):
                 game.screen_shake = 12
                 game.combat.combo = 0
-                for _ in range(15):
-                    game.particles.append(
-                        Particle(
-                            player.x + player.size // 2,
-                            player.y + player.size // 2,
-                            ACCENT_COLOR,
-                            velocity_range=4,
-                        )
-                    )
-
-    for bullet in game.enemy_bullets[:]:
-        bullet_pos = bullet.get_pos()
-        if player_rect.collidepoint(bullet_pos):
-            direction = (bullet.dx, bullet.dy)
-            if player.take_damage(8, direction):
-                game.screen_shake = 8
-                game.combat.combo = 0
-            game.enemy_bullets.remove(bullet)
-
-    for powerup in game.powerups[:]:
-        if player_rect.colliderect(powerup.get_rect()):
-            player.apply_powerup(powerup.type)
+                bus.emit(PlayerDamaged(player.id, enemy.damage))
+                game.quality.emit(game.particles, 15, PRIORITY_PLAYER_HIT,
+                                  player.x + player.size // 2, player.y + player.size // 2,
+                                  ACCENT_COLOR, velocity_range=4)
 
-            if powerup.type == PowerupType.AMMO:
-                game.current_ammo = game.max_ammo
+    remaining = []
+    for bullet in game.enemy_bullets:
+        bx, by = bullet.get_pos()
+        if not (left <= bx < right and top <= by < bottom):
+            remaining.append(bullet)
+            continue
+        cell = grid.get((int(bx) // CELL, int(by) // CELL))
+        player = None
+        if cell:
+            for entry in cell:
+                p, px, py, px2, py2 = entry
+                if px <= bx < px2 and py <= by < py2:
+                    player = p
+                    break
+        if player is None:
+            remaining.append(bullet)
+            continue
+        direction = (bullet.dx, bullet.dy)
+        if player.take_damage(8, direction, game.timers):
+            game.screen_shake = 8
+            game.combat.combo = 0
+            bus.emit(PlayerDamaged(player.id, 8))
+    game.enemy_bullets = remaining
 
-            for _ in range(15):
-                game.particles.append(
-                    Particle(
-                        powerup.x,
-                        powerup.y,
-                        powerup.colors[powerup.type],
-                        velocity_range=4,
-                    )
-                )
+    remaining = []
+    for powerup in game.powerups:
+        s = powerup.size
+        hits = _overlapping(grid, powerup.x - s, powerup.y - s, s * 2, s * 2)
+        if not hits:
+            remaining.append(powerup)
+            continue
+        player = hits[0]
+        player.apply_powerup(powerup.type, game.timers)
+        bus.emit(PowerupPicked(powerup.type.name.lower(), powerup.x, powerup.y))
 
-            game.powerups.remove(powerup)
+        if powerup.type == PowerupType.AMMO:
+            player.current_ammo = player.max_ammo
 
+        game.quality.emit(game.particles, 15, PRIORITY_PICKUP, powerup.x, powerup.y,
+                          powerup.colors[powerup.type], velocity_range=4)
+    game.powerups = remaining
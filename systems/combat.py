@@ -1,12 +1,11 @@
 import math
 import random
 
-import pygame
-
 from config.settings import ACCENT_COLOR
-from entities.damage_number import DamageNumber
-from entities.particle import Particle
-from entities.powerup import Powerup, PowerupType
+from core.events import EnemyHit, EnemyKilled
+from core.quality import PRIORITY_DEATH, PRIORITY_MUZZLE, PRIORITY_SPARK
+from entities.damage_number import add_hit
+from entities.powerup import LIFETIME as POWERUP_LIFETIME, Powerup, PowerupType
 
 
 class CombatSystem:
@@ -16,54 +15,47 @@ class CombatSystem:
 
     State owned here:
         combo            -- current kill streak
-        combo_timer      -- frames until combo resets (counts down)
-        hitmarker_timer  -- frames to show hit crosshair flash
-        screen_flash     -- frames for white screen flash on hit
+        combo_until      -- frame the combo resets (a game.timers entry)
+        hitmarker_until  -- show the hit crosshair flash before this frame
+        flash_until      -- white screen flash on hit before this frame
 
-    State that stays in GameManager (weapon / inventory):
-        current_ammo, max_ammo, is_reloading, fire_rate, last_shot,
-        screen_shake, score, kills
+    State that lives elsewhere:
+        Player            -- current_ammo, max_ammo, is_reloading, weapon_system
+        GameManager       -- screen_shake, score, kills
     """
 
     def __init__(self):
         self.combo = 0
-        self.combo_timer = 0
-        self.hitmarker_timer = 0
-        self.screen_flash = 0
+        self.combo_until = 0
+        self.hitmarker_until = 0
+        self.flash_until = 0
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def handle_shoot(self, game, mouse_pos):
+    def handle_shoot(self, game, player, mouse_pos):
         """
-        Full hitscan pipeline called every frame the player holds LMB.
-        Reads ammo state from *game* and writes results back to *game*.
+        Full hitscan pipeline called every frame *player* holds LMB.
+        Reads ammo state from *player* and writes results back to it.
         """
-        current_time = pygame.time.get_ticks()
+        current_time = game.now()
+        ws = player.weapon_system
 
         if (
-            game.current_ammo > 0
-            and not game.is_reloading
-            and current_time - game.last_shot >= game.fire_rate
+            player.current_ammo > 0
+            and not player.is_reloading
+            and current_time - ws.last_shot >= player.fire_rate * (1000 // 60)
         ):
-            player = game.players[0]
             player_center = player.get_center()
 
             # --- Muzzle flash particles ---
-            for _ in range(8):
-                game.particles.append(
-                    Particle(
-                        player_center[0],
-                        player_center[1],
-                        ACCENT_COLOR,
-                        velocity_range=3,
-                        gravity=False,
-                    )
-                )
-
-            game.current_ammo -= 1
-            game.last_shot = current_time
+            game.quality.emit(game.particles, 8, PRIORITY_MUZZLE,
+                              player_center[0], player_center[1], ACCENT_COLOR,
+                              velocity_range=3, gravity=False)
+
+            player.current_ammo -= 1
+            ws.last_shot = current_time
 
             # --- Ray-cast: find closest enemy inside the aim cone ---
             dx = mouse_pos[0] - player_center[0]
@@ -74,18 +66,10 @@ class CombatSystem:
             if hit_enemy:
                 self._apply_hit(game, player, hit_enemy)
 
-    def update(self, game):
-        """Tick per-frame combat timers. Called from GameManager.update()."""
-        if self.combo > 0:
-            self.combo_timer -= 1
-            if self.combo_timer <= 0:
-                self.combo = 0
-
-        if self.hitmarker_timer > 0:
-            self.hitmarker_timer -= 1
-
-        if self.screen_flash > 0:
-            self.screen_flash -= 1
+    def end_combo(self, game):
+        """Timer callback: the streak lapses unless a later kill extended it."""
+        if game.frame >= self.combo_until:
+            self.combo = 0
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -117,26 +101,23 @@ class CombatSystem:
     def _apply_hit(self, game, player, hit_enemy):
         """Resolve damage, kill, combo, score, particles, and feedback."""
         # --- Damage calculation ---
-        # Use current weapon's base damage, scaled by player's damage_boost
-        base_damage = game.weapon_system.current_weapon.damage
-        damage = int(base_damage * player.damage_boost)
+        # Weapon damage with every modifier applied, cached on the player
+        damage = player.hit_damage
 
         # Use player's crit_chance (can be upgraded)
         is_critical = random.random() < player.crit_chance
         if is_critical:
             damage = int(damage * 2)
 
-        # --- Floating damage number ---
-        game.damage_numbers.append(
-            DamageNumber(
-                hit_enemy.x + hit_enemy.size // 2,
-                hit_enemy.y,
-                damage,
-                is_critical,
-            )
-        )
+        killed = hit_enemy.take_damage(damage, game.frame)
+
+        # --- Floating damage number (merged per enemy) ---
+        add_hit(game.damage_numbers, hit_enemy, damage, is_critical, game.frame, killed)
 
-        killed = hit_enemy.take_damage(damage)
+        bus = game.event_bus
+        if EnemyHit in bus.active:
+            bus.emit(EnemyHit(hit_enemy.type.value, hit_enemy.x, hit_enemy.y,
+                              damage, is_critical))
 
         if killed:
             self._on_kill(game, player, hit_enemy)
@@ -144,8 +125,8 @@ class CombatSystem:
             self._on_hit(game, hit_enemy)
 
         # --- Per-shot feedback (always, kill or not) ---
-        self.hitmarker_timer = 10
-        self.screen_flash = 5
+        self.hitmarker_until = game.frame + 10
+        self.flash_until = game.frame + 5
 
     def _on_kill(self, game, player, enemy):
         """Handle an enemy kill: combo, score, particles, powerup drop."""
@@ -153,11 +134,12 @@ class CombatSystem:
 
         # Combo
         self.combo += 1
-        self.combo_timer = 180
+        self.combo_until = game.timers.schedule(180, "combat", "end_combo")
 
         # Score with combo multiplier
         combo_multiplier = 1 + (self.combo * 0.1)
-        game.score += int(enemy.score_value * combo_multiplier)
+        points = int(enemy.score_value * combo_multiplier)
+        game.score += points
 
         # Lifesteal (P3 upgrade)
         if player.lifesteal > 0:
@@ -166,10 +148,8 @@ class CombatSystem:
         # Death burst particles
         cx = enemy.x + enemy.size // 2
         cy = enemy.y + enemy.size // 2
-        for _ in range(25):
-            game.particles.append(
-                Particle(cx, cy, enemy.color, velocity_range=6)
-            )
+        game.quality.emit(game.particles, 25, PRIORITY_DEATH, cx, cy, enemy.color,
+                          velocity_range=6)
 
         # Powerup drop (30% chance)
         self._maybe_drop_powerup(game, cx, cy)
@@ -177,18 +157,21 @@ class CombatSystem:
         game.enemies.remove(enemy)
         game.screen_shake = 6
 
+        bus = game.event_bus
+        if EnemyKilled in bus.active:
+            bus.emit(EnemyKilled(enemy.type.value, cx, cy, points, self.combo))
+
     def _on_hit(self, game, enemy):
         """Handle a non-lethal hit: spark particles + light shake."""
         cx = enemy.x + enemy.size // 2
         cy = enemy.y + enemy.size // 2
-        for _ in range(5):
-            game.particles.append(
-                Particle(cx, cy, (255, 255, 100), velocity_range=2, gravity=False)
-            )
+        game.quality.emit(game.particles, 5, PRIORITY_SPARK, cx, cy, (255, 255, 100),
+                          velocity_range=2, gravity=False)
         game.screen_shake = 2
 
     def _maybe_drop_powerup(self, game, x, y):
         """30% chance to drop a random powerup at the given position."""
         if random.random() < 0.3:
             powerup_type = random.choice(list(PowerupType))
-            game.powerups.append(Powerup(x, y, powerup_type))
+            game.powerups.append(Powerup(x, y, powerup_type, game.frame))
+            game.timers.schedule(POWERUP_LIFETIME, None, "_expire_powerups")
@@ -1,6 +1,7 @@
 import random
 
 from config.settings import WIDTH, HEIGHT
+from core.events import EnemySpawned
 from entities.enemy import Enemy, EnemyType
 
 
@@ -51,3 +52,7 @@ def spawn_enemy(game):
 
     game.enemies.append(Enemy(x, y, game.wave, enemy_type))
     game.enemies_spawned_this_wave += 1
+
+    bus = game.event_bus
+    if EnemySpawned in bus.active:
+        bus.emit(EnemySpawned(enemy_type.value, x, y))
@@ -0,0 +1,77 @@
+"""
+systems/targeting.py
+Nearest-living-player lookup for enemy AI.
+
+Rebuilt once per frame: the arena is split into coarse cells and each
+cell stores the players that can be nearest to *any* point inside it (the
+closest one to the cell plus anyone within a cell diagonal of that). Most
+cells end up with a single candidate, so an enemy's query is one list
+lookup plus, at worst, a couple of distance checks — the per-enemy cost
+stays flat from 1 to 8 players. Points outside the arena use the nearest
+edge cell.
+"""
+import math
+
+from config.settings import WIDTH, HEIGHT
+
+CELL = 64
+_COLS = WIDTH // CELL + 1
+_ROWS = HEIGHT // CELL + 1
+_DIAG = CELL * math.sqrt(2)
+
+
+class NearestPlayerIndex:
+    def __init__(self):
+        self._single = None                 # (player, center) with one player alive
+        self._cells: list = []
+        self._players: list = []
+
+    def rebuild(self, players):
+        alive = [p for p in players if p.is_alive()]
+        self._players = alive
+        self._cells = []
+        if len(alive) <= 1:
+            self._single = (alive[0], alive[0].get_center()) if alive else None
+            return
+        self._single = None
+
+        centers = [p.get_center() for p in alive]
+        cells = []
+        for row in range(_ROWS):
+            cy = row * CELL + CELL / 2
+            for col in range(_COLS):
+                cx = col * CELL + CELL / 2
+                dists = [math.sqrt((px - cx) ** 2 + (py - cy) ** 2) for px, py in centers]
+                best = min(dists)
+                # Anyone whose distance to the cell centre is within a diagonal
+                # of the best can still win for some point in the cell
+                cands = [(alive[i], centers[i]) for i, d in enumerate(dists) if d <= best + _DIAG]
+                cells.append(cands[0] if len(cands) == 1 else cands)
+        self._cells = cells
+
+    def _entry(self, x: float, y: float):
+        if self._single is not None or not self._cells:
+            return self._single
+        col = min(_COLS - 1, max(0, int(x) // CELL))
+        row = min(_ROWS - 1, max(0, int(y) // CELL))
+        entry = self._cells[row * _COLS + col]
+        if not isinstance(entry, list):
+            return entry
+        best = None
+        best_d = float("inf")
+        for candidate in entry:
+            px, py = candidate[1]
+            d = (px - x) ** 2 + (py - y) ** 2
+            if d < best_d:
+                best, best_d = candidate, d
+        return best
+
+    def nearest(self, x: float, y: float):
+        """Closest living player to (x, y), or None when everyone is dead."""
+        entry = self._entry(x, y)
+        return entry[0] if entry else None
+
+    def nearest_center(self, x: float, y: float):
+        """Centre of the closest living player (as of rebuild), or None."""
+        entry = self._entry(x, y)
+        return entry[1] if entry else None
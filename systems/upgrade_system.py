@@ -2,70 +2,50 @@
 systems/upgrade_system.py
 Mid-match upgrade pool and selection logic.
 Called after each wave completes. Presents 3 random upgrades to the player.
+
+Upgrades are defined in data/upgrades.json as stat modifiers (see
+core/modifiers.py). Each pick is applied under its own source key, so the
+same upgrade taken twice stacks, and the whole set can be re-applied when
+the data is hot-reloaded.
 """
 import random
 
+from core.data_loader import get_all_upgrades, get_upgrade
+from core.events import UpgradeApplied
+
+
+def upgrade_source(pick: int, key: str) -> str:
+    """Modifier source for the *pick*-th upgrade of the run."""
+    return f"upgrade{pick}.{key}"
+
+
+def roll_upgrades(n: int = 3) -> list[str]:
+    """Return n non-repeating random upgrade keys from the pool."""
+    pool = list(get_all_upgrades())
+    return random.sample(pool, min(n, len(pool)))
+
 
-# Each upgrade: {name, description, apply_fn(player, game)}
-UPGRADE_POOL = [
-    {
-        "name": "Damage Surge",
-        "description": "+15% damage permanently",
-        "apply_fn": lambda player, game: setattr(
-            player, "damage_boost", round(player.damage_boost * 1.15, 3)
-        ),
-    },
-    {
-        "name": "Speed Loader",
-        "description": "25% faster reload",
-        "apply_fn": lambda player, game: setattr(
-            game, "reload_time", int(game.reload_time * 0.75)
-        ),
-    },
-    {
-        "name": "Lifesteal",
-        "description": "+5 HP on every kill",
-        "apply_fn": lambda player, game: setattr(
-            player, "lifesteal", player.lifesteal + 5
-        ),
-    },
-    {
-        "name": "Dash",
-        "description": "Shift to dash (120f cooldown)",
-        "apply_fn": lambda player, game: setattr(player, "dash_unlocked", True),
-    },
-    {
-        "name": "Crit Focus",
-        "description": "+10% critical chance",
-        "apply_fn": lambda player, game: setattr(
-            player, "crit_chance", round(player.crit_chance + 0.10, 2)
-        ),
-    },
-    {
-        "name": "Iron Skin",
-        "description": "+20 max HP, fully heal",
-        "apply_fn": lambda player, game: (
-            setattr(player, "max_health", player.max_health + 20),
-            setattr(player, "health", player.max_health),
-        ),
-    },
-    {
-        "name": "Rapid Fire",
-        "description": "+10% fire rate",
-        "apply_fn": lambda player, game: setattr(
-            game.weapon_system.current_weapon, "fire_rate",
-            max(1, int(game.weapon_system.current_weapon.fire_rate * 0.9)),
-        ),
-    },
-]
+def apply_upgrade(key: str, player, game, pick: int):
+    """Apply upgrade *key* as the run's *pick*-th upgrade and emit the event."""
+    upgrade = get_upgrade(key)
+    player.modify(upgrade_source(pick, key), upgrade.modifiers)
+    if upgrade.heal:
+        player.health = player.max_health
+    game.event_bus.emit(UpgradeApplied(name=upgrade.name))
 
 
-def roll_upgrades(n: int = 3) -> list[dict]:
-    """Return n non-repeating random upgrades from the pool."""
-    return random.sample(UPGRADE_POOL, min(n, len(UPGRADE_POOL)))
+def reapply_upgrades(player, keys):
+    """Swap current upgrade data in under every pick in *keys*, silently."""
+    upgrades = get_all_upgrades()
+    for pick, key in enumerate(keys):
+        upgrade = upgrades.get(key)
+        if upgrade is None:
+            player.unmodify(upgrade_source(pick, key))
+        elif player.stats.has(upgrade_source(pick, key)):
+            player.modify(upgrade_source(pick, key), upgrade.modifiers)
 
 
-def apply_upgrade(upgrade: dict, player, game):
-    """Apply the upgrade and emit the event."""
-    upgrade["apply_fn"](player, game)
-    game.event_bus.emit("EVENT_UPGRADE_APPLIED", name=upgrade["name"])
+def upgrade_name(key: str) -> str:
+    """Display name for *key* (the key itself if it is no longer defined)."""
+    upgrade = get_all_upgrades().get(key)
+    return upgrade.name if upgrade is not None else key
@@ -1,4 +1,5 @@
 from config.settings import WIDTH, STATE_UPGRADE
+from core.events import EnemySpawned
 from entities.enemy import Enemy, EnemyType
 from systems.spawner import spawn_enemy
 from systems.upgrade_system import roll_upgrades
@@ -17,6 +18,7 @@ def next_wave(game):
         boss.max_health = boss.health
         boss.size = 70
         game.enemies.append(boss)
+        game.event_bus.emit(EnemySpawned(boss.type.value, boss.x, boss.y))
 
     # Trigger upgrade selection screen
     game.pending_upgrades = roll_upgrades(3)
@@ -1,20 +1,19 @@
 """
 systems/weapon_system.py
 
-WeaponSystem owns the full firing pipeline.
-GameManager calls: game.weapon_system.handle_shoot(player, enemies, mouse_pos, game)
+WeaponSystem owns the full firing pipeline. Each Player owns one
+(player.weapon_system) plus its ammo state.
+GameManager calls: player.weapon_system.handle_shoot(game, player, mouse_pos, mouse_held)
 CombatSystem only handles kill resolution, combo, and score.
 """
 import math
 import random
-from dataclasses import dataclass, field
-
-import pygame
+from dataclasses import asdict, dataclass, field
 
 from config.settings import ACCENT_COLOR
-from core.data_loader import get_weapon
-from entities.damage_number import DamageNumber
-from entities.particle import Particle
+from core.data_loader import get_all_weapons, get_weapon
+from core.events import ShotFired
+from core.quality import PRIORITY_MUZZLE
 
 
 @dataclass
@@ -33,91 +32,84 @@ class Weapon:
 
     @staticmethod
     def from_json(key: str) -> "Weapon":
-        d = get_weapon(key)
-        return Weapon(
-            key=key,
-            name=d["name"],
-            max_ammo=d["max_ammo"],
-            damage=d["damage"],
-            fire_rate=d["fire_rate"],
-            reload_time=d["reload_time"],
-            spread_count=d["spread_count"],
-            spread_angle=d.get("spread_angle", 0.0),
-            charge_frames=d["charge_frames"],
-            burst_count=d["burst_count"],
-            burst_interval=d["burst_interval"],
-        )
-
-
-# ─── Presets ──────────────────────────────────────────────────────────────────
-RIFLE       = Weapon.from_json("rifle")
-SMG         = Weapon.from_json("smg")
-SHOTGUN     = Weapon.from_json("shotgun")
-RAILGUN     = Weapon.from_json("railgun")
-BURST_RIFLE = Weapon.from_json("burst_rifle")
-
-ALL_WEAPONS = [RIFLE, SMG, SHOTGUN, RAILGUN, BURST_RIFLE]
+        """A fresh, privately owned Weapon built from the current data."""
+        return Weapon(key=key, **asdict(get_weapon(key)))
+
+
+DEFAULT_WEAPON = "rifle"
+
+
+def all_weapons() -> list:
+    """One fresh Weapon per entry in weapons.json (built on demand, so
+    importing this module never parses data and hot reloads are seen)."""
+    return [Weapon.from_json(key) for key in get_all_weapons()]
 
 
 class WeaponSystem:
     """
     Owns firing logic for all weapon types.
-    Reads ammo state from the game object and writes results back.
+    Reads ammo state from the owning player and writes results back.
     """
 
     def __init__(self, weapon: Weapon = None):
-        self.current_weapon: Weapon = weapon or RIFLE
+        self.current_weapon: Weapon = weapon or Weapon.from_json(DEFAULT_WEAPON)
 
         # Shared state
         self.charge_held: int = 0       # railgun charge counter
         self.burst_queue: int = 0       # remaining burst shots
-        self.burst_tick: int = 0        # countdown until next burst shot
-        self.last_shot: int = 0         # pygame ticks of last fired shot
+        self.burst_next: int = 0        # sim frame of the next burst shot (game.timers)
+        self.last_shot: int = 0         # game.now() ms of last fired shot
 
         # P4 feedback
-        self.crosshair_spread: int = 0  # pixels added to crosshair gap, decays
+        self.spread_until: int = 0      # crosshair gap decays 1px/frame until this frame
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def equip(self, weapon: Weapon, game):
-        """Swap to a new weapon and reset ammo in GameManager."""
+    def equip(self, weapon: Weapon, player):
+        """Swap to a new weapon and reset the player's ammo."""
         self.current_weapon = weapon
         self.charge_held = 0
         self.burst_queue = 0
-        self.burst_tick = 0
-        game.current_ammo = weapon.max_ammo
-        game.max_ammo = weapon.max_ammo
-        game.reload_time = weapon.reload_time
-        game.is_reloading = False
-
-    def update(self, game):
-        """Per-frame tick — handles burst queue and feedback decay."""
-        # Burst shot drip-feed
-        if self.burst_queue > 0:
-            self.burst_tick -= 1
-            if self.burst_tick <= 0 and game.current_ammo > 0 and not game.is_reloading:
-                self.burst_queue -= 1
-                self.burst_tick = self.current_weapon.burst_interval
-                self._fire_single(game, game._last_mouse_pos)
-
-        # Crosshair spread decay (P4)
-        if self.crosshair_spread > 0:
-            self.crosshair_spread -= 1
-
-    def handle_shoot(self, game, mouse_pos, mouse_held: bool):
+        player.weapon_system = self
+        player.set_weapon_stats(weapon)   # upgrades carry over to the new weapon
+        player.current_ammo = player.max_ammo
+        player.is_reloading = False
+
+    def burst_shot(self, game, player):
+        """
+        Timer callback: drip-feed the next queued burst shot. Waits a frame
+        at a time while the magazine is empty or reloading.
+        """
+        if self.burst_queue == 0 or game.frame < self.burst_next:
+            return   # burst cancelled (weapon swap) or superseded
+        if player.current_ammo > 0 and not player.is_reloading:
+            self.burst_queue -= 1
+            self._fire_single(game, player, player.aim_pos)
+            if self.burst_queue == 0:
+                return
+            delay = self.current_weapon.burst_interval
+        else:
+            delay = 1
+        self.burst_next = game.timers.schedule(delay, "players", "fire_burst", player.id)
+
+    def crosshair_spread(self, frame: int) -> int:
+        """Pixels added to the crosshair gap (P4 feedback)."""
+        return max(0, self.spread_until - frame)
+
+    def handle_shoot(self, game, player, mouse_pos, mouse_held: bool):
         """
         Called every frame the player holds/clicks LMB.
         mouse_held=True means button is being held (continuous fire).
         """
-        # Store mouse pos so burst update can access it
-        game._last_mouse_pos = mouse_pos
+        # Store mouse pos so queued burst shots can access it
+        player.aim_pos = mouse_pos
 
         w = self.current_weapon
-        current_time = pygame.time.get_ticks()
+        current_time = game.now()
 
-        if game.is_reloading or game.current_ammo <= 0:
+        if player.is_reloading or player.current_ammo <= 0:
             return
 
         # Railgun — charge while held, fire on release
@@ -126,29 +118,30 @@ class WeaponSystem:
                 self.charge_held = min(w.charge_frames, self.charge_held + 1)
             else:
                 if self.charge_held >= w.charge_frames:
-                    self._fire_railgun(game, mouse_pos)
+                    self._fire_railgun(game, player, mouse_pos)
                 self.charge_held = 0
             return
 
-        # Fire rate check
-        if current_time - self.last_shot < w.fire_rate * (1000 // 60):
+        # Fire rate check (player.fire_rate includes upgrades)
+        if current_time - self.last_shot < player.fire_rate * (1000 // 60):
             return
 
         # Burst rifle — queue burst on trigger pull (edge-detect via last_shot gap)
         if w.burst_count > 1:
             if self.burst_queue == 0:
                 self.burst_queue = w.burst_count - 1  # first shot fires now
-                self.burst_tick = w.burst_interval
-                self._fire_single(game, mouse_pos)
+                self.burst_next = game.timers.schedule(w.burst_interval, "players",
+                                                       "fire_burst", player.id)
+                self._fire_single(game, player, mouse_pos)
             return
 
         # Shotgun — multi-ray spread
         if w.spread_count > 1:
-            self._fire_shotgun(game, mouse_pos)
+            self._fire_shotgun(game, player, mouse_pos)
             return
 
         # Default: single shot
-        self._fire_single(game, mouse_pos)
+        self._fire_single(game, player, mouse_pos)
 
     # ------------------------------------------------------------------
     # Charge bar (used by HUD)
@@ -164,14 +157,14 @@ class WeaponSystem:
     # Private firing methods
     # ------------------------------------------------------------------
 
-    def _fire_single(self, game, mouse_pos):
+    def _fire_single(self, game, player, mouse_pos):
         """Fire one ray in the cursor direction."""
-        player = game.players[0]
         player_center = player.get_center()
         self._muzzle_flash(game, player_center)
-        game.current_ammo -= 1
-        self.last_shot = pygame.time.get_ticks()
-        self.crosshair_spread = 8   # P4
+        player.current_ammo -= 1
+        self.last_shot = game.now()
+        self._announce_shot(game, player)
+        self.spread_until = game.frame + 8   # P4
 
         dx = mouse_pos[0] - player_center[0]
         dy = mouse_pos[1] - player_center[1]
@@ -179,14 +172,14 @@ class WeaponSystem:
         if hit_enemy:
             game.combat._apply_hit(game, player, hit_enemy)
 
-    def _fire_shotgun(self, game, mouse_pos):
+    def _fire_shotgun(self, game, player, mouse_pos):
         """Fire spread_count rays in a cone."""
-        player = game.players[0]
         player_center = player.get_center()
         self._muzzle_flash(game, player_center, count=12)
-        game.current_ammo -= 1
-        self.last_shot = pygame.time.get_ticks()
-        self.crosshair_spread = 14  # P4 — wider spread for shotgun
+        player.current_ammo -= 1
+        self.last_shot = game.now()
+        self._announce_shot(game, player)
+        self.spread_until = game.frame + 14  # P4 — wider spread for shotgun
 
         dx = mouse_pos[0] - player_center[0]
         dy = mouse_pos[1] - player_center[1]
@@ -205,19 +198,16 @@ class WeaponSystem:
                 hits.add(hit)
                 game.combat._apply_hit(game, player, hit)
 
-    def _fire_railgun(self, game, mouse_pos):
+    def _fire_railgun(self, game, player, mouse_pos):
         """Fully-charged railgun shot — pierces first enemy, massive damage."""
-        player = game.players[0]
         player_center = player.get_center()
         # Dramatic muzzle flash
-        for _ in range(20):
-            game.particles.append(
-                Particle(player_center[0], player_center[1],
-                         (120, 200, 255), velocity_range=5, gravity=False)
-            )
-        game.current_ammo -= 1
-        self.last_shot = pygame.time.get_ticks()
-        self.crosshair_spread = 0   # Railgun is precise
+        game.quality.emit(game.particles, 20, PRIORITY_MUZZLE, player_center[0], player_center[1],
+                          (120, 200, 255), velocity_range=5, gravity=False)
+        player.current_ammo -= 1
+        self.last_shot = game.now()
+        self._announce_shot(game, player)
+        self.spread_until = 0   # Railgun is precise
 
         dx = mouse_pos[0] - player_center[0]
         dy = mouse_pos[1] - player_center[1]
@@ -260,7 +250,11 @@ class WeaponSystem:
 
     @staticmethod
     def _muzzle_flash(game, pos, count=8):
-        for _ in range(count):
-            game.particles.append(
-                Particle(pos[0], pos[1], ACCENT_COLOR, velocity_range=3, gravity=False)
-            )
+        game.quality.emit(game.particles, count, PRIORITY_MUZZLE, pos[0], pos[1], ACCENT_COLOR,
+                          velocity_range=3, gravity=False)
+
+    def _announce_shot(self, game, player):
+        """One ShotFired per shot (not per shotgun ray)."""
+        bus = game.event_bus
+        if ShotFired in bus.active:
+            bus.emit(ShotFired(player.id, self.current_weapon.key))
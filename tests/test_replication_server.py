@@ -0,0 +1,37 @@
+"""
+tests/test_replication_server.py
+net/server.py: per-client priority bookkeeping across snapshots.
+"""
+import pytest
+
+from core.game_manager import GameManager
+from net.server import ClientConnection, ReplicationServer
+
+
+@pytest.fixture
+def server():
+    game = GameManager(seed=1)
+    game.persist_stats = False
+    server = ReplicationServer(game, port=0)
+    yield server
+    server.close()
+
+
+def test_replicate_prunes_priority_of_entities_no_longer_in_the_world(server):
+    client = ClientConnection(("127.0.0.1", 9), server.game.frame)
+    server.clients[client.addr] = client
+    world = server.world_view()
+    stale = range(0x8000, 0x8000 + 2 * len(world) + 100)
+    client.priority.update(dict.fromkeys(stale, 1.0))
+
+    server.replicate()
+
+    assert client.packets_sent == 1
+    assert not set(stale) & set(client.priority)
+    assert set(client.priority) <= set(world)
+
+
+def test_restart_keeps_stats_persistence_off(server):
+    game = server.game
+    game.restart()
+    assert game.persist_stats is False
@@ -0,0 +1,186 @@
+"""
+tests/test_timer_wheel.py
+core/timer_wheel.py: exact firing frames across the level boundaries and
+the overflow list, lazy cancellation through GameManager._fire_timer, and
+agreement with a naive per-frame scheduler on random schedules.
+"""
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from core.game_manager import GameManager
+from core.timer_wheel import LEVEL_BITS, LEVELS, SLOTS, TimerWheel
+from entities.player import Player
+from systems.combat import CombatSystem
+from systems.weapon_system import WeaponSystem
+
+HORIZON = SLOTS ** LEVELS                  # 262144: first delay past the top level
+
+BOUNDARY_DELAYS = sorted({
+    d
+    for level in range(1, LEVELS + 1)
+    for d in (SLOTS ** level - 1, SLOTS ** level, SLOTS ** level + 1)
+} | {1, 2, 2 * HORIZON - 1, 2 * HORIZON, 2 * HORIZON + 5, 3 * HORIZON + 64})
+
+
+def run(wheel, until):
+    """Advance *wheel* frame by frame to *until*; [(frame, entry), ...] in firing order."""
+    fired = []
+    for frame in range(wheel.now + 1, until + 1):
+        fired.extend((frame, entry) for entry in wheel.advance(frame))
+    return fired
+
+
+class NaiveScheduler:
+    """Reference: a dict of due frame -> entries in scheduling order."""
+
+    def __init__(self):
+        self.now = 0
+        self.due = {}
+
+    def schedule(self, delay, entry):
+        self.due.setdefault(self.now + max(1, delay), []).append(entry)
+
+    def advance(self, frame):
+        self.now = frame
+        return self.due.pop(frame, [])
+
+
+# ----------------------------------------------------------------------
+# Exact firing frames
+# ----------------------------------------------------------------------
+
+@pytest.mark.parametrize("start", [0, 1, SLOTS - 1, SLOTS ** 2 - 1, HORIZON - 3])
+def test_fires_on_the_exact_frame_across_level_boundaries(start):
+    wheel = TimerWheel(now=start)
+    for delay in BOUNDARY_DELAYS:
+        assert wheel.schedule(delay, None, f"t{delay}") == start + delay
+
+    fired = run(wheel, start + max(BOUNDARY_DELAYS) + 1)
+
+    assert [(frame, entry[3]) for frame, entry in fired] == [
+        (start + delay, f"t{delay}") for delay in BOUNDARY_DELAYS
+    ]
+    assert wheel.stats() == {"pending": 0, "fired": len(BOUNDARY_DELAYS), "overflow": 0}
+
+
+def test_delays_past_the_top_level_wait_in_overflow():
+    wheel = TimerWheel()
+    wheel.schedule(HORIZON - 1, None, "last_in_wheel")
+    wheel.schedule(HORIZON, None, "first_overflow")
+    assert wheel.stats()["overflow"] == 1
+
+    fired = run(wheel, HORIZON)
+    assert [(frame, entry[3]) for frame, entry in fired] == [
+        (HORIZON - 1, "last_in_wheel"), (HORIZON, "first_overflow"),
+    ]
+
+
+def test_schedule_clamps_to_the_next_frame_and_schedule_at_is_absolute():
+    wheel = TimerWheel(now=100)
+    assert wheel.schedule(0, None, "zero") == 101
+    assert wheel.schedule(-5, None, "negative") == 101
+    assert wheel.schedule_at(100 + (1 << (2 * LEVEL_BITS)), None, "at") == 100 + 4096
+
+    fired = run(wheel, 100 + 4096)
+    assert [(frame, entry[3]) for frame, entry in fired] == [
+        (101, "zero"), (101, "negative"), (4196, "at"),
+    ]
+
+
+# ----------------------------------------------------------------------
+# Lazy cancellation (targets ignore timers they no longer want)
+# ----------------------------------------------------------------------
+
+def _game(wheel, **attrs):
+    return SimpleNamespace(frame=wheel.now, timers=wheel, **attrs)
+
+
+def _dispatch(game, until):
+    """GameManager's timer step: advance, then resolve each due entry."""
+    wheel = game.timers
+    for frame in range(wheel.now + 1, until + 1):
+        game.frame = frame
+        for _, owner, index, action in wheel.advance(frame):
+            GameManager._fire_timer(game, owner, index, action)
+
+
+def test_rescheduled_timer_only_acts_at_its_latest_deadline():
+    wheel = TimerWheel()
+    combat = CombatSystem()
+    game = _game(wheel, combat=combat)
+
+    combat.combo = 1
+    combat.combo_until = wheel.schedule(180, "combat", "end_combo")
+    _dispatch(game, 100)
+    combat.combo = 2                       # a later kill extends the streak
+    combat.combo_until = wheel.schedule(180, "combat", "end_combo")
+
+    _dispatch(game, 180)                   # the first timer fires and is ignored
+    assert combat.combo == 2
+    _dispatch(game, 279)
+    assert combat.combo == 2
+    _dispatch(game, 280)
+    assert combat.combo == 0
+
+
+def test_cancelled_burst_shot_does_not_fire():
+    wheel = TimerWheel()
+    ws = WeaponSystem()
+    shots = []
+    ws._fire_single = lambda game, player, aim: shots.append(game.frame)
+    player = SimpleNamespace(id=0, weapon_system=ws, current_ammo=10, is_reloading=False,
+                             aim_pos=(0, 0))
+    player.fire_burst = lambda game: Player.fire_burst(player, game)
+    game = _game(wheel, players=[player])
+
+    ws.burst_queue = 2
+    ws.burst_next = wheel.schedule(5, "players", "fire_burst", player.id)
+    ws.burst_queue = 0                     # what equip() does on a weapon swap
+
+    _dispatch(game, SLOTS + 10)
+    assert shots == []
+    assert wheel.stats()["pending"] == 0
+
+
+# ----------------------------------------------------------------------
+# Against the reference scheduler
+# ----------------------------------------------------------------------
+
+def _random_delay(rng):
+    bucket = rng.random()
+    if bucket < 0.5:
+        return rng.randint(-1, 2 * SLOTS)
+    if bucket < 0.75:
+        return rng.randint(SLOTS ** 2 - SLOTS, SLOTS ** 2 + SLOTS)
+    if bucket < 0.9:
+        return rng.randint(HORIZON - SLOTS, HORIZON + SLOTS)
+    return rng.choice(BOUNDARY_DELAYS)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_a_naive_scheduler_on_random_schedules(seed):
+    rng = random.Random(seed)
+    start = rng.choice([0, rng.randrange(HORIZON)])
+    wheel = TimerWheel(now=start)
+    naive = NaiveScheduler()
+    naive.now = start
+    last_due = start
+
+    frame = start
+    n = 0
+    while frame < last_due or n < 400:
+        if n < 400 and rng.random() < 0.05:
+            for _ in range(rng.randint(1, 4)):
+                delay = _random_delay(rng)
+                action = f"e{n}"
+                n += 1
+                due = wheel.schedule(delay, None, action)
+                naive.schedule(delay, (due, None, None, action))
+                last_due = max(last_due, due)
+        frame += 1
+        assert list(wheel.advance(frame)) == naive.advance(frame), f"frame {frame}"
+
+    assert naive.due == {}
+    assert wheel.stats()["pending"] == 0
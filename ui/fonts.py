@@ -0,0 +1,147 @@
+"""
+ui/fonts.py
+Shared font, text and sprite caches.
+
+pygame.font.Font(None, size) reloads the bundled TTF on every call, and
+UI code used to do that every frame. get_font() keeps one Font per size;
+render_text() keeps recently rendered strings (labels, counters) as
+surfaces in a bounded LRU; sprite() memoises small procedural surfaces
+(particle dots, glows) keyed by their parameters.
+
+All three are filled by prewarm() on a background thread during the
+splash screen, so the first frames don't pay for them. SDL_ttf isn't
+thread-safe, so every font call goes through _lock; the splash screen
+renders through render_text() too and simply waits its turn per item.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+import pygame
+
+from config.settings import ACCENT_COLOR, SECONDARY_COLOR, TEXT_COLOR, UI_BORDER
+
+TEXT_CACHE_SIZE = 1024
+
+# Every size the UI asks for (hud, menus, upgrade menu, overlay, entities)
+FONT_SIZES = (18, 20, 24, 26, 28, 32, 36, 48, 52, 64, 72, 96)
+
+# Labels drawn every frame or on the first menus: (text, size, color)
+STATIC_LABELS = (
+    ("PULSE ARENA", 48, TEXT_COLOR),
+    ("HP", 24, UI_BORDER),
+    ("SCORE", 24, UI_BORDER),
+    ("ELIMINATIONS", 24, UI_BORDER),
+    ("RELOADING", 24, SECONDARY_COLOR),
+    ("CHARGE", 24, (120, 200, 255)),
+    ("SPEED+", 24, (100, 200, 255)),
+    ("SHIELD", 24, (200, 100, 255)),
+    ("WASD: Move | LMB: Shoot (Hitscan) | R: Reload", 24, UI_BORDER),
+    ("SUP", 18, (100, 180, 255)),
+    ("AIM", 18, (255, 200, 50)),
+    ("GAME OVER", 96, ACCENT_COLOR),
+    ("Press SPACE to Restart", 36, TEXT_COLOR),
+)
+
+_lock = threading.RLock()
+_fonts: dict = {}
+_text: OrderedDict = OrderedDict()
+_sprites: dict = {}
+
+
+def get_font(size: int) -> pygame.font.Font:
+    font = _fonts.get(size)
+    if font is None:
+        with _lock:
+            font = _fonts.get(size)
+            if font is None:
+                font = _fonts[size] = pygame.font.Font(None, size)
+    return font
+
+
+def render_text(text: str, size: int, color) -> pygame.Surface:
+    """
+    Antialiased *text*, cached. The surface is shared: callers that
+    set_alpha() it must do so before every blit.
+    """
+    key = (text, size, color)
+    with _lock:
+        surf = _text.get(key)
+        if surf is not None:
+            _text.move_to_end(key)
+            return surf
+        surf = _text[key] = get_font(size).render(text, True, color)
+        if len(_text) > TEXT_CACHE_SIZE:
+            _text.popitem(last=False)
+    return surf
+
+
+def sprite(key, build, *args):
+    """Memoised surface for *key*; *build(*args)* makes it on first use."""
+    surf = _sprites.get(key)
+    if surf is None:
+        surf = _sprites[key] = build(*args)
+    return surf
+
+
+def cache_stats() -> dict:
+    return {"fonts": len(_fonts), "texts": len(_text), "sprites": len(_sprites)}
+
+
+# ----------------------------------------------------------------------
+# Prewarm
+# ----------------------------------------------------------------------
+
+def prewarm(sprite_jobs=(), progress=None):
+    """
+    Load every font size, render the static labels and build *sprite_jobs*
+    ((key, build, args) triples, see sprite()). *progress(done, total)* is called as it goes.
+    Safe to run on a worker thread once pygame.font is initialised.
+    """
+    sprite_jobs = list(sprite_jobs)
+    total = len(FONT_SIZES) + len(STATIC_LABELS) + len(sprite_jobs)
+    done = 0
+    for size in FONT_SIZES:
+        get_font(size)
+        done += 1
+        if progress:
+            progress(done, total)
+    for text, size, color in STATIC_LABELS:
+        render_text(text, size, color)
+        done += 1
+        if progress:
+            progress(done, total)
+    for key, build, build_args in sprite_jobs:
+        sprite(key, build, *build_args)
+        done += 1
+        if progress:
+            progress(done, total)
+
+
+def start_prewarm(sprite_jobs=()) -> "Prewarm":
+    job = Prewarm(sprite_jobs)
+    job.start()
+    return job
+
+
+class Prewarm(threading.Thread):
+    """Background prewarm with a progress fraction for the splash screen."""
+
+    def __init__(self, sprite_jobs=()):
+        super().__init__(name="ui-prewarm", daemon=True)
+        self._sprite_jobs = sprite_jobs
+        self.fraction = 0.0
+        self.elapsed_ms = 0.0
+        self.error = None
+
+    def run(self):
+        t0 = time.perf_counter()
+        try:
+            prewarm(self._sprite_jobs, self._progress)
+        except Exception as e:   # a failed prewarm only costs first-frame time
+            self.error = e
+        self.elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        self.fraction = 1.0
+
+    def _progress(self, done, total):
+        self.fraction = done / total
@@ -11,6 +11,7 @@ from config.settings import (
     UI_BORDER,
     TEXT_COLOR,
 )
+from ui.fonts import get_font, render_text
 
 
 def draw_rounded_rect(surface, color, rect, radius=10, border=0, border_color=None):
@@ -27,10 +28,10 @@ def draw_rounded_rect(surface, color, rect, radius=10, border=0, border_color=No
 
 
 def draw_ui(screen, game):
-    font_large = pygame.font.Font(None, 72)
-    font_medium = pygame.font.Font(None, 48)
-    font_small = pygame.font.Font(None, 32)
-    font_tiny = pygame.font.Font(None, 24)
+    font_large = get_font(72)
+    font_medium = get_font(48)
+    font_small = get_font(32)
+    font_tiny = get_font(24)
 
     player = game.players[0]
 
@@ -45,7 +46,7 @@ def draw_ui(screen, game):
         border_color=ACCENT_COLOR,
     )
 
-    title = font_medium.render("PULSE ARENA", True, TEXT_COLOR)
+    title = render_text("PULSE ARENA", 48, TEXT_COLOR)
     screen.blit(title, (60, 32))
     pygame.draw.line(screen, SECONDARY_COLOR, (50, 55), (200, 55), 3)
 
@@ -81,18 +82,18 @@ def draw_ui(screen, game):
     health_text = font_small.render(f"{player.health}", True, TEXT_COLOR)
     screen.blit(health_text, (x + bar_width + 20, y))
 
-    hp_label = font_tiny.render("HP", True, UI_BORDER)
+    hp_label = render_text("HP", 24, UI_BORDER)
     screen.blit(hp_label, (x + 5, y + 5))
 
     powerup_y = y - 40
     if player.damage_boost > 1.0:
-        boost_text = font_tiny.render(f"DMG x{player.damage_boost}", True, (255, 100, 100))
+        boost_text = font_tiny.render(f"DMG x{player.damage_boost:.3g}", True, (255, 100, 100))
         screen.blit(boost_text, (x, powerup_y))
-    if player.speed_boost_timer > 0:
-        speed_text = font_tiny.render("SPEED+", True, (100, 200, 255))
+    if player.speed_boost_until > game.frame:
+        speed_text = render_text("SPEED+", 24, (100, 200, 255))
         screen.blit(speed_text, (x + 120, powerup_y))
     if player.shield_active:
-        shield_text = font_tiny.render("SHIELD", True, (200, 100, 255))
+        shield_text = render_text("SHIELD", 24, (200, 100, 255))
         screen.blit(shield_text, (x + 220, powerup_y))
 
     x = WIDTH - 250
@@ -108,20 +109,20 @@ def draw_ui(screen, game):
         border_color=UI_BORDER,
     )
 
-    ammo_color = ACCENT_COLOR if game.current_ammo < 5 else TEXT_COLOR
-    ammo_text = font_large.render(f"{game.current_ammo}", True, ammo_color)
+    ammo_color = ACCENT_COLOR if player.current_ammo < 5 else TEXT_COLOR
+    ammo_text = font_large.render(f"{player.current_ammo}", True, ammo_color)
     screen.blit(ammo_text, (x, y))
 
-    max_text = font_small.render(f"/{game.max_ammo}", True, UI_BORDER)
+    max_text = font_small.render(f"/{player.max_ammo}", True, UI_BORDER)
     screen.blit(max_text, (x + 80, y + 30))
 
     # Weapon name
-    weapon_name = game.weapon_system.current_weapon.name
+    weapon_name = player.weapon_system.current_weapon.name
     weapon_label = font_tiny.render(weapon_name.upper(), True, SECONDARY_COLOR)
     screen.blit(weapon_label, (x, y - 22))
 
     # Railgun charge bar
-    charge_pct = game.weapon_system.get_charge_pct()
+    charge_pct = player.weapon_system.get_charge_pct()
     if charge_pct > 0:
         charge_bar_w = 180
         charge_bar_h = 8
@@ -134,12 +135,12 @@ def draw_ui(screen, game):
         pygame.draw.rect(screen, charge_color,
                          (charge_x, charge_y, fill, charge_bar_h),
                          border_radius=4)
-        charge_label = font_tiny.render("CHARGE", True, (120, 200, 255))
+        charge_label = render_text("CHARGE", 24, (120, 200, 255))
         screen.blit(charge_label, (charge_x + 50, charge_y - 18))
 
-    if game.is_reloading:
-        current_time = pygame.time.get_ticks()
-        reload_progress = min(1.0, (current_time - game.last_reload) / game.reload_time)
+    if player.is_reloading:
+        current_time = game.now()
+        reload_progress = min(1.0, (current_time - player.last_reload) / player.reload_time)
 
         reload_bar_width = 180
         reload_bar_height = 8
@@ -160,7 +161,7 @@ def draw_ui(screen, game):
             border_radius=4,
         )
 
-        reload_text = font_tiny.render("RELOADING", True, SECONDARY_COLOR)
+        reload_text = render_text("RELOADING", 24, SECONDARY_COLOR)
         screen.blit(reload_text, (reload_x + 50, reload_y - 20))
 
     x = WIDTH - 250
@@ -176,13 +177,13 @@ def draw_ui(screen, game):
         border_color=UI_BORDER,
     )
 
-    score_label = font_tiny.render("SCORE", True, UI_BORDER)
+    score_label = render_text("SCORE", 24, UI_BORDER)
     screen.blit(score_label, (x, y))
 
     score_text = font_medium.render(f"{game.score}", True, SECONDARY_COLOR)
     screen.blit(score_text, (x, y + 20))
 
-    kills_label = font_tiny.render("ELIMINATIONS", True, UI_BORDER)
+    kills_label = render_text("ELIMINATIONS", 24, UI_BORDER)
     screen.blit(kills_label, (x, y + 70))
 
     kills_text = font_small.render(f"{game.kills}", True, TEXT_COLOR)
@@ -202,10 +203,13 @@ def draw_ui(screen, game):
     enemy_count_text = font_tiny.render(f"Enemies: {len(game.enemies)}", True, UI_BORDER)
     screen.blit(enemy_count_text, (50, 100))
 
-    controls_text = font_tiny.render(
-        "WASD: Move | LMB: Shoot (Hitscan) | R: Reload",
-        True,
-        UI_BORDER,
-    )
+    # Co-op teammates: one compact line each under the score panel
+    for i, mate in enumerate(game.players[1:]):
+        status = (f"P{mate.id + 1}  HP {max(0, mate.health)}  "
+                  f"{mate.current_ammo}/{mate.max_ammo}" if mate.is_alive() else f"P{mate.id + 1}  DOWN")
+        mate_text = font_tiny.render(status, True, mate.color if mate.is_alive() else UI_BORDER)
+        screen.blit(mate_text, (WIDTH - 250, 190 + i * 22))
+
+    controls_text = render_text("WASD: Move | LMB: Shoot (Hitscan) | R: Reload", 24, UI_BORDER)
     screen.blit(controls_text, (50, HEIGHT - 30))
 
@@ -3,15 +3,16 @@ import math
 import pygame
 
 from config.settings import WIDTH, HEIGHT, ACCENT_COLOR, UI_BG, UI_BORDER, TEXT_COLOR, SECONDARY_COLOR
+from ui.fonts import get_font
 from ui.hud import draw_rounded_rect
 
 
 def draw_game_over(screen, game):
-    font_huge   = pygame.font.Font(None, 96)
-    font_large  = pygame.font.Font(None, 64)
-    font_medium = pygame.font.Font(None, 48)
-    font_small  = pygame.font.Font(None, 36)
-    font_tiny   = pygame.font.Font(None, 26)
+    font_huge   = get_font(96)
+    font_large  = get_font(64)
+    font_medium = get_font(48)
+    font_small  = get_font(36)
+    font_tiny   = get_font(26)
 
     overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
     overlay.fill((0, 0, 0, 180))
@@ -68,6 +69,9 @@ def draw_game_over(screen, game):
         screen.blit(val_surf,  val_surf.get_rect(centerx=col_x + 35, y=pb_y + 45))
         screen.blit(lbl_surf, lbl_surf.get_rect(centerx=col_x + 35, y=pb_y + 80))
 
+    # ── Run history (filled in by the history worker) ────────────────
+    _draw_history(screen, game.stats.boards, font_tiny, panel_y)
+
     # ── Restart prompt ───────────────────────────────────────────────
     restart_text = font_small.render("Press SPACE to Restart", True, TEXT_COLOR)
     restart_rect = restart_text.get_rect(center=(WIDTH // 2, HEIGHT - 60))
@@ -77,3 +81,36 @@ def draw_game_over(screen, game):
     restart_surf.fill((255, 255, 255, alpha))
     restart_text.blit(restart_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
     screen.blit(restart_text, restart_rect)
+
+
+def _draw_history(screen, boards, font, top):
+    """Best score per weapon and last-100-run averages, once the queries land."""
+    by_weapon = boards.get("by_weapon")
+    trend = boards.get("trend")
+    if not (by_weapon and by_weapon.ready and trend and trend.ready):
+        return
+
+    # (left text, right text, color)
+    rows = [("BEST BY WEAPON", "", UI_BORDER)]
+    for row in by_weapon.rows[:5]:
+        name = (row["weapon"] or "unknown").replace("_", " ").title()
+        rows.append((name, f"{row['best_score']}  (wave {row['best_wave']})", SECONDARY_COLOR))
+    if trend.rows and trend.rows[0]["runs"]:
+        t = trend.rows[0]
+        rows.append(("", "", TEXT_COLOR))
+        rows.append((f"LAST {t['runs']} RUNS", "", UI_BORDER))
+        rows.append(("Avg wave", f"{t['avg_wave']:.1f}", TEXT_COLOR))
+        rows.append(("Avg score", f"{t['avg_score']:.0f}", TEXT_COLOR))
+
+    w, x = 300, WIDTH - 330
+    h = 20 + 26 * len(rows)
+    draw_rounded_rect(screen, (15, 18, 30), (x, top, w, h), radius=10)
+    draw_rounded_rect(screen, UI_BORDER, (x, top, w, h), radius=10, border=1, border_color=UI_BORDER)
+    y = top + 12
+    for left, right, color in rows:
+        if left:
+            screen.blit(font.render(left, True, color), (x + 16, y))
+        if right:
+            surf = font.render(right, True, color)
+            screen.blit(surf, surf.get_rect(right=x + w - 16, y=y))
+        y += 26
@@ -0,0 +1,97 @@
+"""
+ui/profiler_overlay.py
+Toggleable (F3) debug panel: rolling ms per profiler scope + entity counts
+(live, and culled last frame).
+Only drawn while the profiler is enabled.
+"""
+import pygame
+
+from config.settings import FPS, HEIGHT, UI_BORDER, TEXT_COLOR, SECONDARY_COLOR, ACCENT_COLOR
+from ui.fonts import get_font
+
+ROW_H = 16
+PANEL_W = 260
+PANEL_X = 10
+
+
+
+def draw_profiler_overlay(screen, game):
+    """Draw the profiler panel in the top-left corner (no-op if disabled)."""
+    profiler = game.profiler
+    if not profiler.enabled:
+        return
+
+    font = get_font(20)
+    budget_ms = 1000.0 / FPS
+    stats = profiler.stats()
+    # Allocation mode adds a transient-kB-per-frame column
+    alloc_kb = profiler.alloc.avg_peak_kb() if profiler.alloc is not None else None
+    panel_w = PANEL_W + 60 if alloc_kb is not None else PANEL_W
+
+    # (label, live count, core.culling category)
+    counts = [
+        ("enemies", len(game.enemies), "enemies"),
+        ("bullets", len(game.enemy_bullets), "bullets"),
+        ("particles", len(game.particles), "particles"),
+        ("dmg numbers", len(game.damage_numbers), "damage_numbers"),
+        ("powerups", len(game.powerups), "powerups"),
+    ]
+    culled = game.culling.culled
+
+    pct = game.frame_stats.percentiles(FPS * 10)
+    latency = game.frame_stats.latency_percentiles(FPS * 10)
+    rows = len(stats) + len(counts) + 8
+    panel_h = rows * ROW_H + 10
+    panel_y = min(130, HEIGHT - panel_h - 10)
+
+    panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+    panel.fill((10, 12, 20, 200))
+    screen.blit(panel, (PANEL_X, panel_y))
+    pygame.draw.rect(screen, UI_BORDER, (PANEL_X, panel_y, panel_w, panel_h), 1)
+
+    x = PANEL_X + 8
+    y = panel_y + 6
+    header = font.render(f"{'scope':<18}  avg ms   max ms", True, SECONDARY_COLOR)
+    screen.blit(header, (x, y))
+    if alloc_kb is not None:
+        screen.blit(font.render("kB/f", True, SECONDARY_COLOR), (x + 255, y))
+    y += ROW_H
+
+    for name, (avg_ms, max_ms) in stats.items():
+        if name == "frame":
+            color = ACCENT_COLOR if avg_ms > budget_ms else SECONDARY_COLOR
+        else:
+            color = ACCENT_COLOR if max_ms > budget_ms else TEXT_COLOR
+        # Indent render sub-passes under the render total
+        label = "  " + name[len("render."):] if name.startswith("render.") else name
+        screen.blit(font.render(label, True, color), (x, y))
+        screen.blit(font.render(f"{avg_ms:6.2f}", True, color), (x + 140, y))
+        screen.blit(font.render(f"{max_ms:6.2f}", True, color), (x + 195, y))
+        if alloc_kb is not None and name in alloc_kb:
+            screen.blit(font.render(f"{alloc_kb[name]:6.1f}", True, color), (x + 250, y))
+        y += ROW_H
+
+    y += ROW_H
+    pct_text = (f"10s  p50 {pct['p50']:.1f}  p95 {pct['p95']:.1f}  "
+                f"p99 {pct['p99']:.1f}  max {pct['max']:.1f}")
+    screen.blit(font.render(pct_text, True, TEXT_COLOR), (x, y))
+    y += ROW_H
+    latency_text = f"input->present  p50 {latency['p50']:.1f}  p99 {latency['p99']:.1f}"
+    screen.blit(font.render(latency_text, True, TEXT_COLOR), (x, y))
+    y += ROW_H
+    over = game.frame_stats.over_budget
+    screen.blit(font.render(f"over budget: {over} frames", True, UI_BORDER), (x, y))
+    y += ROW_H
+    quality = game.quality
+    quality_text = (f"quality: {quality.preset} ({quality.tier.name})  "
+                    f"culled {quality.culled}")
+    screen.blit(font.render(quality_text, True, UI_BORDER), (x, y))
+    y += ROW_H * 2
+
+    screen.blit(font.render(f"{'entities':<18}  live     culled", True, SECONDARY_COLOR), (x, y))
+    y += ROW_H
+    for label, value, category in counts:
+        screen.blit(font.render(label, True, UI_BORDER), (x, y))
+        screen.blit(font.render(str(value), True, TEXT_COLOR), (x + 140, y))
+        screen.blit(font.render(str(culled[category]), True, UI_BORDER), (x + 195, y))
+        y += ROW_H
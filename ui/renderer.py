@@ -0,0 +1,122 @@
+"""
+ui/renderer.py
+Draws one full frame (background, world, HUD, overlays) for a GameManager.
+Kept out of main.py so headless tools (benchmarks, stress tests) render
+exactly what the game loop renders.
+
+Render scale: below 1.0 the world (background, entities, effects) is drawn
+into an offscreen layer at that fraction of the screen's resolution and
+scaled up onto the screen in one pass, so fill-heavy effects (support
+auras, sniper lasers, the damage indicator: full-layer alpha blits) cost
+scale² as much. The HUD, crosshair and menus are drawn on top at native
+resolution and stay sharp. Entity draw() methods take the scale and map
+arena coordinates onto the layer themselves.
+"""
+import random
+
+import pygame
+
+from config.settings import WIDTH, HEIGHT, BG_COLOR, STATE_GAME_OVER, STATE_UPGRADE
+from core.culling import bullet_visible, enemy_visible, powerup_visible
+from ui.crosshair import draw_crosshair
+from ui.hud import draw_ui
+from ui.menus import draw_game_over
+from ui.upgrade_menu import draw_upgrade_menu
+
+# Cosmetic randomness uses its own RNG so rendering never perturbs the
+# seeded simulation RNG (replays, lockstep, headless runs stay in sync)
+_fx_rng = random.Random()
+
+# Allowed render scales (main.py --render-scale)
+MIN_RENDER_SCALE = 0.25
+
+_layer: pygame.Surface | None = None
+
+
+def world_layer(screen, scale: float) -> pygame.Surface:
+    """The offscreen world surface for *scale*, in *screen*'s pixel format (reused)."""
+    global _layer
+    size = (max(1, round(screen.get_width() * scale)), max(1, round(screen.get_height() * scale)))
+    if _layer is None or _layer.get_size() != size:
+        _layer = pygame.Surface(size, 0, screen)
+    return _layer
+
+
+def render_frame(screen, game, mouse_pos, render_scale: float = 1.0):
+    """Draw the complete frame for *game* onto *screen* (no flip)."""
+    prof = game.profiler
+    scale = render_scale
+    world = screen if scale == 1.0 else world_layer(screen, scale)
+
+    with prof.scope("render.background"):
+        world.fill(BG_COLOR)
+
+        # Screen flash effect
+        flash_left = game.combat.flash_until - game.frame
+        if flash_left > 0:
+            flash_surf = pygame.Surface(world.get_size(), pygame.SRCALPHA)
+            alpha = int(30 * (flash_left / 5))
+            flash_surf.fill((255, 255, 255, alpha))
+            world.blit(flash_surf, (0, 0))
+
+        # Grid background
+        grid_spacing = 50
+        grid_color = (25, 30, 40)
+        width, height = world.get_size()
+        for x in range(0, WIDTH, grid_spacing):
+            pygame.draw.line(world, grid_color, (x * scale, 0), (x * scale, height), 1)
+        for y in range(0, HEIGHT, grid_spacing):
+            pygame.draw.line(world, grid_color, (0, y * scale), (width, y * scale), 1)
+
+        # Screen shake offset
+        shake_offset = (0, 0)
+        if game.screen_shake > 0:
+            shake_offset = (_fx_rng.randint(-game.screen_shake, game.screen_shake),
+                            _fx_rng.randint(-game.screen_shake, game.screen_shake))
+            world.scroll(round(shake_offset[0] * scale), round(shake_offset[1] * scale))
+
+    # Draw game objects (only what overlaps the viewport, see core/culling.py)
+    tier = game.quality.tier
+    culling = game.culling
+    with prof.scope("render.players"):
+        for player in game.players:
+            if player.is_alive():
+                player.draw(world, game.particles, game.frame, tier.glows, scale)
+
+    with prof.scope("render.enemies"):
+        auras = tier.auras
+        for enemy in culling.visible("enemies", game.enemies, lambda e: enemy_visible(e, auras)):
+            enemy.draw(world, auras, scale)
+
+    with prof.scope("render.bullets"):
+        for bullet in culling.visible("bullets", game.enemy_bullets, bullet_visible):
+            bullet.draw(world, scale)
+
+    with prof.scope("render.powerups"):
+        for powerup in culling.visible("powerups", game.powerups, powerup_visible):
+            powerup.draw(world, game.frame, tier.glows, scale)
+
+    # Cosmetic entities were retired on leaving the screen (GameManager)
+    with prof.scope("render.particles"):
+        for particle in culling.drawn_all("particles", game.particles):
+            particle.draw(world, scale)
+
+    with prof.scope("render.damage_numbers"):
+        for dn in culling.drawn_all("damage_numbers", game.damage_numbers):
+            dn.draw(world, scale)
+
+    if world is not screen:
+        with prof.scope("render.upscale"):
+            pygame.transform.scale(world, screen.get_size(), screen)
+
+    # Draw UI
+    with prof.scope("render.hud"):
+        draw_ui(screen, game)
+        draw_crosshair(screen, mouse_pos, game.combat.hitmarker_until > game.frame,
+                       game.players[0].weapon_system.crosshair_spread(game.frame))
+
+    with prof.scope("render.menus"):
+        if game.state == STATE_GAME_OVER:
+            draw_game_over(screen, game)
+        elif game.state == STATE_UPGRADE and game.pending_upgrades:
+            draw_upgrade_menu(screen, game.pending_upgrades, game.upgrade_hovered)
@@ -10,6 +10,8 @@ from config.settings import (
     WIDTH, HEIGHT,
     UI_BG, UI_BORDER, TEXT_COLOR, SECONDARY_COLOR, ACCENT_COLOR,
 )
+from core.data_loader import get_upgrade
+from ui.fonts import get_font
 
 
 CARD_W = 280
@@ -29,10 +31,10 @@ def draw_rounded_rect(surface, color, rect, radius=8, border=0, border_color=Non
         pygame.draw.rect(surface, border_color, rect, border, border_radius=radius)
 
 
-def draw_upgrade_menu(screen, upgrades: list[dict], hovered: int = -1):
+def draw_upgrade_menu(screen, upgrades: list[str], hovered: int = -1):
     """
     Render the upgrade selection overlay.
-    upgrades: list of 3 upgrade dicts from upgrade_system.UPGRADE_POOL
+    upgrades: list of 3 upgrade keys from data/upgrades.json
     hovered:  index of currently highlighted card (-1 = none)
     """
     # Dark translucent overlay
@@ -40,10 +42,10 @@ def draw_upgrade_menu(screen, upgrades: list[dict], hovered: int = -1):
     overlay.fill((10, 10, 20, 210))
     screen.blit(overlay, (0, 0))
 
-    font_title  = pygame.font.Font(None, 52)
-    font_header = pygame.font.Font(None, 36)
-    font_body   = pygame.font.Font(None, 24)
-    font_hint   = pygame.font.Font(None, 28)
+    font_title  = get_font(52)
+    font_header = get_font(36)
+    font_body   = get_font(24)
+    font_hint   = get_font(28)
 
     # Title
     title = font_title.render("WAVE COMPLETE — CHOOSE AN UPGRADE", True, SECONDARY_COLOR)
@@ -56,7 +58,8 @@ def draw_upgrade_menu(screen, upgrades: list[dict], hovered: int = -1):
     start_x = (WIDTH - total_w) // 2
     card_y = HEIGHT // 4 + 10
 
-    for i, upgrade in enumerate(upgrades):
+    for i, key in enumerate(upgrades):
+        upgrade = get_upgrade(key)
         cx = start_x + i * (CARD_W + CARD_GAP)
 
         # Card border glow on hover
@@ -75,7 +78,7 @@ def draw_upgrade_menu(screen, upgrades: list[dict], hovered: int = -1):
         screen.blit(hint_surf, (cx + 12, card_y + 12))
 
         # Upgrade name
-        name_surf = font_header.render(upgrade["name"], True, TEXT_COLOR)
+        name_surf = font_header.render(upgrade.name, True, TEXT_COLOR)
         screen.blit(name_surf, name_surf.get_rect(
             center=(cx + CARD_W // 2, card_y + 90)))
 
@@ -84,7 +87,7 @@ def draw_upgrade_menu(screen, upgrades: list[dict], hovered: int = -1):
                          (cx + 20, card_y + 115), (cx + CARD_W - 20, card_y + 115), 1)
 
         # Description
-        desc_surf = font_body.render(upgrade["description"], True, UI_BORDER)
+        desc_surf = font_body.render(upgrade.description, True, UI_BORDER)
         screen.blit(desc_surf, desc_surf.get_rect(
             center=(cx + CARD_W // 2, card_y + 145)))
 